@@ -3,38 +3,56 @@
 
 import asyncio
 from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 import typer
 
 from src.config import Config
-from src.orchestrator import NewsOrchestrator
-from src.utils.logging import create_console, log_metrics
+
+# Heavy modules (anthropic, rich, the agent pipeline) are imported inside the
+# functions that need them, so --help and --dry-run start fast.
+if TYPE_CHECKING:
+    from src.utils.reporter import Reporter
 
 app = typer.Typer()
 
 
-async def generate_news_webpage(config: Config) -> str:
+async def generate_news_webpage(
+    config: Config,
+    reporter: "Reporter",
+    refresh: bool = False,
+    delta: bool = False,
+    force: bool = False,
+) -> str:
     """Generate news webpage using multi-agent pipeline."""
-    console = create_console()
+    from src.orchestrator import NewsOrchestrator
 
-    console.print("[bold cyan]News.sys Multi-Agent Generator[/bold cyan]")
-    console.print(f"[dim]Date: {datetime.now().strftime('%B %d, %Y')}[/dim]")
-    console.print(
-        "[dim]Using Opus for curation, Sonnet for gathering & building[/dim]\n"
+    reporter.print("[bold cyan]News.sys Multi-Agent Generator[/bold cyan]")
+    reporter.print(f"[dim]Date: {datetime.now().strftime('%B %d, %Y')}[/dim]")
+    reporter.print(
+        f"[dim]Models: gather={config.gatherer_model}, "
+        f"curate={config.curator_model}, build={config.builder_model}[/dim]\n"
     )
 
     # Create orchestrator
-    orchestrator = NewsOrchestrator(config, console)
+    orchestrator = NewsOrchestrator(config, reporter)
 
     # Run pipeline
     try:
-        html_content = await orchestrator.run()
+        html_content = await orchestrator.run(
+            refresh=refresh, delta=delta, force=force
+        )
 
         # Final summary
-        console.print("\n[bold green]✓ Generation Complete![/bold green]")
+        reporter.print("\n[bold green]✓ Generation Complete![/bold green]")
 
         # Metrics
         state = orchestrator.state
+        if state.reused_edition:
+            reporter.metrics({"Reused edition": state.reused_edition})
+            return html_content
+
         total_agents = len(state.agent_results)
         metrics = {
             "Total articles gathered": state.total_articles_gathered,
@@ -42,27 +60,258 @@ async def generate_news_webpage(config: Config) -> str:
             "Failed agents": f"{state.failed_agents}/{total_agents}",
             "Articles selected": len(state.selected_articles),
             "HTML size": f"{len(html_content)} chars",
+            "Nudge seed": state.nudge_seed,
         }
-        log_metrics(console, metrics)
+        if state.pooled_articles:
+            new_count = state.total_articles_gathered - len(state.pooled_articles)
+            metrics["Delta"] = (
+                f"{new_count} new on top of {len(state.pooled_articles)} pooled"
+            )
+        if state.refreshed_from_shell:
+            metrics["Refresh"] = "refilled today's design shell (no builder call)"
+        for decision in state.routing_decisions:
+            if decision.fell_back:
+                metrics[f"Routing ({decision.stage})"] = (
+                    f"{decision.chosen_model} — {decision.reason}"
+                )
+        for name, outcome in state.editions.items():
+            metrics[f"Edition {name}"] = outcome
+        for i, degradation in enumerate(state.degradations, 1):
+            metrics[f"Degradation {i}"] = degradation
+        if state.hedge_stats.issued:
+            metrics["Hedged requests"] = (
+                f"{state.hedge_stats.issued} sent, {state.hedge_stats.won} won"
+            )
+        reporter.metrics(metrics)
 
         return html_content
 
     except Exception as e:
-        console.print(f"\n[error]Pipeline failed: {e}[/error]")
+        reporter.error(f"\nPipeline failed: {e}")
         raise
 
 
+def render_dry_run(config: Config, reporter: "Reporter") -> str:
+    """Render every agent prompt without touching the network."""
+    from src.orchestrator import NewsOrchestrator
+
+    orchestrator = NewsOrchestrator(config, reporter, dry_run=True)
+    prompts = orchestrator.render_prompts()
+
+    sections = []
+    for agent_name, prompt in prompts.items():
+        sections.append(f"{'=' * 80}\n{agent_name}\n{'=' * 80}\n{prompt}")
+    return "\n\n".join(sections)
+
+
+def run_backfill(
+    config: Config, reporter: "Reporter", dates: list[str], regather: bool = False
+):
+    """Regenerate past editions through the Message Batches API."""
+    from src.orchestrator import NewsOrchestrator
+
+    reporter.print(f"[bold cyan]Backfilling {len(dates)} editions (batch mode)[/bold cyan]")
+    orchestrator = NewsOrchestrator(config, reporter)
+    outcomes = orchestrator.backfill(dates, regather=regather)
+    reporter.metrics(outcomes)
+    reporter.print(f"[dim]Editions saved under {config.state_dir / 'editions'}[/dim]")
+
+
+def print_startup_report(reporter: "Reporter"):
+    """Print cold import times for the CLI and its heavy dependencies."""
+    from src.utils.startup import STARTUP_BUDGET_MS, startup_report
+
+    reporter.print("[bold]Cold import times:[/bold]")
+    for module, ms in startup_report().items():
+        timing = f"{ms:.1f} ms" if ms is not None else "import failed"
+        reporter.print(f"  [metric]{module}:[/metric] {timing}")
+    reporter.print(f"[dim]Entry point budget: {STARTUP_BUDGET_MS:.0f} ms[/dim]")
+
+
+def _format_metric(value: float) -> str:
+    return f"{value:,.0f}" if abs(value) >= 100 else f"{value:.2f}"
+
+
+def print_metrics_report(
+    config: Config, reporter: "Reporter", metric: Optional[str], window: int
+) -> bool:
+    """
+    Print recent metric percentiles and the latest run against its baseline,
+    or one metric's daily trend. Returns whether any regression was flagged.
+    """
+    from src.utils.metrics_store import MetricsStore
+
+    store = MetricsStore(config.state_dir / "metrics.db")
+    modes = store.modes()
+    if not modes:
+        reporter.print(f"[dim]No runs recorded in {store.path}[/dim]")
+        return False
+
+    regressed = False
+    for mode in modes:
+        if metric:
+            reporter.print(f"[bold]{metric} by day ({mode} runs):[/bold]")
+            for day in store.daily_trend(metric, mode):
+                reporter.print(
+                    f"  [metric]{day['date']}:[/metric] "
+                    f"p50 {_format_metric(day['p50'])}, "
+                    f"p95 {_format_metric(day['p95'])} ({day['runs']} runs)"
+                )
+            continue
+
+        reporter.print(
+            f"[bold]{mode.capitalize()} runs "
+            f"(latest against the {window} before):[/bold]"
+        )
+        for summary in store.summarize(mode, window):
+            line = (
+                f"  [metric]{summary['name']}:[/metric] "
+                f"p50 {_format_metric(summary['p50'])}, "
+                f"p95 {_format_metric(summary['p95'])}, "
+                f"latest {_format_metric(summary['latest'])}"
+            )
+            if summary["change"] is not None:
+                line += f" ({summary['change']:.2f}x baseline)"
+            if summary["regressed"]:
+                regressed = True
+                reporter.warn(f"{line} - REGRESSION")
+            else:
+                reporter.print(line)
+    return regressed
+
+
 @app.command()
-def main():
+def main(
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Render prompts only; make no API calls."
+    ),
+    startup_report: bool = typer.Option(
+        False, "--startup-report", help="Report cold import times and exit."
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Refill today's design with fresh stories instead of redesigning.",
+    ),
+    delta: bool = typer.Option(
+        False,
+        "--delta",
+        help="Only gather stories newer than today's earlier runs.",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Generate today's edition again even if it's already published.",
+    ),
+    serve: bool = typer.Option(
+        False,
+        "--serve",
+        help="Run as a service: scheduled editions served over local HTTP.",
+    ),
+    interval: float = typer.Option(
+        60.0, "--interval", help="Minutes between scheduled runs (with --serve)."
+    ),
+    host: str = typer.Option("127.0.0.1", "--host", help="Address to serve on."),
+    port: int = typer.Option(8080, "--port", help="Port to serve on."),
+    backfill: Optional[str] = typer.Option(
+        None,
+        "--backfill",
+        help="Regenerate past editions (comma-separated YYYY-MM-DD) via Message Batches.",
+    ),
+    regather: bool = typer.Option(
+        False, "--regather", help="With --backfill, gather again even if pooled."
+    ),
+    trace: Optional[Path] = typer.Option(
+        None, "--trace", help="Write a Chrome trace (chrome://tracing) of the run."
+    ),
+    record: Optional[Path] = typer.Option(
+        None, "--record", help="Record every API call to a cassette (.jsonl.gz)."
+    ),
+    replay: Optional[Path] = typer.Option(
+        None, "--replay", help="Replay API calls from a cassette; runs offline."
+    ),
+    replay_speed: float = typer.Option(
+        1.0, "--replay-speed", help="Replay pace (2 = twice as fast, 0 = no delays)."
+    ),
+    feeds_dir: Optional[Path] = typer.Option(
+        None,
+        "--feeds-dir",
+        help="Also write the text-only page and Atom/JSON feeds to this directory.",
+    ),
+    editions: Optional[Path] = typer.Option(
+        None,
+        "--editions",
+        help="JSON list of extra editions to build from the same gather and curation.",
+    ),
+    metrics: bool = typer.Option(
+        False,
+        "--metrics",
+        help="Report run metric percentiles and regressions (exit 1 on a regression).",
+    ),
+    metric: Optional[str] = typer.Option(
+        None, "--metric", help="With --metrics, show one metric's daily trend."
+    ),
+    metrics_window: int = typer.Option(
+        20, "--metrics-window", help="Earlier runs in the regression baseline."
+    ),
+    output: str = typer.Option(
+        "auto",
+        "--output",
+        help="Progress output: rich, json (JSON lines), or auto (rich on a terminal).",
+    ),
+):
     """Generate today's news webpage using multi-agent Claude AI."""
-    console = create_console()
+    from src.utils.reporter import OUTPUT_MODES, create_reporter
+
+    if output not in OUTPUT_MODES:
+        raise typer.BadParameter(f"expected one of {', '.join(OUTPUT_MODES)}")
+    reporter = create_reporter(output)
 
     try:
+        if startup_report:
+            print_startup_report(reporter)
+            return
+
         # Load configuration
-        config = Config.from_env()
+        config = Config.from_env(require_api_key=not (dry_run or replay or metrics))
+        if trace:
+            config.trace_file = trace
+        if feeds_dir:
+            config.feeds_dir = feeds_dir
+        if editions:
+            config.editions_file = editions
+        config.record_cassette = record
+        config.replay_cassette = replay
+        config.replay_speed = replay_speed
+
+        if dry_run:
+            print(render_dry_run(config, reporter))
+            return
+
+        if metrics:
+            if print_metrics_report(config, reporter, metric, metrics_window):
+                raise typer.Exit(1)
+            return
+
+        if backfill:
+            dates = [date.strip() for date in backfill.split(",") if date.strip()]
+            run_backfill(config, reporter, dates, regather)
+            return
+
+        if serve:
+            from src.service import NewsService
+
+            service = NewsService(config, reporter, interval, host, port)
+            try:
+                asyncio.run(service.run_forever())
+            except KeyboardInterrupt:
+                reporter.print("\n[dim]Service stopped[/dim]")
+            return
 
         # Run async pipeline
-        html_content = asyncio.run(generate_news_webpage(config))
+        html_content = asyncio.run(
+            generate_news_webpage(config, reporter, refresh, delta, force)
+        )
 
         if html_content:
             # Output to stdout (everything else goes to stderr)
@@ -71,13 +320,16 @@ def main():
             raise typer.Exit(1)
 
     except KeyboardInterrupt:
-        console.print("\n[warning]Cancelled by user[/warning]")
+        reporter.warn("\nCancelled by user")
         raise typer.Exit(130)
 
+    except typer.Exit:
+        raise
+
     except Exception as e:
-        console.print(f"[error]Error: {e}[/error]")
+        reporter.error(f"Error: {e}")
         raise typer.Exit(1)
 
 
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    app()
@@ -1,44 +1,108 @@
 """Base class for all news agents."""
 
-import asyncio
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
-from anthropic import Anthropic
+from src.models.article import Article
+from src.prompts.template import PromptTemplate
+from src.utils.cassette import current_cassette
+from src.utils.file_logger import get_logger
+from src.utils.token_budget import TokenEstimator, fit_to_budget
+from src.utils.tracing import Span, current_span, span
+
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+
+    from src.utils.hedging import HedgePolicy
+    from src.utils.model_router import ModelRouter
 
 
 class BaseNewsAgent(ABC):
     """Abstract base class for all news agents."""
 
+    # Pipeline stage this agent runs in (used for model routing)
+    stage: str = ""
+
     def __init__(
-        self, client: Anthropic, name: str, model: str = "claude-sonnet-4-5-20250929"
+        self,
+        client: "AsyncAnthropic",
+        name: str,
+        model: str = "claude-sonnet-4-5-20250929",
+        router: Optional["ModelRouter"] = None,
+        hedger: Optional["HedgePolicy"] = None,
     ):
         self.client = client
         self.name = name
         self.model = model
+        self.router = router
+        self.hedger = hedger
+        # Per-request timeout (seconds), set from the stage budget
+        self.request_timeout: Optional[float] = None
+        # Date the prompt is written for (None = today), e.g. for backfills
+        self.as_of: Optional[datetime] = None
+        # Prompt size guardrail: estimator and input token budget, if any
+        self.estimator: Optional[TokenEstimator] = None
+        self.input_token_budget: Optional[int] = None
 
     @abstractmethod
     async def execute(self, *args, **kwargs) -> Any:
         """Execute the agent's task."""
         pass
 
-    def _format_prompt(self, template: str, **kwargs) -> str:
-        """Format a prompt template with date and custom variables."""
-        today = datetime.now().strftime("%B %d, %Y")
-        return template.format(today=today, **kwargs)
+    def _format_prompt(self, template: PromptTemplate, **kwargs) -> str:
+        """Render a prompt template with date and custom variables."""
+        today = (self.as_of or datetime.now()).strftime("%B %d, %Y")
+        return template.render(today=today, **kwargs)
 
-    async def _call_claude(
+    def _fit_prompt(
         self,
-        prompt: str,
-        tools: Optional[list] = None,
-        max_tokens: int = 8000,
-    ) -> Any:
-        """Make an async API call to Claude."""
+        articles: list[Article],
+        render: Callable[[list[Article], Optional[int]], str],
+    ) -> tuple[str, list[Article]]:
+        """
+        Render an article prompt within the input token budget.
+
+        Over budget, summaries are trimmed and then the lowest-ranked
+        articles dropped (see fit_to_budget). Returns the prompt and the
+        articles it covers.
+        """
+        if self.estimator is None or self.input_token_budget is None:
+            return render(articles, None), articles
+
+        estimator = self.estimator
+        prompt, kept, actions = fit_to_budget(
+            render,
+            articles,
+            self.input_token_budget,
+            lambda text: estimator.estimate(text, self.stage),
+        )
+        for action in actions:
+            get_logger().warning(
+                "%s - Prompt over %d token budget: %s",
+                self.name,
+                self.input_token_budget,
+                action,
+            )
+        current_span().set(
+            estimated_input_tokens=estimator.estimate(prompt, self.stage),
+            articles_dropped=len(articles) - len(kept),
+        )
+        return prompt, kept
+
+    def _request_kwargs(
+        self, prompt: str, tools: Optional[list], max_tokens: int
+    ) -> dict:
+        """Build the keyword arguments for a messages request."""
         messages = [{"role": "user", "content": prompt}]
 
+        model = self.model
+        if self.router:
+            model = self.router.choose(self.stage, self.model)
+
         kwargs = {
-            "model": self.model,
+            "model": model,
             "max_tokens": max_tokens,
             "messages": messages,
         }
@@ -46,10 +110,124 @@ class BaseNewsAgent(ABC):
         if tools:
             kwargs["tools"] = tools
 
-        # Anthropic SDK doesn't have native async, so wrap in executor
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None, lambda: self.client.messages.create(**kwargs)
-        )
+        if self.request_timeout:
+            kwargs["timeout"] = self.request_timeout
+
+        return kwargs
+
+    def _batch_params(
+        self, prompt: str, tools: Optional[list] = None, max_tokens: int = 8000
+    ) -> dict:
+        """Request parameters for a Message Batches entry (no client timeout)."""
+        kwargs = self._request_kwargs(prompt, tools, max_tokens)
+        kwargs.pop("timeout", None)
+        return kwargs
+
+    async def _call_claude(
+        self,
+        prompt: str,
+        tools: Optional[list] = None,
+        max_tokens: int = 8000,
+    ) -> Any:
+        """Make an async API call to Claude."""
+        kwargs = self._request_kwargs(prompt, tools, max_tokens)
+
+        def create_message():
+            return self.client.messages.create(**kwargs)
+
+        cassette = current_cassette()
+        with span(
+            "api.messages.create", agent=self.name, model=kwargs["model"]
+        ) as call:
+            start = time.monotonic()
+            if cassette and cassette.replaying:
+                response = await cassette.replay(self.name, kwargs)
+            elif self.hedger:
+                response = await self.hedger.run(self.name, create_message)
+            else:
+                response = await create_message()
+            elapsed = time.monotonic() - start
+
+            # Replayed latencies aren't real, so they don't feed routing
+            if not (cassette and cassette.replaying):
+                self._observe_latency(kwargs["model"], elapsed)
+                if not tools:
+                    self._calibrate(prompt, response)
+                if cassette:
+                    cassette.record(self.name, "create", kwargs, response, elapsed)
+            self._trace_usage(call, response)
+
+        return response
+
+    async def _stream_claude(
+        self,
+        prompt: str,
+        on_text: Callable[[str], None],
+        max_tokens: int = 8000,
+    ) -> Any:
+        """
+        Make a streaming API call to Claude.
+
+        Each text delta is passed to on_text as it arrives; the final
+        assembled message is returned.
+        """
+        kwargs = self._request_kwargs(prompt, None, max_tokens)
+        cassette = current_cassette()
+        chunks: list[str] = []
+
+        async def stream_message():
+            async with self.client.messages.stream(**kwargs) as stream:
+                async for text in stream.text_stream:
+                    if cassette:
+                        chunks.append(text)
+                    on_text(text)
+                return await stream.get_final_message()
+
+        with span(
+            "api.messages.stream", agent=self.name, model=kwargs["model"]
+        ) as call:
+            start = time.monotonic()
+            if cassette and cassette.replaying:
+                response = await cassette.replay_stream(self.name, kwargs, on_text)
+            else:
+                response = await stream_message()
+                elapsed = time.monotonic() - start
+                self._observe_latency(kwargs["model"], elapsed)
+                self._calibrate(prompt, response)
+                if cassette:
+                    cassette.record(
+                        self.name, "stream", kwargs, response, elapsed, chunks
+                    )
+            self._trace_usage(call, response)
 
         return response
+
+    def _trace_usage(self, call: Span, response: Any) -> None:
+        """Record token and search usage on an API call's span."""
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+        call.set(
+            input_tokens=getattr(usage, "input_tokens", 0),
+            output_tokens=getattr(usage, "output_tokens", 0),
+            stop_reason=str(getattr(response, "stop_reason", "")),
+        )
+        server_tool_use = getattr(usage, "server_tool_use", None)
+        if server_tool_use is not None:
+            call.set(web_searches=getattr(server_tool_use, "web_search_requests", 0))
+
+    def _calibrate(self, prompt: str, response: Any) -> None:
+        """
+        Feed a call's reported input tokens back to the estimator.
+
+        Only for calls without tools: web search results count as input too.
+        """
+        usage = getattr(response, "usage", None)
+        if self.estimator is None or usage is None:
+            return
+        self.estimator.observe(self.stage, prompt, usage.input_tokens)
+
+    def _observe_latency(self, model: str, seconds: float) -> None:
+        """Feed a completed call's latency back to the router."""
+        if self.router:
+            self.router.observe(self.stage, model, seconds)
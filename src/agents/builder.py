@@ -1,31 +1,39 @@
 """Builder agent that creates the final HTML webpage."""
 
 import time
-from xml.sax.saxutils import escape
+from html import escape
+from typing import Optional
 
 from src.agents.base import BaseNewsAgent
 from src.models.article import Article, BuildResult
+from src.prompts.template import PromptTemplate
+from src.utils.design_brief import DesignBriefScanner, fallback_design_brief
+from src.utils.token_budget import trim_summary
+from src.utils.tracing import span, traced
 
 
 class BuilderAgent(BaseNewsAgent):
     """Sonnet agent that builds the final HTML webpage."""
 
+    stage = "build"
+
     def __init__(
         self,
         client,
-        prompt_template: str,
+        prompt_template: PromptTemplate,
         recent_designs: str = "",
         tired_aesthetics: str = "",
         creative_nudge: str = "",
+        model: str = "claude-sonnet-4-5-20250929",
+        router=None,
     ):
-        super().__init__(
-            client, name="Builder-Sonnet", model="claude-sonnet-4-5-20250929"
-        )
+        super().__init__(client, name="Builder-Sonnet", model=model, router=router)
         self.prompt_template = prompt_template
         self.recent_designs = recent_designs
         self.tired_aesthetics = tired_aesthetics
         self.creative_nudge = creative_nudge
 
+    @traced("agent.{self.name}")
     async def execute(self, articles: list[Article]) -> BuildResult:
         """Build the final HTML webpage."""
         start_time = time.time()
@@ -33,25 +41,18 @@ class BuilderAgent(BaseNewsAgent):
         result = BuildResult()
 
         try:
-            # Format articles for the prompt
-            article_data = self._format_articles(articles)
-
             # Format prompt with articles, memory, tired aesthetics, and nudge
-            prompt = self._format_prompt(
-                self.prompt_template,
-                articles=article_data,
-                recent_designs=self.recent_designs,
-                tired_aesthetics=self.tired_aesthetics,
-                creative_nudge=self.creative_nudge,
+            # (within the input token budget)
+            prompt, articles = self._fit_prompt(articles, self.render_prompt)
+
+            # Stream from Claude (no web search, higher token limit for HTML),
+            # picking up the design brief as it goes past
+            scanner = DesignBriefScanner()
+            response = await self._stream_claude(
+                prompt, on_text=scanner.feed, max_tokens=16000
             )
 
-            # Call Claude (no web search, higher token limit for HTML)
-            response = await self._call_claude(prompt, max_tokens=16000)
-
-            # Extract HTML
-            html_content = self._extract_html(response)
-            result.html_content = html_content
-            result.success = True
+            self._read_response(result, response, scanner, articles)
 
         except Exception as e:
             result.success = False
@@ -62,19 +63,69 @@ class BuilderAgent(BaseNewsAgent):
 
         return result
 
-    def _format_articles(self, articles: list[Article]) -> str:
+    def batch_request(self, articles: list[Article]) -> dict:
+        """Request parameters for building the page in a message batch."""
+        prompt, _ = self._fit_prompt(articles, self.render_prompt)
+        return self._batch_params(prompt, max_tokens=16000)
+
+    def result_from_response(self, response, articles: list[Article]) -> BuildResult:
+        """Turn a batch response into a build result."""
+        result = BuildResult()
+        try:
+            scanner = DesignBriefScanner()
+            scanner.feed(self._response_text(response))
+            self._read_response(result, response, scanner, articles)
+        except Exception as e:
+            result.success = False
+            result.error_message = str(e)
+        return result
+
+    def _read_response(
+        self,
+        result: BuildResult,
+        response,
+        scanner: DesignBriefScanner,
+        articles: list[Article],
+    ) -> None:
+        """Fill in the page and its design brief from a response."""
+        with span("parse.html", agent=self.name) as parse:
+            result.html_content = self._extract_html(response)
+            result.design_rationale = scanner.brief or fallback_design_brief(
+                scanner.title, articles
+            )
+            parse.set(html_chars=len(result.html_content), brief=bool(scanner.brief))
+        result.success = True
+
+    def render_prompt(
+        self, articles: list[Article], summary_chars: Optional[int] = None
+    ) -> str:
+        """Render the builder prompt with articles and design context."""
+        return self._format_prompt(
+            self.prompt_template,
+            articles=self._format_articles(articles, summary_chars),
+            recent_designs=self.recent_designs,
+            tired_aesthetics=self.tired_aesthetics,
+            creative_nudge=self.creative_nudge,
+        )
+
+    def _format_articles(
+        self, articles: list[Article], summary_chars: Optional[int] = None
+    ) -> str:
         """Format articles in XML format for the builder prompt."""
         lines = ["<articles>"]
 
         for article in articles:
             # Extract source name from URL for display
             source_name = self._extract_source_name(article.source_url)
+            summary = article.summary
+            if summary_chars is not None:
+                summary = trim_summary(summary, summary_chars)
 
             lines.append("  <article>")
-            lines.append(f"    <headline>{escape(article.title)}</headline>")
-            lines.append(f"    <source>{escape(source_name)}</source>")
-            lines.append(f"    <url>{escape(article.source_url)}</url>")
-            lines.append(f"    <summary>{escape(article.summary)}</summary>")
+            lines.append(f"    <headline>{escape(article.title, quote=False)}</headline>")
+            lines.append(f"    <source>{escape(source_name, quote=False)}</source>")
+            lines.append(f"    <url>{escape(article.source_url, quote=False)}</url>")
+            lines.append(f"    <summary>{escape(summary, quote=False)}</summary>")
             lines.append("  </article>")
 
         lines.append("</articles>")
@@ -94,14 +145,18 @@ class BuilderAgent(BaseNewsAgent):
         except Exception:
             return url
 
-    def _extract_html(self, response) -> str:
-        """Extract HTML from response."""
+    def _response_text(self, response) -> str:
+        """Join the text blocks of a response."""
         text_parts = []
         for block in response.content:
             if hasattr(block, "text"):
                 text_parts.append(block.text)
 
-        full_response = "".join(text_parts)
+        return "".join(text_parts)
+
+    def _extract_html(self, response) -> str:
+        """Extract HTML from response."""
+        full_response = self._response_text(response)
 
         # Strip everything before <!DOCTYPE html>
         doctype_index = full_response.find("<!DOCTYPE html>")
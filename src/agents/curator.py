@@ -1,23 +1,38 @@
 """Curator agent that selects the best articles using Opus."""
 
 import json
+import logging
 import time
+from typing import Optional
 from uuid import UUID
 
 from src.agents.base import BaseNewsAgent
 from src.models.article import Article, CurationResult
-from src.utils.file_logger import get_logger
+from src.prompts.template import PromptTemplate
+from src.utils.file_logger import get_logger, log_blob
+from src.utils.token_budget import trim_summary
+from src.utils.tracing import span, traced
 
 
 class CuratorAgent(BaseNewsAgent):
     """Opus agent that selects the best articles."""
 
-    def __init__(self, client, prompt_template: str):
+    stage = "curate"
+
+    def __init__(
+        self,
+        client,
+        prompt_template: PromptTemplate,
+        model: str = "claude-opus-4-5-20251101",  # Use Opus
+        router=None,
+        hedger=None,
+    ):
         super().__init__(
-            client, name="Curator-Opus", model="claude-opus-4-5-20251101"  # Use Opus
+            client, name="Curator-Opus", model=model, router=router, hedger=hedger
         )
         self.prompt_template = prompt_template
 
+    @traced("agent.{self.name}")
     async def execute(self, articles: list[Article]) -> CurationResult:
         """Select and order the best articles."""
         logger = get_logger()
@@ -25,56 +40,86 @@ class CuratorAgent(BaseNewsAgent):
 
         result = CurationResult()
 
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Starting {self.name}")
-        logger.info(f"{'='*60}")
-        logger.info(f"{self.name} - Curating from {len(articles)} articles")
+        logger.info("\n%s", "=" * 60)
+        logger.info("Starting %s", self.name)
+        logger.info("=" * 60)
+        logger.info("%s - Curating from %s articles", self.name, len(articles))
 
         try:
-            # Build article index for the prompt
-            article_index = self._build_article_index(articles)
-
-            # Format prompt with articles
-            prompt = self._format_prompt(
-                self.prompt_template,
-                article_count=len(articles),
-                article_index=article_index,
-            )
-            logger.debug(f"{self.name} - Prompt length: {len(prompt)} chars")
+            # Format prompt with articles, within the input token budget
+            prompt, articles = self._fit_prompt(articles, self.render_prompt)
+            logger.debug("%s - Prompt length: %s chars", self.name, len(prompt))
 
             # Call Claude Opus (no web search needed)
-            logger.info(f"{self.name} - Calling Claude Opus...")
+            logger.info("%s - Calling Claude Opus...", self.name)
             response = await self._call_claude(prompt, max_tokens=4000)
-            logger.info(f"{self.name} - Response received (stop_reason: {response.stop_reason})")
+            logger.info("%s - Response received (stop_reason: %s)", self.name, response.stop_reason)
 
-            # Parse response
-            logger.info(f"{self.name} - Parsing selection...")
-            selected_data = self._parse_selection(response)
-            result.selected_uuids = selected_data["uuids"]
-            result.reasoning = selected_data["reasoning"]
-            result.success = True
-            logger.info(f"{self.name} - Successfully selected {len(result.selected_uuids)} articles")
+            self._read_response(result, response)
 
         except Exception as e:
             result.success = False
             result.error_message = str(e)
-            logger.error(f"{self.name} - FAILED: {str(e)}")
+            logger.error("%s - FAILED: %s", self.name, e)
 
         finally:
             result.execution_time_seconds = time.time() - start_time
-            logger.info(f"{self.name} - Completed in {result.execution_time_seconds:.2f}s")
+            logger.info("%s - Completed in %.2fs", self.name, result.execution_time_seconds)
 
         return result
 
-    def _build_article_index(self, articles: list[Article]) -> str:
+    def batch_request(self, articles: list[Article]) -> dict:
+        """Request parameters for running the curation in a message batch."""
+        prompt, _ = self._fit_prompt(articles, self.render_prompt)
+        return self._batch_params(prompt, max_tokens=4000)
+
+    def result_from_response(self, response) -> CurationResult:
+        """Turn a batch response into a curation result."""
+        result = CurationResult()
+        try:
+            self._read_response(result, response)
+        except Exception as e:
+            result.success = False
+            result.error_message = str(e)
+            get_logger().error("%s - FAILED: %s", self.name, e)
+        return result
+
+    def _read_response(self, result: CurationResult, response) -> None:
+        """Fill in the selection and reasoning from a response."""
+        logger = get_logger()
+        logger.info("%s - Parsing selection...", self.name)
+        with span("parse.selection", agent=self.name) as parse:
+            selected_data = self._parse_selection(response)
+            parse.set(selected=len(selected_data["uuids"]))
+        result.selected_uuids = selected_data["uuids"]
+        result.reasoning = selected_data["reasoning"]
+        result.success = True
+        logger.info("%s - Successfully selected %s articles", self.name, len(result.selected_uuids))
+
+    def render_prompt(
+        self, articles: list[Article], summary_chars: Optional[int] = None
+    ) -> str:
+        """Render the curator prompt with the article index."""
+        return self._format_prompt(
+            self.prompt_template,
+            article_count=len(articles),
+            article_index=self._build_article_index(articles, summary_chars),
+        )
+
+    def _build_article_index(
+        self, articles: list[Article], summary_chars: Optional[int] = None
+    ) -> str:
         """Build a compact article index for the prompt."""
         lines = []
 
         for article in articles:
+            summary = article.summary
+            if summary_chars is not None:
+                summary = trim_summary(summary, summary_chars)
             lines.append(
                 f"UUID: {article.uuid}\n"
                 f"Title: {article.title}\n"
-                f"Summary: {article.summary}\n"
+                f"Summary: {summary}\n"
                 f"Credibility: Tier {article.credibility_tier.value}\n"
                 f"Published: {article.published_date or 'Unknown'}\n"
                 f"---"
@@ -92,27 +137,27 @@ class CuratorAgent(BaseNewsAgent):
 
         full_text = "".join(text_parts)
 
-        logger.debug(f"{self.name} - Raw response length: {len(full_text)} chars")
-        logger.debug(f"{self.name} - Raw response (first 500 chars):\n{full_text[:500]}")
+        logger.debug("%s - Raw response length: %s chars", self.name, len(full_text))
+        log_blob(full_text, "%s - Raw response", self.name)
 
         # Strip markdown code blocks if present
         original_text = full_text
         full_text = full_text.strip()
         if full_text.startswith("```"):
-            logger.debug(f"{self.name} - Detected markdown code block, stripping...")
+            logger.debug("%s - Detected markdown code block, stripping...", self.name)
             lines = full_text.split("\n")
             lines = lines[1:]  # Remove first line (```json)
             if lines and lines[-1].strip() == "```":
                 lines = lines[:-1]  # Remove last line (```)
             full_text = "\n".join(lines)
-            logger.debug(f"{self.name} - After stripping (first 500 chars):\n{full_text[:500]}")
+            logger.debug("%s - After stripping (first 500 chars):\n%s", self.name, full_text[:500])
 
         # Parse JSON response
         try:
-            logger.debug(f"{self.name} - Attempting to parse JSON...")
+            logger.debug("%s - Attempting to parse JSON...", self.name)
             data = json.loads(full_text)
-            logger.debug(f"{self.name} - JSON parsed successfully")
-            logger.debug(f"{self.name} - Found {len(data.get('selected_uuids', []))} UUIDs")
+            logger.debug("%s - JSON parsed successfully", self.name)
+            logger.debug("%s - Found %s UUIDs", self.name, len(data.get("selected_uuids", [])))
 
             # Parse UUIDs with better error handling
             uuids = []
@@ -120,24 +165,24 @@ class CuratorAgent(BaseNewsAgent):
                 try:
                     uuids.append(UUID(u))
                 except (ValueError, AttributeError) as e:
-                    logger.error(f"{self.name} - Invalid UUID at index {i}: '{u}' - Error: {e}")
+                    logger.error("%s - Invalid UUID at index %s: '%s' - Error: %s", self.name, i, u, e)
                     # Continue processing other UUIDs instead of failing completely
                     continue
 
             if not uuids:
-                logger.error(f"{self.name} - No valid UUIDs parsed!")
-                logger.error(f"{self.name} - Raw UUID list: {data.get('selected_uuids', [])}")
+                logger.error("%s - No valid UUIDs parsed!", self.name)
+                logger.error("%s - Raw UUID list: %s", self.name, data.get("selected_uuids", []))
                 raise ValueError("No valid UUIDs found in curator response")
 
-            logger.info(f"{self.name} - Successfully parsed {len(uuids)} valid UUIDs")
+            logger.info("%s - Successfully parsed %s valid UUIDs", self.name, len(uuids))
 
             return {
                 "uuids": uuids,
                 "reasoning": data.get("reasoning", ""),
             }
         except json.JSONDecodeError as e:
-            logger.error(f"{self.name} - JSON parsing failed!")
-            logger.error(f"{self.name} - Error: {str(e)}")
-            logger.error(f"{self.name} - Full raw response:\n{original_text}")
-            logger.error(f"{self.name} - After cleanup:\n{full_text}")
+            logger.error("%s - JSON parsing failed!", self.name)
+            logger.error("%s - Error: %s", self.name, e)
+            log_blob(original_text, "%s - Full raw response", self.name, level=logging.ERROR)
+            log_blob(full_text, "%s - After cleanup", self.name, level=logging.ERROR)
             raise
@@ -1,6 +1,7 @@
 """News gathering agent for specific domains."""
 
 import json
+import logging
 import time
 from datetime import datetime
 from typing import Optional
@@ -12,26 +13,42 @@ from src.models.article import (
     AgentResult,
     CredibilityTier,
 )
-from src.utils.file_logger import get_logger
+from src.prompts.template import PromptTemplate
+from src.utils.dates import parse_published_date
+from src.utils.file_logger import get_logger, log_blob
+from src.utils.tracing import span, traced
 
 
 class GathererAgent(BaseNewsAgent):
     """News gathering agent for a specific domain."""
 
+    stage = "gather"
+
     def __init__(
         self,
         client,
         agent_type: AgentType,
-        prompt_template: str,
+        prompt_template: PromptTemplate,
         max_searches: int = 5,
+        model: str = "claude-sonnet-4-5-20250929",
+        router=None,
+        hedger=None,
+        delta_instructions: str = "",
     ):
         super().__init__(
-            client, name=f"Gatherer-{agent_type.value}", model="claude-sonnet-4-5-20250929"
+            client,
+            name=f"Gatherer-{agent_type.value}",
+            model=model,
+            router=router,
+            hedger=hedger,
         )
         self.agent_type = agent_type
         self.prompt_template = prompt_template
         self.max_searches = max_searches
+        # Extra instructions for delta runs (only stories newer than the pool)
+        self.delta_instructions = delta_instructions
 
+    @traced("agent.{self.name}")
     async def execute(self) -> AgentResult:
         """Gather news articles in this domain."""
         logger = get_logger()
@@ -39,54 +56,85 @@ class GathererAgent(BaseNewsAgent):
 
         result = AgentResult(agent_name=self.name)
 
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Starting {self.name}")
-        logger.info(f"{'='*60}")
+        logger.info("\n%s", "=" * 60)
+        logger.info("Starting %s", self.name)
+        logger.info("=" * 60)
 
         try:
-            # Prepare tools
-            tools = [
-                {
-                    "type": "web_search_20250305",
-                    "name": "web_search",
-                    "max_uses": self.max_searches,
-                }
-            ]
-
             # Format prompt
-            prompt = self._format_prompt(self.prompt_template)
-            logger.debug(f"{self.name} - Prompt length: {len(prompt)} chars")
+            prompt = self.render_prompt()
+            logger.debug("%s - Prompt length: %s chars", self.name, len(prompt))
 
             # Call Claude
-            logger.info(f"{self.name} - Calling Claude API...")
-            response = await self._call_claude(prompt, tools=tools)
-            logger.info(f"{self.name} - Response received (stop_reason: {response.stop_reason})")
-
-            # Track search usage
-            if hasattr(response, "usage") and hasattr(response.usage, "server_tool_use"):
-                server_tool_use = response.usage.server_tool_use
-                if hasattr(server_tool_use, "web_search_requests"):
-                    result.search_count = server_tool_use.web_search_requests
-                    logger.info(f"{self.name} - Performed {result.search_count} web searches")
-
-            # Parse response
-            logger.info(f"{self.name} - Parsing response...")
-            articles = self._parse_articles(response)
-            result.articles = articles
-            result.success = True
-            logger.info(f"{self.name} - Successfully parsed {len(articles)} articles")
+            logger.info("%s - Calling Claude API...", self.name)
+            response = await self._call_claude(prompt, tools=self._tools())
+            logger.info("%s - Response received (stop_reason: %s)", self.name, response.stop_reason)
+
+            self._read_response(result, response)
 
         except Exception as e:
             result.success = False
             result.error_message = str(e)
-            logger.error(f"{self.name} - FAILED: {str(e)}")
+            logger.error("%s - FAILED: %s", self.name, e)
 
         finally:
             result.execution_time_seconds = time.time() - start_time
-            logger.info(f"{self.name} - Completed in {result.execution_time_seconds:.2f}s")
+            logger.info("%s - Completed in %.2fs", self.name, result.execution_time_seconds)
+
+        return result
 
+    def batch_request(self) -> dict:
+        """Request parameters for running this agent in a message batch."""
+        return self._batch_params(self.render_prompt(), tools=self._tools())
+
+    def result_from_response(self, response) -> AgentResult:
+        """Turn a batch response into this agent's result."""
+        result = AgentResult(agent_name=self.name)
+        try:
+            self._read_response(result, response)
+        except Exception as e:
+            result.success = False
+            result.error_message = str(e)
+            get_logger().error("%s - FAILED: %s", self.name, e)
         return result
 
+    def _tools(self) -> list[dict]:
+        """The web search tool, capped at this agent's search budget."""
+        return [
+            {
+                "type": "web_search_20250305",
+                "name": "web_search",
+                "max_uses": self.max_searches,
+            }
+        ]
+
+    def _read_response(self, result: AgentResult, response) -> None:
+        """Fill in search usage and parsed articles from a response."""
+        logger = get_logger()
+
+        # Track search usage
+        if hasattr(response, "usage") and hasattr(response.usage, "server_tool_use"):
+            server_tool_use = response.usage.server_tool_use
+            if hasattr(server_tool_use, "web_search_requests"):
+                result.search_count = server_tool_use.web_search_requests
+                logger.info("%s - Performed %s web searches", self.name, result.search_count)
+
+        # Parse response
+        logger.info("%s - Parsing response...", self.name)
+        with span("parse.articles", agent=self.name) as parse:
+            articles = self._parse_articles(response)
+            parse.set(articles=len(articles))
+        result.articles = articles
+        result.success = True
+        logger.info("%s - Successfully parsed %s articles", self.name, len(articles))
+
+    def render_prompt(self) -> str:
+        """Render the gatherer prompt for today and this run's search budget."""
+        prompt = self._format_prompt(
+            self.prompt_template, max_searches=self.max_searches
+        )
+        return prompt + self.delta_instructions
+
     def _parse_articles(self, response) -> list[Article]:
         """Extract articles from Claude's response."""
         logger = get_logger()
@@ -100,14 +148,14 @@ class GathererAgent(BaseNewsAgent):
 
         full_text = "".join(text_parts)
 
-        logger.debug(f"{self.name} - Raw response length: {len(full_text)} chars")
-        logger.debug(f"{self.name} - Raw response (first 500 chars):\n{full_text[:500]}")
+        logger.debug("%s - Raw response length: %s chars", self.name, len(full_text))
+        log_blob(full_text, "%s - Raw response", self.name)
 
         # Strip markdown code blocks if present
         original_text = full_text
         full_text = full_text.strip()
         if full_text.startswith("```"):
-            logger.debug(f"{self.name} - Detected markdown code block, stripping...")
+            logger.debug("%s - Detected markdown code block, stripping...", self.name)
             # Remove opening ```json or ```
             lines = full_text.split("\n")
             lines = lines[1:]  # Remove first line
@@ -115,26 +163,26 @@ class GathererAgent(BaseNewsAgent):
             if lines and lines[-1].strip() == "```":
                 lines = lines[:-1]
             full_text = "\n".join(lines)
-            logger.debug(f"{self.name} - After stripping (first 500 chars):\n{full_text[:500]}")
+            logger.debug("%s - After stripping (first 500 chars):\n%s", self.name, full_text[:500])
 
         # Extract JSON object if there's surrounding text
         full_text = full_text.strip()
         if not full_text.startswith("{"):
-            logger.debug(f"{self.name} - Response doesn't start with '{{', attempting to extract JSON object...")
+            logger.debug("%s - Response doesn't start with '{', attempting to extract JSON object...", self.name)
             # Find the first { and last }
             start_idx = full_text.find("{")
             end_idx = full_text.rfind("}")
             if start_idx != -1 and end_idx != -1 and end_idx > start_idx:
                 full_text = full_text[start_idx:end_idx + 1]
-                logger.debug(f"{self.name} - Extracted JSON object (first 500 chars):\n{full_text[:500]}")
+                logger.debug("%s - Extracted JSON object (first 500 chars):\n%s", self.name, full_text[:500])
             else:
-                logger.error(f"{self.name} - Could not find JSON object in response")
+                logger.error("%s - Could not find JSON object in response", self.name)
 
         # Parse JSON response (expected format)
         try:
-            logger.debug(f"{self.name} - Attempting to parse JSON...")
+            logger.debug("%s - Attempting to parse JSON...", self.name)
             data = json.loads(full_text)
-            logger.debug(f"{self.name} - JSON parsed successfully, found {len(data.get('articles', []))} articles")
+            logger.debug("%s - JSON parsed successfully, found %s articles", self.name, len(data.get("articles", [])))
 
             for item in data.get("articles", []):
                 article = Article(
@@ -146,35 +194,19 @@ class GathererAgent(BaseNewsAgent):
                     gathered_by_agent=self.name,
                 )
                 articles.append(article)
-                logger.debug(f"{self.name} - Parsed article: {article.title}")
+                logger.debug("%s - Parsed article: %s", self.name, article.title)
 
         except json.JSONDecodeError as e:
             # Log the full response for debugging
-            logger.error(f"{self.name} - JSON parsing failed!")
-            logger.error(f"{self.name} - Error: {str(e)}")
-            logger.error(f"{self.name} - Full raw response:\n{original_text}")
-            logger.error(f"{self.name} - After cleanup:\n{full_text}")
+            logger.error("%s - JSON parsing failed!", self.name)
+            logger.error("%s - Error: %s", self.name, e)
+            log_blob(original_text, "%s - Full raw response", self.name, level=logging.ERROR)
+            log_blob(full_text, "%s - After cleanup", self.name, level=logging.ERROR)
             # Re-raise with more context for debugging
             raise ValueError(f"Failed to parse JSON: {str(e)}\nContent: {full_text[:200]}")
 
         return articles
 
     def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
-        """Parse date string to datetime."""
-        if not date_str:
-            return None
-
-        # Try common formats
-        formats = [
-            "%Y-%m-%d",
-            "%Y-%m-%dT%H:%M:%S",
-            "%B %d, %Y",
-        ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-
-        return None
+        """Parse date string to a UTC-aware datetime."""
+        return parse_published_date(date_str)
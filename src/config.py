@@ -2,6 +2,11 @@
 
 import os
 from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+# Local state (latency history, caches) lives here unless overridden
+DEFAULT_STATE_DIR = Path(__file__).parent.parent / ".newsgen"
 
 
 @dataclass
@@ -19,14 +24,96 @@ class Config:
     curator_model: str = "claude-opus-4-5-20251101"
     builder_model: str = "claude-sonnet-4-5-20250929"
 
+    # Fallback used when the curator model's recent p95 exceeds its deadline
+    curator_fallback_model: Optional[str] = "claude-sonnet-4-5-20250929"
+
+    # Whole-run deadline (seconds), split into per-stage budgets
+    run_deadline_seconds: float = 900.0
+
+    # A run lock older than this (seconds) is taken to be from a hung run
+    run_lock_stale_seconds: float = 1800.0
+
+    # Hedged requests for gatherer and curator calls (opt-in)
+    hedge_requests: bool = False
+    max_hedges_per_run: int = 2
+
+    # New articles a delta run needs before the edition is re-curated
+    delta_recurate_threshold: int = 3
+
+    # Local pre-curation: drop older articles, pass the curator the top K
+    max_article_age_hours: float = 48.0
+    curator_max_candidates: int = 30
+
+    # Estimated input tokens a curator or builder prompt may use; over it,
+    # summaries are trimmed and the lowest-ranked articles dropped
+    curator_input_token_budget: int = 12000
+    builder_input_token_budget: int = 20000
+
+    # Tracing: Chrome trace file to write, and an OTLP/HTTP collector to send to
+    trace_file: Optional[Path] = None
+    otlp_endpoint: Optional[str] = None
+
+    # Record API calls to, or replay them from, a cassette (.jsonl.gz)
+    record_cassette: Optional[Path] = None
+    replay_cassette: Optional[Path] = None
+    replay_speed: float = 1.0  # 2.0 = twice the recorded pace, 0 = no delays
+
+    # Text-only page and feeds: the site they link back to, and where to
+    # write copies for publishing (they're always kept in the edition store)
+    site_url: str = "https://edilc.github.io/"
+    feeds_dir: Optional[Path] = None
+
+    # Extra editions (JSON list of edition specs) and how many builder calls
+    # may run at once across the main and extra editions
+    editions_file: Optional[Path] = None
+    max_concurrent_builds: int = 2
+
+    # Local state directory
+    state_dir: Path = DEFAULT_STATE_DIR
+
+    # Creative nudge seed (None = fresh random seed, logged for replay)
+    nudge_seed: Optional[int] = None
+
     @classmethod
-    def from_env(cls) -> "Config":
+    def from_env(cls, require_api_key: bool = True) -> "Config":
         """Load configuration from environment variables."""
-        api_key = os.environ.get("ANTHROPIC_API_KEY")
-        if not api_key:
+        api_key = os.environ.get("ANTHROPIC_API_KEY", "")
+        if not api_key and require_api_key:
             raise ValueError("ANTHROPIC_API_KEY environment variable not set")
 
+        nudge_seed = os.environ.get("NUDGE_SEED")
+        trace_file = os.environ.get("TRACE_FILE")
+        feeds_dir = os.environ.get("FEEDS_DIR")
+        editions_file = os.environ.get("EDITIONS_FILE")
+
         return cls(
             anthropic_api_key=api_key,
             max_searches_per_agent=int(os.environ.get("MAX_SEARCHES", "2")),
+            nudge_seed=int(nudge_seed) if nudge_seed else None,
+            run_deadline_seconds=float(os.environ.get("RUN_DEADLINE_SECONDS", "900")),
+            run_lock_stale_seconds=float(
+                os.environ.get("RUN_LOCK_STALE_SECONDS", "1800")
+            ),
+            hedge_requests=os.environ.get("HEDGE_REQUESTS", "") == "1",
+            max_hedges_per_run=int(os.environ.get("MAX_HEDGES", "2")),
+            delta_recurate_threshold=int(
+                os.environ.get("DELTA_RECURATE_THRESHOLD", "3")
+            ),
+            max_article_age_hours=float(
+                os.environ.get("MAX_ARTICLE_AGE_HOURS", "48")
+            ),
+            curator_max_candidates=int(os.environ.get("CURATOR_MAX_CANDIDATES", "30")),
+            curator_input_token_budget=int(
+                os.environ.get("CURATOR_INPUT_TOKEN_BUDGET", "12000")
+            ),
+            builder_input_token_budget=int(
+                os.environ.get("BUILDER_INPUT_TOKEN_BUDGET", "20000")
+            ),
+            trace_file=Path(trace_file) if trace_file else None,
+            otlp_endpoint=os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT") or None,
+            site_url=os.environ.get("SITE_URL", "https://edilc.github.io/"),
+            feeds_dir=Path(feeds_dir) if feeds_dir else None,
+            editions_file=Path(editions_file) if editions_file else None,
+            max_concurrent_builds=int(os.environ.get("MAX_CONCURRENT_BUILDS", "2")),
+            state_dir=Path(os.environ.get("NEWSGEN_STATE_DIR", DEFAULT_STATE_DIR)),
         )
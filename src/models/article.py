@@ -48,6 +48,34 @@ class Article:
         if not self.source_url.startswith(("http://", "https://")):
             raise ValueError(f"Invalid source URL: {self.source_url}")
 
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dict."""
+        return {
+            "uuid": str(self.uuid),
+            "title": self.title,
+            "summary": self.summary,
+            "source_url": self.source_url,
+            "credibility_tier": self.credibility_tier.value,
+            "published_date": (
+                self.published_date.isoformat() if self.published_date else None
+            ),
+            "gathered_by_agent": self.gathered_by_agent,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Article":
+        """Deserialize from to_dict() output (keeps the original UUID)."""
+        published = data.get("published_date")
+        return cls(
+            uuid=UUID(data["uuid"]),
+            title=data["title"],
+            summary=data["summary"],
+            source_url=data["source_url"],
+            credibility_tier=CredibilityTier(data.get("credibility_tier", 3)),
+            published_date=datetime.fromisoformat(published) if published else None,
+            gathered_by_agent=data.get("gathered_by_agent", ""),
+        )
+
 
 @dataclass
 class AgentResult:
@@ -93,18 +121,61 @@ class BuildResult:
     error_message: Optional[str] = None
 
 
+@dataclass
+class RoutingDecision:
+    """Which model was picked for an API call, and why."""
+
+    stage: str
+    preferred_model: str
+    chosen_model: str
+    reason: str = ""
+    deadline_seconds: Optional[float] = None
+
+    @property
+    def fell_back(self) -> bool:
+        """Whether a fallback model was used instead of the configured one."""
+        return self.chosen_model != self.preferred_model
+
+
+@dataclass
+class HedgeStats:
+    """How often hedged requests were sent, and how often they won."""
+
+    issued: int = 0
+    won: int = 0
+
+
 @dataclass
 class PipelineState:
     """Complete state of the news generation pipeline."""
 
     # Stage 1: Gathering
     agent_results: list[AgentResult] = field(default_factory=list)
+    pooled_articles: list[Article] = field(default_factory=list)  # Earlier runs today
 
     # Stage 2: Curation
     curation_result: Optional[CurationResult] = None
 
     # Stage 3: Building
     build_result: Optional[BuildResult] = None
+    nudge_seed: Optional[int] = None  # Replay with NUDGE_SEED=<seed>
+
+    # Model routing decisions for every API call
+    routing_decisions: list[RoutingDecision] = field(default_factory=list)
+    hedge_stats: HedgeStats = field(default_factory=HedgeStats)
+
+    # Whether today's cached design shell was refilled instead of rebuilt
+    refreshed_from_shell: bool = False
+
+    # Degradation tiers taken to stay within the deadline
+    degradations: list[str] = field(default_factory=list)
+
+    # Extra editions fanned out from this run: name -> how each was produced
+    editions: dict[str, str] = field(default_factory=dict)
+
+    # ID of today's already-published edition, when it was reused instead
+    # of generated again
+    reused_edition: Optional[str] = None
 
     # Metadata
     started_at: datetime = field(default_factory=datetime.now)
@@ -112,8 +183,8 @@ class PipelineState:
 
     @property
     def all_articles(self) -> list[Article]:
-        """Flatten all articles from all agents."""
-        articles = []
+        """Flatten all articles from all agents (after any pooled ones)."""
+        articles = list(self.pooled_articles)
         for result in self.agent_results:
             articles.extend(result.articles)
         return articles
@@ -124,8 +195,13 @@ class PipelineState:
         if not self.curation_result:
             return []
 
-        selected_uuids = set(self.curation_result.selected_uuids)
-        return [a for a in self.all_articles if a.uuid in selected_uuids]
+        # Keep the curator's display order
+        by_uuid = {a.uuid: a for a in self.all_articles}
+        return [
+            by_uuid[uuid]
+            for uuid in dict.fromkeys(self.curation_result.selected_uuids)
+            if uuid in by_uuid
+        ]
 
     @property
     def total_articles_gathered(self) -> int:
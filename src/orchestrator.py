@@ -1,194 +1,1003 @@
 """Orchestrates the three-stage news generation pipeline."""
 
 import asyncio
-
-from anthropic import Anthropic
-from rich.console import Console
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TaskProgressColumn,
-    TextColumn,
-)
+from datetime import datetime, timedelta
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional
 
 from src.agents.builder import BuilderAgent
 from src.agents.curator import CuratorAgent
 from src.agents.gatherer import GathererAgent
 from src.config import Config
-from src.models.article import AgentResult, AgentType, PipelineState
-from src.prompts.builder_prompt import get_builder_prompt_template
+from src.models.article import (
+    AgentResult,
+    AgentType,
+    Article,
+    BuildResult,
+    CurationResult,
+    PipelineState,
+)
+from src.prompts.builder_prompt import BUILDER_PROMPT
 from src.prompts.curator_prompt import CURATOR_PROMPT
-from src.prompts.gatherer_prompts import get_gatherer_prompt
-from src.utils.creative_nudge import generate_creative_nudge, format_nudge
+from src.prompts.gatherer_prompts import get_delta_instructions, get_gatherer_prompt
+from src.utils.agent_stats import AgentStats
+from src.utils.article_pool import ArticlePool
+from src.utils.batch import BatchRequestError, BatchRunner, batch_custom_id
+from src.utils.cassette import (
+    Cassette,
+    CassettePlayer,
+    CassetteRecorder,
+    use_cassette,
+)
+from src.utils.deadline import RunDeadline
+from src.utils.creative_nudge import CreativeNudge, NudgeSampler, format_nudge
+from src.utils.design_index import format_similar_designs, get_similar_designs
 from src.utils.design_memory import (
-    extract_design_summary,
+    detect_tired_aesthetics,
     format_design_memory,
+    get_nudge_history,
     get_recent_designs,
     get_tired_aesthetics_context,
     get_today_date,
+    load_design_memory,
     save_design_summary,
 )
+from src.utils.edition_specs import EditionSpec, load_edition_specs
+from src.utils.edition_store import EditionStore, edition_id
+from src.utils.fallback_renderer import render_fallback_page
+from src.utils.feeds import render_companions
 from src.utils.file_logger import setup_file_logger, get_logger
+from src.utils.hedging import HedgePolicy
+from src.utils.latency import LatencyTracker
+from src.utils.local_ranking import (
+    drop_stale,
+    rank_articles_locally,
+    select_candidates,
+)
+from src.utils.metrics_store import MetricsStore, collect_run_metrics
+from src.utils.model_router import ModelRouter
+from src.utils.run_lock import LOCK_POLL_SECONDS, RunLock
+from src.utils.slots import Shell, compile_shell, fill_shell
+from src.utils.token_budget import TokenEstimator
+from src.utils.tracing import Tracer, span, traced
+
+# Fewer gathered articles than this and the edition isn't worth curating
+MIN_ARTICLES = 5
+
+# Gatherers in each run, with their searches before any yield history
+DEFAULT_SEARCHES = {AgentType.MAINSTREAM: 1, AgentType.DEEP_CUTS: 3}
+
+if TYPE_CHECKING:
+    from anthropic import Anthropic, AsyncAnthropic
+
+    from src.utils.reporter import Reporter
 
 
 class NewsOrchestrator:
     """Orchestrates the three-stage news generation pipeline."""
 
-    def __init__(self, config: Config, console: Console):
+    def __init__(
+        self,
+        config: Config,
+        reporter: "Reporter",
+        dry_run: bool = False,
+        client: Optional["AsyncAnthropic"] = None,
+    ):
         self.config = config
-        self.console = console
-        self.client = Anthropic(api_key=config.anthropic_api_key)
+        self.reporter = reporter
+        self.dry_run = dry_run
         self.state = PipelineState()
-        # Set up file logging
-        self.logger = setup_file_logger("generation.log")
+        # Replays run offline against recorded responses and leave no trace:
+        # no design memory, editions, pools or learned stats are written
+        self.persist = not config.replay_cassette
+        # File logging starts with the run (see _start_logging), so waiting
+        # on another run's lock never rotates the log it's writing
+        self.logger = get_logger()
+
+        # Published editions and their refillable shells
+        self.editions = EditionStore(config.state_dir / "editions")
+
+        # Keeps overlapping runs from racing on the state directory
+        self.run_lock = RunLock(
+            config.state_dir / "run.lock", config.run_lock_stale_seconds
+        )
+
+        # Run-level deadline, split into per-stage budgets
+        self.deadline = RunDeadline(config.run_deadline_seconds)
+
+        # Latencies, gatherer yields and token calibrations from earlier runs
+        self._load_learned_state()
+
+        # Spans for this run (exported when tracing is configured)
+        self.tracer = Tracer()
+
+        # Recording API calls to a cassette, or replaying them from one
+        self.cassette: Optional[Cassette] = None
+        if config.replay_cassette:
+            self.cassette = CassettePlayer(config.replay_cassette, config.replay_speed)
+        elif config.record_cassette:
+            self.cassette = CassetteRecorder(config.record_cassette)
+
+        # Every run's metrics, kept for percentile and regression queries
+        self.metrics_store = MetricsStore(config.state_dir / "metrics.db")
+
+        # Extra editions built from the same gather and curation, with one
+        # cap on concurrent builder calls across all editions
+        self.edition_specs: list[EditionSpec] = (
+            load_edition_specs(config.editions_file) if config.editions_file else []
+        )
+        self._build_slots = asyncio.Semaphore(config.max_concurrent_builds)
+
+        # A long-running service passes in its warm client
+        if client is not None:
+            self.client = client
+
+    def _load_learned_state(self):
+        """Load what runs learn and save: latencies, yields, calibrations."""
+        config = self.config
+
+        # Route each call between the configured model and its fallbacks
+        latency = LatencyTracker(config.state_dir / "latency.json")
+        self.router = ModelRouter(
+            tracker=latency,
+            fallbacks={
+                "curate": [config.curator_fallback_model]
+                if config.curator_fallback_model
+                else [],
+            },
+            deadlines={
+                stage: self.deadline.planned_budget(stage)
+                for stage in ("gather", "curate", "build")
+            },
+        )
+        self.state.routing_decisions = self.router.decisions
+
+        # Hedge slow gatherer/curator calls (latencies are tracked regardless)
+        self.hedger = HedgePolicy(
+            tracker=latency,
+            enabled=config.hedge_requests,
+            max_hedges=config.max_hedges_per_run,
+        )
+        self.state.hedge_stats = self.hedger.stats
+
+        # Per-gatherer yield history, used to split the search budget
+        self.agent_stats = AgentStats(config.state_dir / "agent_stats.json")
+
+        # Prompt token estimates, calibrated against reported usage
+        self.token_estimator = TokenEstimator(
+            config.state_dir / "token_calibration.json"
+        )
+
+    def _start_logging(self, rotate: bool = True):
+        """Start this run's generation.log (rotating the previous one)."""
+        self.logger = setup_file_logger("generation.log", rotate=rotate)
         self.logger.info("NewsOrchestrator initialized")
 
-    async def run(self) -> str:
-        """Execute the full pipeline and return HTML."""
+    @cached_property
+    def client(self) -> Optional["AsyncAnthropic"]:
+        """
+        Async Anthropic client, created on first use (never in dry runs or
+        replays). Async so that cancelling a call (a stage timeout, a hedge's
+        loser) aborts the request instead of leaving it running.
+        """
+        if self.dry_run or self.config.replay_cassette:
+            return None
+
+        from anthropic import AsyncAnthropic
+
+        return AsyncAnthropic(api_key=self.config.anthropic_api_key)
+
+    @cached_property
+    def batch_client(self) -> "Anthropic":
+        """Blocking Anthropic client for the Message Batches API (backfills)."""
+        from anthropic import Anthropic
+
+        return Anthropic(api_key=self.config.anthropic_api_key)
+
+    async def run(
+        self, refresh: bool = False, delta: bool = False, force: bool = False
+    ) -> str:
+        """
+        Execute the full pipeline and return HTML.
+
+        Always produces a page: when a stage fails or runs out of budget the
+        pipeline degrades (fewer gatherers -> local ranking -> local template
+        -> previous edition) instead of raising.
+
+        With refresh=True, today's design shell is refilled with the newly
+        curated articles instead of calling the builder; a full redesign only
+        happens when there's no shell for today or the stories no longer fit.
+
+        With delta=True, and an article pool already gathered today, the
+        gatherers only look for stories newer than the pool. Too few new
+        stories since the last curation and today's edition is reused as-is;
+        otherwise the whole pool is re-curated and refilled into today's design
+        (delta implies refresh).
+
+        Extra editions (config.editions_file) are selected from the same
+        gather and curation and built alongside the main edition; runs that
+        don't call the builder (refreshes, kept deltas) leave them as they were.
+
+        Runs hold a lock in the state directory, so a run that starts while
+        another is in progress waits for it. A full run for a day whose
+        edition is already published (and wasn't degraded) then reuses that
+        edition instead of generating it again, unless force=True.
+        """
+        if not self.persist:
+            self._start_logging()
+            return await self._run_pipeline(refresh, delta)
+
+        today = get_today_date()
+        await self._acquire_run_lock(edition_id(today))
+        try:
+            # Another run may have saved while this one waited: start from
+            # what it left, so the saves at the end don't overwrite it
+            self._start_logging()
+            self._load_learned_state()
+            if not (refresh or delta or force):
+                html = self._reuse_published_edition(today)
+                if html is not None:
+                    return html
+            return await self._run_pipeline(refresh, delta)
+        finally:
+            self.run_lock.release()
+
+    async def _acquire_run_lock(self, label: str):
+        """
+        Take the run lock, waiting while another live run holds it. label
+        says what this run is producing (an edition ID, a backfill).
+        """
+        waited = False
+        while not self.run_lock.try_acquire(label):
+            if not waited:
+                holder = self.run_lock.holder()
+                if holder:
+                    started = datetime.fromtimestamp(holder["acquired_at"])
+                    other = (
+                        f"{holder['edition_id']}, pid {holder['pid']} on "
+                        f"{holder['host']}, started {started:%H:%M:%S}"
+                    )
+                else:
+                    other = "starting up"
+                self.reporter.print(
+                    f"[dim]Another run is in progress ({other}) - waiting for it[/dim]"
+                )
+                waited = True
+            await asyncio.sleep(LOCK_POLL_SECONDS)
+        if waited:
+            self.reporter.print("[dim]Other run finished[/dim]")
+
+    def _reuse_published_edition(self, date: str) -> Optional[str]:
+        """A day's published edition to reuse, unless it was degraded."""
+        manifest = self.editions.load_manifest(date)
+        html = self.editions.load_html(date)
+        if manifest is None or html is None:
+            return None
+        if manifest["degraded"]:
+            self.reporter.print(
+                f"[dim]Edition {manifest['edition_id']} was published degraded "
+                "- generating it again[/dim]"
+            )
+            return None
+
+        self.state.reused_edition = manifest["edition_id"]
+        self.reporter.print(
+            f"[dim]Edition {manifest['edition_id']} was already published at "
+            f"{manifest['published_at']} - reusing it[/dim]"
+        )
+        return html
+
+    async def _run_pipeline(self, refresh: bool, delta: bool) -> str:
+        """Run the pipeline once (holding the run lock)."""
+        self.deadline.restart()
+        self.pool = ArticlePool.for_date(self.config.state_dir, get_today_date())
+        delta = delta and len(self.pool) > 0 and self.pool.last_gathered_at is not None
+        mode = "delta" if delta else "refresh" if refresh else "full"
+        try:
+            with (
+                self.tracer.activate(),
+                use_cassette(self.cassette),
+                span("run", refresh=refresh, delta=delta),
+            ):
+                html = await self._run_stages(refresh or delta, delta)
+            self._record_metrics(html, mode)
+            return html
+        finally:
+            # Keep observed latencies for the next run's routing, gatherer
+            # yields for the next search split, and token calibrations
+            if self.persist:
+                self.router.save()
+                self.agent_stats.save()
+                self.token_estimator.save()
+            self._export_trace()
+            if isinstance(self.cassette, CassetteRecorder):
+                self.cassette.save()
+                self.reporter.print(f"[dim]Cassette recorded to {self.cassette.path}[/dim]")
+
+    def _record_metrics(self, html: str, mode: str):
+        """Append the run's metrics to the warehouse (not for replays)."""
+        # Replayed latencies aren't real, so they'd skew the baselines
+        if not self.persist:
+            return
+        try:
+            self.metrics_store.record(
+                run_id=self.tracer.trace_id,
+                started_at=self.state.started_at,
+                edition_date=get_today_date(),
+                mode=mode,
+                metrics=collect_run_metrics(self.tracer.spans, self.state, html),
+            )
+        except Exception as e:
+            # Metrics must never fail the run
+            self.logger.warning("Recording run metrics failed: %s", e)
+
+    def _export_trace(self):
+        """Write the run's trace to the configured file and/or collector."""
+        if self.config.trace_file:
+            self.tracer.write_chrome_trace(self.config.trace_file)
+            self.reporter.print(f"[dim]Trace written to {self.config.trace_file}[/dim]")
+        if self.config.otlp_endpoint:
+            try:
+                self.tracer.export_otlp(self.config.otlp_endpoint)
+            except Exception as e:
+                # Tracing must never fail the run
+                self.logger.warning("OTLP export failed: %s", e)
+
+    async def _run_stages(self, refresh: bool, delta: bool) -> str:
+        """Run the three stages in order, degrading where needed."""
 
-        # Stage 1: Gather news
-        await self._stage_1_gather()
+        # Stage 1: Gather news (only what's new since the pool, for deltas)
+        gathered_at = datetime.now()
+        new_articles = await self._stage_1_gather(delta)
+        self.pool.last_gathered_at = gathered_at
+        if self.persist:
+            self.pool.save()
+
+        # Delta with too little news: keep today's selection
+        if (
+            delta
+            and self.pool.selected_uuids
+            # Counted since the last curation, so slow news still adds up
+            and self.pool.uncurated < self.config.delta_recurate_threshold
+        ):
+            self.reporter.print(
+                f"[dim]{new_articles} new articles, {self.pool.uncurated} since "
+                f"the last curation (re-curating at "
+                f"{self.config.delta_recurate_threshold}) - keeping today's "
+                "selection[/dim]"
+            )
+            self.state.curation_result = CurationResult(
+                selected_uuids=list(self.pool.selected_uuids),
+                reasoning="Kept from the day's earlier curation (delta run)",
+            )
+            html = self.editions.load_html(get_today_date())
+            if html is not None:
+                return html
+            # No edition on disk: rebuild from the kept selection
+            await self._stage_3_build()
+            return self._publish_build()
 
         # Check if we have enough articles
-        if self.state.total_articles_gathered < 5:
-            raise ValueError(
-                f"Insufficient articles gathered: {self.state.total_articles_gathered} "
-                f"(need at least 5)"
+        if self.state.total_articles_gathered < MIN_ARTICLES:
+            reason = (
+                f"only {self.state.total_articles_gathered} articles gathered "
+                f"(need at least {MIN_ARTICLES})"
             )
+            previous = self._load_previous_edition()
+            if previous:
+                self._degrade("republished previous edition", reason)
+                return previous
+            self._degrade("local template", reason)
+            return self._render_locally(self.state.all_articles)
 
         # Stage 2: Curate
         await self._stage_2_curate()
+        if self.state.curation_result:
+            self.pool.selected_uuids = list(self.state.curation_result.selected_uuids)
+            self.pool.uncurated = 0
+            if self.persist:
+                self.pool.save()
+            self._record_agent_stats()
 
-        # Stage 3: Build webpage
-        await self._stage_3_build()
+        # Refresh: refill today's design without the builder
+        if refresh:
+            refilled = self._refill_shell()
+            if refilled is not None:
+                # Republish the shell too: it's still today's design
+                html, shell = refilled
+                return self._publish(html, self.state.selected_articles, shell)
 
-        if not self.state.build_result or not self.state.build_result.success:
-            raise ValueError("Failed to build webpage")
+        # Stage 3: Build webpage (and any extra editions, concurrently)
+        nudge, edition_nudges = self._draw_nudges()
+        await asyncio.gather(
+            self._stage_3_build(nudge), self._build_editions(edition_nudges)
+        )
+        return self._publish_build()
 
-        return self.state.build_result.html_content
+    def _publish_build(self) -> str:
+        """Publish the builder's page, or render locally if the build failed."""
+        if self.state.build_result and self.state.build_result.success:
+            html = self.state.build_result.html_content
+            shell = compile_shell(html)
+            if shell:
+                self.reporter.print(
+                    f"[dim]Design shell cached ({shell['slot_count']} slots)[/dim]"
+                )
+            return self._publish(html, self.state.selected_articles, shell)
 
-    async def _stage_1_gather(self):
-        """Stage 1: Run 2 specialized gatherer agents in parallel."""
-        self.console.print("\n[bold cyan]Stage 1: Gathering News[/bold cyan]")
-        self.console.print("Launching 2 specialized agents...\n")
+        return self._render_locally(self.state.selected_articles)
 
-        # Create MAINSTREAM agent (1 search)
-        mainstream_prompt = get_gatherer_prompt(AgentType.MAINSTREAM)
-        mainstream_agent = GathererAgent(
-            client=self.client,
-            agent_type=AgentType.MAINSTREAM,
-            prompt_template=mainstream_prompt,
-            max_searches=1,
+    @traced("refill")
+    def _refill_shell(self) -> Optional[tuple[str, Shell]]:
+        """
+        Refill today's cached design shell with the selected articles.
+
+        Returns (html, the shell it was filled from), or None (meaning: do a
+        full build) when there's no shell for today or the new selection has
+        more stories than the shell has slots.
+        """
+        shell = self.editions.load_shell(get_today_date())
+        articles = self.state.selected_articles
+
+        if shell is None:
+            self.reporter.print("[dim]No design shell for today - full redesign[/dim]")
+            return None
+        if len(articles) > shell["slot_count"]:
+            self.reporter.print(
+                f"[dim]{len(articles)} stories don't fit {shell['slot_count']} "
+                "slots - full redesign[/dim]"
+            )
+            return None
+
+        html = fill_shell(shell, articles)
+        self.state.refreshed_from_shell = True
+        self.reporter.print(
+            f"[dim]Refreshed today's design with {len(articles)} stories "
+            "(no builder call)[/dim]"
         )
+        return html, shell
 
-        # Create DEEP_CUTS agent (3 searches)
-        deep_cuts_prompt = get_gatherer_prompt(AgentType.DEEP_CUTS)
-        deep_cuts_agent = GathererAgent(
-            client=self.client,
-            agent_type=AgentType.DEEP_CUTS,
-            prompt_template=deep_cuts_prompt,
-            max_searches=3,
+    @traced("render_locally")
+    def _render_locally(self, articles: list[Article]) -> str:
+        """Render with the local template, or republish if even that fails."""
+        try:
+            tired = detect_tired_aesthetics(load_design_memory())
+            result = render_fallback_page(articles, tired=tired)
+        except Exception as e:
+            previous = self._load_previous_edition()
+            if previous is None:
+                raise
+            self._degrade("republished previous edition", f"local template failed: {e}")
+            return previous
+
+        self.state.build_result = result
+        if self.persist:
+            save_design_summary(
+                {"date": get_today_date(), "brief": result.design_rationale}
+            )
+        self.reporter.print(
+            f"[dim]Local template rendered in {result.execution_time_seconds * 1000:.1f}ms[/dim]"
         )
+        html = result.html_content
+        return self._publish(html, articles, compile_shell(html))
 
-        agents = [mainstream_agent, deep_cuts_agent]
+    def _degrade(self, tier: str, reason: str):
+        """Record a degradation tier taken to stay within the deadline."""
+        self.state.degradations.append(f"{tier}: {reason}")
+        self.logger.warning("Degrading - %s: %s", tier, reason)
+        self.reporter.warn(f"Degrading to {tier} ({reason})")
 
-        # Run all agents in parallel with progress tracking
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=self.console,
-        ) as progress:
+    @property
+    def _previous_edition_path(self):
+        """Where the last published edition is kept for republishing."""
+        return self.config.state_dir / "last_edition.html"
 
-            task = progress.add_task(
-                "[cyan]Gathering news from 2 agents...", total=len(agents)
-            )
+    def _load_previous_edition(self) -> Optional[str]:
+        """Load the last published edition, if one exists."""
+        path = self._previous_edition_path
+        if path.exists():
+            return path.read_text()
+        return None
+
+    @traced("publish")
+    def _publish(
+        self, html: str, articles: list[Article], shell: Optional[Shell] = None
+    ) -> str:
+        """
+        Store the edition (and its shell) for refreshes and republishing.
+
+        The text-only page and feeds are rendered from the articles on the
+        page and stored alongside it (and copied to feeds_dir, when configured).
+        Replays publish nothing; the HTML is only returned.
+        """
+        if not self.persist:
+            return html
 
-            # Execute all agents
-            results = await asyncio.gather(
-                *[agent.execute() for agent in agents], return_exceptions=True
+        path = self._previous_edition_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(html)
+
+        companions = render_companions(articles, self.config.site_url)
+        self.editions.save(
+            get_today_date(),
+            html,
+            shell,
+            companions,
+            run_id=self.tracer.trace_id,
+            degraded=bool(self.state.degradations),
+        )
+        self._copy_to_feeds_dir(companions)
+        return html
+
+    def _copy_to_feeds_dir(self, files: dict[str, str], edition: str = "") -> None:
+        """Write published files under feeds_dir (an edition's in a subdirectory)."""
+        if not self.config.feeds_dir:
+            return
+        out_dir = self.config.feeds_dir / edition
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for name, content in files.items():
+            (out_dir / name).write_text(content)
+        self.reporter.print(f"[dim]Wrote {', '.join(files)} to {out_dir}[/dim]")
+
+    def _merge_into_pool(self, delta: bool) -> int:
+        """
+        Merge the gathered articles into today's pool.
+
+        A full run replaces the pool; a delta run keeps it and trims each
+        agent's articles down to the genuinely new ones. Returns how many
+        articles were new.
+        """
+        if delta:
+            self.state.pooled_articles = list(self.pool.articles)
+        else:
+            self.pool.articles = []
+            self.pool.uncurated = 0
+
+        new_articles = 0
+        for result in self.state.agent_results:
+            if result.success:
+                result.articles = self.pool.merge(result.articles)
+                new_articles += len(result.articles)
+        return new_articles
+
+    @traced("stage.gather")
+    async def _stage_1_gather(self, delta: bool = False) -> int:
+        """
+        Stage 1: Run 2 specialized gatherer agents in parallel.
+
+        Returns how many of the gathered articles are new to today's pool.
+        """
+        self.reporter.stage_start("gather", "Stage 1: Gathering News")
+        if delta:
+            self.reporter.print(
+                f"Launching 2 specialized agents (delta since "
+                f"{self.pool.last_gathered_at:%H:%M}, {len(self.pool)} pooled)...\n"
             )
+            agents = self._create_gatherers(
+                get_delta_instructions(
+                    self.pool.last_gathered_at, [a.title for a in self.pool.articles]
+                )
+            )
+        else:
+            self.reporter.print("Launching 2 specialized agents...\n")
+            agents = self._create_gatherers()
+        budget = self.deadline.stage_budget("gather")
+        for agent in agents:
+            agent.request_timeout = budget
+
+        # Run all agents in parallel with progress tracking
+        with self.reporter.progress(
+            f"Gathering news from {len(agents)} agents...", total=len(agents)
+        ) as advance:
+
+            # Execute all agents, stopping at the stage budget
+            futures = [asyncio.ensure_future(agent.execute()) for agent in agents]
+            for future in futures:
+                future.add_done_callback(lambda _: advance())
+            _, pending = await asyncio.wait(futures, timeout=budget)
 
             # Process results
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
+            for agent, future in zip(agents, futures):
+                if future in pending:
+                    # Out of budget - drop this agent
+                    future.cancel()
+                    result = AgentResult(
+                        agent_name=agent.name,
+                        success=False,
+                        error_message=f"Timed out after {budget:.0f}s",
+                    )
+                elif future.exception() is not None:
                     # Agent failed - create error result
-                    agent = agents[i]
-                    error_result = AgentResult(
+                    result = AgentResult(
                         agent_name=agent.name,
                         success=False,
-                        error_message=str(result),
+                        error_message=str(future.exception()),
                     )
-                    self.state.agent_results.append(error_result)
                 else:
-                    self.state.agent_results.append(result)
+                    result = future.result()
+                self.state.agent_results.append(result)
 
-                progress.update(task, advance=1)
+        if pending:
+            self._degrade(
+                "fewer gatherers",
+                f"{len(pending)}/{len(agents)} agents out of {budget:.0f}s budget",
+            )
 
-        # Summary
+        # Fold into today's pool, then summarise
+        new_articles = self._merge_into_pool(delta)
         self._print_stage_1_summary()
+        return new_articles
 
-    def _print_stage_1_summary(self):
-        """Print summary of gathering stage."""
-        total_agents = len(self.state.agent_results)
-        self.console.print("\n[bold]Stage 1 Complete[/bold]")
-        self.console.print(f"  Total articles: {self.state.total_articles_gathered}")
-        self.console.print(
-            f"  Successful agents: {self.state.successful_agents}/{total_agents}"
-        )
-        self.console.print(f"  Failed agents: {self.state.failed_agents}/{total_agents}")
-
-        if self.state.failed_agents > 0:
-            self.console.print("\n[yellow]Failed agents:[/yellow]")
-            for result in self.state.agent_results:
-                if not result.success:
-                    self.console.print(
-                        f"  - {result.agent_name}: {result.error_message}"
-                    )
+    def _create_gatherers(self, delta_instructions: str = "") -> list[GathererAgent]:
+        """
+        Create the specialized gatherer agents.
+
+        Delta runs (delta_instructions set) get a single search each.
+        """
+        if delta_instructions:
+            searches = {agent_type: 1 for agent_type in DEFAULT_SEARCHES}
+        else:
+            searches = self._allocate_searches()
+
+        return [
+            GathererAgent(
+                client=self.client,
+                agent_type=agent_type,
+                prompt_template=get_gatherer_prompt(agent_type),
+                max_searches=searches[agent_type],
+                model=self.config.gatherer_model,
+                router=self.router,
+                hedger=self.hedger,
+                delta_instructions=delta_instructions,
+            )
+            for agent_type in DEFAULT_SEARCHES
+        ]
+
+    def _allocate_searches(self) -> dict[AgentType, int]:
+        """
+        Split the run's search budget across gatherers by historical yield.
+
+        The budget is max_searches_per_agent per gatherer; each gatherer is
+        also kept within what fits the gather stage's planned time budget.
+        """
+        names = {
+            agent_type: f"Gatherer-{agent_type.value}" for agent_type in DEFAULT_SEARCHES
+        }
+        allocation = self.agent_stats.allocate(
+            defaults={names[t]: n for t, n in DEFAULT_SEARCHES.items()},
+            total=self.config.max_searches_per_agent * len(DEFAULT_SEARCHES),
+            budget_seconds=self.deadline.planned_budget("gather"),
+        )
+
+        runs = min(self.agent_stats.run_count(name) for name in names.values())
+        split = ", ".join(f"{name}={n}" for name, n in allocation.items())
+        self.reporter.print(f"[dim]Search budget: {split} ({runs} runs of history)[/dim]")
+        self.logger.info("Search allocation: %s", allocation)
 
-        # Show per-agent breakdown
-        self.console.print("\n[dim]Articles by agent:[/dim]")
+        return {agent_type: allocation[names[agent_type]] for agent_type in names}
+
+    def _record_agent_stats(self):
+        """Record each gatherer's yield (articles the curator kept) for next time."""
+        # Replayed durations aren't real, so they'd skew the search split
+        if not self.persist:
+            return
+        # Only this run's articles: a delta re-curation also keeps pooled
+        # ones, which earlier runs already counted
+        gathered = {
+            article.uuid
+            for result in self.state.agent_results
+            for article in result.articles
+        }
+        kept: dict[str, int] = {}
+        for article in self.state.selected_articles:
+            if article.uuid in gathered:
+                agent = article.gathered_by_agent
+                kept[agent] = kept.get(agent, 0) + 1
+
+        for result in self.state.agent_results:
+            if result.success:
+                self.agent_stats.observe(
+                    result.agent_name,
+                    {
+                        "searches": result.search_count,
+                        "returned": len(result),
+                        "kept": kept.get(result.agent_name, 0),
+                        "seconds": result.execution_time_seconds,
+                    },
+                )
+
+    def _print_stage_1_summary(self):
+        """Report each gatherer's outcome and the gathering totals."""
         for result in sorted(
             self.state.agent_results, key=lambda r: len(r), reverse=True
         ):
-            if result.success:
-                self.console.print(
-                    f"  {result.agent_name}: {len(result)} articles "
-                    f"({result.search_count} searches, {result.execution_time_seconds:.1f}s)"
-                )
+            self.reporter.agent_result(result)
+
+        self.reporter.stage_end(
+            "gather",
+            "Stage 1",
+            total_articles=self.state.total_articles_gathered,
+            successful_agents=self.state.successful_agents,
+            failed_agents=self.state.failed_agents,
+        )
 
+    @traced("stage.curate")
     async def _stage_2_curate(self):
-        """Stage 2: Curate articles with Opus."""
-        self.console.print("\n[bold cyan]Stage 2: Curating Articles[/bold cyan]")
+        """Stage 2: Curate articles with Opus (or rank locally if out of time)."""
+        self.reporter.stage_start("curate", "Stage 2: Curating Articles")
 
-        curator = CuratorAgent(client=self.client, prompt_template=CURATOR_PROMPT)
+        if not self.deadline.can_start():
+            self._rank_locally("no time left for the curator")
+            return
+
+        # Local pre-ranking keeps the curator's input (and latency) flat
+        with span("precurate", articles=self.state.total_articles_gathered) as pre:
+            candidates, stale = select_candidates(
+                self.state.all_articles,
+                k=self.config.curator_max_candidates,
+                max_age_hours=self.config.max_article_age_hours,
+                now=self._recency_now,
+            )
+            pre.set(candidates=len(candidates), stale=stale)
+        self.reporter.print(
+            f"[dim]Pre-curation: {len(candidates)} of "
+            f"{self.state.total_articles_gathered} articles shortlisted "
+            f"({stale} older than {self.config.max_article_age_hours:.0f}h dropped)[/dim]"
+        )
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=self.console,
-        ) as progress:
+        curator = self._create_curator()
+        budget = self.deadline.stage_budget("curate")
+        curator.request_timeout = budget
 
-            progress.add_task("[cyan]Opus is reviewing all articles...")
+        with self.reporter.progress("Opus is reviewing all articles..."):
 
-            result = await curator.execute(self.state.all_articles)
+            try:
+                result = await asyncio.wait_for(
+                    curator.execute(candidates), timeout=budget
+                )
+            except asyncio.TimeoutError:
+                result = CurationResult(
+                    success=False, error_message=f"Timed out after {budget:.0f}s"
+                )
             self.state.curation_result = result
 
         # Summary
         if result.success:
-            self.console.print("\n[bold]Stage 2 Complete[/bold]")
-            self.console.print(f"  Selected: {len(result.selected_uuids)} articles")
-            self.console.print(f"  Time: {result.execution_time_seconds:.1f}s")
-            self.console.print(f"  Reasoning: {result.reasoning}")
+            self.reporter.stage_end(
+                "curate",
+                "Stage 2",
+                selected=len(result.selected_uuids),
+                seconds=result.execution_time_seconds,
+                reasoning=result.reasoning,
+            )
         else:
-            self.console.print(f"\n[red]Stage 2 Failed: {result.error_message}[/red]")
-            raise ValueError("Curation failed")
+            self.reporter.stage_end("curate", "Stage 2", error=result.error_message)
+            self._rank_locally(f"curator failed: {result.error_message}")
+
+    @property
+    def _recency_now(self) -> Optional[datetime]:
+        """The time article ages are measured from (replays: the recording's)."""
+        return self.cassette.recorded_at if self.cassette else None
+
+    def _rank_locally(self, reason: str):
+        """Select articles without the curator (stale ones dropped first)."""
+        articles, stale = drop_stale(
+            self.state.all_articles,
+            self.config.max_article_age_hours,
+            now=self._recency_now,
+        )
+        if stale:
+            self.logger.info("Local ranking: dropped %d stale articles", stale)
+        ranked = rank_articles_locally(articles)
+        self.state.curation_result = CurationResult(
+            selected_uuids=[article.uuid for article in ranked],
+            reasoning="Ranked locally by credibility and recency.",
+        )
+        self._degrade("ranked locally", reason)
+
+    def _create_curator(self) -> CuratorAgent:
+        """Create the curator agent."""
+        curator = CuratorAgent(
+            client=self.client,
+            prompt_template=CURATOR_PROMPT,
+            model=self.config.curator_model,
+            router=self.router,
+            hedger=self.hedger,
+        )
+        curator.estimator = self.token_estimator
+        curator.input_token_budget = self.config.curator_input_token_budget
+        return curator
+
+    @traced("stage.build")
+    async def _stage_3_build(self, nudge: Optional[CreativeNudge] = None):
+        """Stage 3: Build webpage with Sonnet (drawing a nudge if none is given)."""
+        self.reporter.stage_start("build", "Stage 3: Building Webpage")
+
+        if not self.deadline.can_start():
+            self._degrade("local template", "no time left for the builder")
+            return
+
+        builder, nudge = self._create_builder(nudge=nudge)
+        today = get_today_date()
+        budget = self.deadline.stage_budget("build")
+        builder.request_timeout = budget
 
-    async def _stage_3_build(self):
-        """Stage 3: Build webpage with Sonnet."""
-        self.console.print("\n[bold cyan]Stage 3: Building Webpage[/bold cyan]")
+        with self.reporter.progress("Generating HTML webpage..."):
+
+            try:
+                result = await asyncio.wait_for(
+                    self._build_limited(builder, self.state.selected_articles),
+                    timeout=budget,
+                )
+            except asyncio.TimeoutError:
+                result = BuildResult(
+                    success=False, error_message=f"Timed out after {budget:.0f}s"
+                )
+            self.state.build_result = result
+
+        # Summary
+        if result.success:
+            self.reporter.stage_end(
+                "build",
+                "Stage 3",
+                characters=len(result.html_content),
+                seconds=result.execution_time_seconds,
+            )
+
+            # Save design summary (and the nudge used) to memory
+            if self.persist:
+                save_design_summary(
+                    {
+                        "date": today,
+                        "brief": result.design_rationale,
+                        "nudge_type": nudge["type"],
+                        "nudge_option": nudge.get("option"),
+                    }
+                )
+                self.reporter.print(f"[dim]Design summary saved to memory[/dim]")
+
+        else:
+            self.reporter.stage_end("build", "Stage 3", error=result.error_message)
+            self._degrade("local template", f"builder failed: {result.error_message}")
+
+    async def _build_limited(
+        self, builder: BuilderAgent, articles: list[Article]
+    ) -> BuildResult:
+        """Run a builder once one of the run's concurrent build slots is free."""
+        async with self._build_slots:
+            return await builder.execute(articles)
+
+    @traced("stage.editions")
+    async def _build_editions(self, nudges: dict[str, CreativeNudge]):
+        """
+        Build the extra editions concurrently from the shared curation.
+
+        Each edition filters the curated selection (topped up locally from
+        the day's other stories) and gets its own builder call and nudge
+        (from nudges, or its own nudge seed). A failed or late build falls
+        back to the local template.
+        """
+        if not self.edition_specs:
+            return
+
+        curated = self.state.selected_articles
+        # Top-ups come from here, so drop stale stories as the curator's
+        # shortlist does
+        pool, _ = drop_stale(
+            self.state.all_articles,
+            self.config.max_article_age_hours,
+            now=self._recency_now,
+        )
+        budget = self.deadline.stage_budget("build")
+        await asyncio.gather(
+            *(
+                self._build_edition(
+                    spec, spec.select(curated, pool), budget, nudges.get(spec.name)
+                )
+                for spec in self.edition_specs
+            )
+        )
+
+    async def _build_edition(
+        self,
+        spec: EditionSpec,
+        articles: list[Article],
+        budget: float,
+        nudge: Optional[CreativeNudge] = None,
+    ):
+        """Build and publish one extra edition (never raises)."""
+        if not articles:
+            self.state.editions[spec.name] = "skipped (no matching stories)"
+            self.reporter.warn(f"Edition {spec.name}: no matching stories - skipped")
+            return
+
+        try:
+            if not self.deadline.can_start():
+                result = BuildResult(success=False, error_message="no time left")
+            else:
+                builder, _ = self._create_builder(articles, edition=spec, nudge=nudge)
+                builder.request_timeout = budget
+                try:
+                    result = await asyncio.wait_for(
+                        self._build_limited(builder, articles), timeout=budget
+                    )
+                except asyncio.TimeoutError:
+                    result = BuildResult(
+                        success=False, error_message=f"Timed out after {budget:.0f}s"
+                    )
+
+            if result.success:
+                self.state.editions[spec.name] = f"built ({len(articles)} stories)"
+            else:
+                self.state.editions[spec.name] = (
+                    f"local template ({len(articles)} stories; {result.error_message})"
+                )
+                self.reporter.warn(
+                    f"Edition {spec.name}: {result.error_message} - local template"
+                )
+                tired = detect_tired_aesthetics(load_design_memory())
+                result = render_fallback_page(articles, tired=tired)
+
+            html = result.html_content
+            site_url = self.config.site_url.rstrip("/") + f"/{spec.name}/"
+            companions = render_companions(articles, site_url)
+            if self.persist:
+                self.editions.save(
+                    get_today_date(),
+                    html,
+                    compile_shell(html),
+                    companions,
+                    edition=spec.name,
+                    run_id=self.tracer.trace_id,
+                )
+                self._copy_to_feeds_dir({"index.html": html, **companions}, spec.name)
+
+        except Exception as e:
+            # An extra edition must never take the main edition down with it
+            self.logger.exception("Edition %s failed", spec.name)
+            self.state.editions[spec.name] = f"failed: {e}"
+            self.reporter.error(f"Edition {spec.name} failed: {e}")
+
+    def _nudge_sampler(self, seed: Optional[int]) -> NudgeSampler:
+        """
+        A nudge sampler (seeded so the run can be replayed), steering away
+        from nudges used in the last few days.
+        """
+        nudge_history = get_nudge_history(load_design_memory(), get_today_date())
+        return NudgeSampler(seed=seed, history=nudge_history)
+
+    def _draw_nudges(self) -> tuple[CreativeNudge, dict[str, CreativeNudge]]:
+        """
+        Draw the main edition's nudge and the extra editions' in one go.
+
+        Editions without a nudge seed of their own share the run's sampler and
+        get distinct nudge types, so a design variant can't repeat the main
+        edition's nudge. Returns (main nudge, edition name -> nudge).
+        """
+        sampler = self._nudge_sampler(self.config.nudge_seed)
+        self.state.nudge_seed = sampler.seed
+        shared = [spec.name for spec in self.edition_specs if spec.nudge_seed is None]
+        drawn = sampler.sample_distinct(1 + len(shared))
+        # More editions than nudge types: the rest may repeat
+        drawn += [sampler.sample() for _ in range(1 + len(shared) - len(drawn))]
+        return drawn[0], dict(zip(shared, drawn[1:]))
+
+    def _create_builder(
+        self,
+        articles: Optional[list[Article]] = None,
+        edition: Optional[EditionSpec] = None,
+        nudge: Optional[CreativeNudge] = None,
+    ) -> tuple[BuilderAgent, CreativeNudge]:
+        """
+        Create the builder with design memory context and a creative nudge.
+
+        articles (default: the current selection) steer the similar-designs
+        lookup. Without a nudge drawn up front (see _draw_nudges), one is
+        drawn here. Builders for extra editions use the edition's nudge seed
+        and builder model, and are named after the edition.
+        """
+        if articles is None:
+            articles = self.state.selected_articles
 
         # Load recent designs from memory
         recent = get_recent_designs(n=3)
@@ -198,51 +1007,236 @@ class NewsOrchestrator:
         tired_aesthetics_context = get_tired_aesthetics_context()
 
         # Generate creative nudge
-        nudge = generate_creative_nudge()
+        if nudge is None:
+            sampler = self._nudge_sampler(
+                edition.nudge_seed if edition else self.config.nudge_seed
+            )
+            if edition is None:
+                self.state.nudge_seed = sampler.seed
+            nudge, seed = sampler.sample(), sampler.seed
+        else:
+            seed = self.state.nudge_seed
+        self.logger.info("Creative nudge seed: %s", seed)
         nudge_context = format_nudge(nudge)
 
-        # Log what we're using
-        if nudge["type"] != "none":
-            self.console.print(f"[dim]Creative nudge: {nudge['type']}[/dim]")
-        if recent:
-            self.console.print(f"[dim]Memory: {len(recent)} recent designs loaded[/dim]")
-        if tired_aesthetics_context:
-            self.console.print("[dim]Tired aesthetics warning generated[/dim]")
+        # Pull older designs similar to today's candidate direction
+        candidate = " ".join(
+            [nudge["text"] or ""] + [article.title for article in articles]
+        )
+        similar = get_similar_designs(
+            candidate, k=3, exclude_dates=[d["date"] for d in recent]
+        )
+        similar_context = format_similar_designs(similar)
+        if similar_context:
+            recent_designs_context += "\n\n" + similar_context
 
-        # Load builder prompt template
-        builder_prompt = get_builder_prompt_template()
+        # Log what we're using
+        if edition is not None:
+            self.reporter.print(
+                f"[dim]Edition {edition.name}: {len(articles)} stories, "
+                f"nudge {nudge['type']} (seed {seed})[/dim]"
+            )
+        else:
+            if nudge["type"] != "none":
+                self.reporter.print(
+                    f"[dim]Creative nudge: {nudge['type']} (seed {seed})[/dim]"
+                )
+            if recent:
+                self.reporter.print(
+                    f"[dim]Memory: {len(recent)} recent designs loaded[/dim]"
+                )
+            if similar:
+                self.reporter.print(
+                    f"[dim]History: {len(similar)} similar past designs loaded[/dim]"
+                )
+            if tired_aesthetics_context:
+                self.reporter.print("[dim]Tired aesthetics warning generated[/dim]")
 
         builder = BuilderAgent(
             client=self.client,
-            prompt_template=builder_prompt,
+            prompt_template=BUILDER_PROMPT,
             recent_designs=recent_designs_context,
             tired_aesthetics=tired_aesthetics_context,
             creative_nudge=nudge_context,
+            model=(edition and edition.builder_model) or self.config.builder_model,
+            router=self.router,
         )
+        builder.estimator = self.token_estimator
+        builder.input_token_budget = self.config.builder_input_token_budget
+        if edition is not None:
+            builder.name = f"{builder.name}-{edition.name}"
+        return builder, nudge
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=self.console,
-        ) as progress:
+    def backfill(self, dates: list[str], regather: bool = False) -> dict[str, str]:
+        """
+        Regenerate editions for past dates (YYYY-MM-DD) through Message Batches.
 
-            progress.add_task("[cyan]Generating HTML webpage...")
+        Each stage runs as one batch across all dates: gathering (only for
+        days without an article pool, unless regather), curation, then
+        building. Editions go to the edition store; design memory is left
+        alone. Returns date -> how that day's edition was produced.
 
-            result = await builder.execute(self.state.selected_articles)
-            self.state.build_result = result
+        Holds the run lock like a run does (it writes the same pools and
+        edition store, maybe today's), waiting for any run in progress.
+        """
+        asyncio.run(self._acquire_run_lock(f"backfill {','.join(dates)}"))
+        try:
+            self._start_logging()
+            return self._backfill(dates, regather)
+        finally:
+            self.run_lock.release()
 
-        # Summary
-        if result.success:
-            self.console.print("\n[bold]Stage 3 Complete[/bold]")
-            self.console.print(f"  HTML size: {len(result.html_content)} characters")
-            self.console.print(f"  Time: {result.execution_time_seconds:.1f}s")
+    def _backfill(self, dates: list[str], regather: bool) -> dict[str, str]:
+        """Run the three backfill batches (holding the run lock)."""
+        runner = BatchRunner(self.batch_client, self.reporter)
+        as_of = {date: datetime.strptime(date, "%Y-%m-%d") for date in dates}
+        pools = {
+            date: ArticlePool.for_date(self.config.state_dir, date) for date in dates
+        }
+        outcomes: dict[str, str] = {}
 
-            # Save design summary to memory
-            today = get_today_date()
-            summary = extract_design_summary(result.html_content, today)
-            save_design_summary(summary)
-            self.console.print(f"[dim]Design summary saved to memory[/dim]")
+        # Batch 1: Gather
+        gatherers: dict[str, tuple[str, GathererAgent]] = {}
+        for date in dates:
+            if regather or not len(pools[date]):
+                pools[date].articles = []
+                for agent in self._create_gatherers():
+                    agent.as_of = as_of[date]
+                    gatherers[batch_custom_id(date, agent.name)] = (date, agent)
 
-        else:
-            self.console.print(f"\n[red]Stage 3 Failed: {result.error_message}[/red]")
-            raise ValueError("Build failed")
+        if gatherers:
+            self.reporter.stage_start(
+                "batch_gather", f"Batch 1: Gathering ({len(gatherers)} requests)"
+            )
+            responses = runner.run(
+                {cid: agent.batch_request() for cid, (_, agent) in gatherers.items()}
+            )
+            for cid, (date, agent) in gatherers.items():
+                response = responses[cid]
+                if isinstance(response, BatchRequestError):
+                    result = AgentResult(
+                        agent_name=agent.name, success=False, error_message=str(response)
+                    )
+                else:
+                    result = agent.result_from_response(response)
+                if result.success:
+                    pools[date].merge(result.articles)
+                else:
+                    self.reporter.warn(f"{date} {agent.name}: {result.error_message}")
+            for date in {date for date, _ in gatherers.values()}:
+                pools[date].last_gathered_at = datetime.now()
+                pools[date].save()
+
+        # Batch 2: Curate
+        curators: dict[str, tuple[str, CuratorAgent]] = {}
+        for date in dates:
+            if len(pools[date]) < MIN_ARTICLES:
+                outcomes[date] = f"skipped (only {len(pools[date])} articles)"
+                continue
+            curator = self._create_curator()
+            curator.as_of = as_of[date]
+            curators[batch_custom_id(date, curator.name)] = (date, curator)
+
+        self.reporter.stage_start(
+            "batch_curate", f"Batch 2: Curating ({len(curators)} requests)"
+        )
+        candidates = {
+            date: select_candidates(
+                pools[date].articles,
+                k=self.config.curator_max_candidates,
+                max_age_hours=self.config.max_article_age_hours,
+                now=as_of[date] + timedelta(days=1),
+            )[0]
+            for date, _ in curators.values()
+        }
+        responses = runner.run(
+            {
+                cid: curator.batch_request(candidates[date])
+                for cid, (date, curator) in curators.items()
+            }
+        )
+        for cid, (date, curator) in curators.items():
+            response = responses[cid]
+            if isinstance(response, BatchRequestError):
+                result = CurationResult(success=False, error_message=str(response))
+            else:
+                result = curator.result_from_response(response)
+            if result.success:
+                pools[date].selected_uuids = result.selected_uuids
+            else:
+                self.reporter.warn(
+                    f"{date} curator: {result.error_message} - ranking locally"
+                )
+                ranked = rank_articles_locally(pools[date].articles)
+                pools[date].selected_uuids = [article.uuid for article in ranked]
+            pools[date].save()
+
+        # Batch 3: Build
+        builders: dict[str, tuple[str, BuilderAgent, list[Article]]] = {}
+        for date, _ in curators.values():
+            by_uuid = {article.uuid: article for article in pools[date].articles}
+            selected = [
+                by_uuid[uuid] for uuid in pools[date].selected_uuids if uuid in by_uuid
+            ]
+            builder, _ = self._create_builder(selected)
+            builder.as_of = as_of[date]
+            builders[batch_custom_id(date, builder.name)] = (date, builder, selected)
+
+        self.reporter.stage_start(
+            "batch_build", f"Batch 3: Building ({len(builders)} requests)"
+        )
+        responses = runner.run(
+            {
+                cid: builder.batch_request(selected)
+                for cid, (_, builder, selected) in builders.items()
+            }
+        )
+        tired = detect_tired_aesthetics(load_design_memory())
+        for cid, (date, builder, selected) in builders.items():
+            response = responses[cid]
+            if isinstance(response, BatchRequestError):
+                result = BuildResult(success=False, error_message=str(response))
+            else:
+                result = builder.result_from_response(response, selected)
+            degraded = not result.success
+            if result.success:
+                outcomes[date] = "built"
+            else:
+                outcomes[date] = f"local template (builder failed: {result.error_message})"
+                result = render_fallback_page(selected, date=as_of[date], tired=tired)
+            html = result.html_content
+            companions = render_companions(
+                selected, self.config.site_url, date=as_of[date]
+            )
+            self.editions.save(
+                date,
+                html,
+                compile_shell(html),
+                companions,
+                run_id=self.tracer.trace_id,
+                degraded=degraded,
+            )
+
+        return outcomes
+
+    def render_prompts(self) -> dict[str, str]:
+        """
+        Render every agent's prompt without calling the API.
+
+        Uses whatever articles are already in the pipeline state (none for a
+        fresh dry run), so the prompt scaffolding and context can be checked.
+        Takes no lock: while a run holds it, that run's log is appended to
+        rather than rotated away.
+        """
+        self._start_logging(rotate=self.run_lock.holder() is None)
+        prompts = {
+            agent.name: agent.render_prompt() for agent in self._create_gatherers()
+        }
+
+        curator = self._create_curator()
+        prompts[curator.name] = curator.render_prompt(self.state.all_articles)
+
+        builder, _ = self._create_builder()
+        prompts[builder.name] = builder.render_prompt(self.state.selected_articles)
+
+        return prompts
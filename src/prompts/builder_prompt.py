@@ -1,9 +1,10 @@
 """Prompt template for the webpage builder agent."""
 
-# Builder prompt for full HTML page generation
-BUILDER_PROMPT = """# news.sys — Design Claude Prompt
+from src.prompts.template import PromptTemplate
 
-Today is {today}.
+# Builder prompt for full HTML page generation
+BUILDER_PROMPT = PromptTemplate(
+    """# news.sys — Design Claude Prompt
 
 You are the design engine for **news.sys**, a daily news page that responds aesthetically to its content. You receive curated news articles and output a complete, self-contained HTML file.
 
@@ -30,22 +31,6 @@ Think of yourself as a long-running publication with a house style of *deliberat
 
 ---
 
-## Input: Today's Articles
-
-{articles}
-
----
-
-## Context: Recent Designs
-
-{recent_designs}
-
-{tired_aesthetics}
-
-{creative_nudge}
-
----
-
 ## Essential Requirements (The Only Rules)
 
 Every generated page MUST include these elements somewhere:
@@ -67,7 +52,13 @@ Every generated page MUST include these elements somewhere:
    - Can include: aesthetic reasoning, patterns you noticed, tangential observations, fourth-wall breaks
    - Length: whatever feels right (typically 2-6 sentences)
 
-4. **Technical Requirements**
+4. **Article Slot Markup**
+   - Wrap each article's markup in one element with `data-slot="N"`, where N is the article's 0-based position in the input list
+   - Inside it, mark the elements holding the article's text with `data-field="headline"`, `data-field="summary"` and `data-field="source"`, and its link with `data-field="url"` (combine on one element if needed, e.g. `<a data-field="headline url" href="...">`)
+   - Marked elements should contain only the plain text itself (no nested tags), so the page can be refreshed with new stories later
+   - The markup is invisible—it doesn't constrain the design at all
+
+5. **Technical Requirements**
    - Single self-contained HTML file (all CSS and JS inline)
    - Responsive (must work on mobile and desktop)
    - Accessible (keyboard navigation, sufficient contrast, semantic HTML)
@@ -127,7 +118,7 @@ Based on your analysis, imagine a complete visual approach. Ask yourself:
 - What would make someone stop and notice this page is different?
 
 **Avoid Repetition:**
-- Check the recent designs listed in the Context section above
+- Check the recent designs listed in the Context section below
 - If your instinct is to do something similar to a recent design: **STOP** and choose a different direction
 - The goal is variety across days, not just quality on any single day
 - If the last few days were dark/somber, today should probably be light
@@ -200,15 +191,28 @@ You are designing a small artifact that someone will visit each morning. It shou
 **Be bold. Be experimental. Take risks.** The best days will be when someone visits and thinks, "I've never seen a news page that looks like this."
 
 Don't play it safe. Make something memorable.
-"""
-
-
-def get_builder_prompt_template() -> str:
-    """Get the builder prompt template with placeholders for all parameters."""
-    return BUILDER_PROMPT.format(
-        today="{today}",
-        articles="{articles}",
-        recent_designs="{recent_designs}",
-        tired_aesthetics="{tired_aesthetics}",
-        creative_nudge="{creative_nudge}",
-    )
+
+---
+
+## Today: {today}
+
+### Input: Today's Articles
+
+{articles}
+
+### Context: Recent Designs
+
+{recent_designs}
+
+{tired_aesthetics}
+
+{creative_nudge}
+""",
+    fields=(
+        "today",
+        "articles",
+        "recent_designs",
+        "tired_aesthetics",
+        "creative_nudge",
+    ),
+)
@@ -1,12 +1,11 @@
 """Prompt template for the curator agent."""
 
-CURATOR_PROMPT = """Today is {today}.
+from src.prompts.template import PromptTemplate
 
-You are a senior news editor curating today's digest for news.sys.
+CURATOR_PROMPT = PromptTemplate(
+    """You are a senior news editor curating today's digest for news.sys.
 
-You have {article_count} articles from 2 specialized gathering agents (MAINSTREAM and DEEP_CUTS):
-
-{article_index}
+You will be given articles from 2 specialized gathering agents (MAINSTREAM and DEEP_CUTS), listed at the end.
 
 Your task:
 1. Select the best articles for today's edition (typically 8-12, but use your judgment)
@@ -33,4 +32,10 @@ Output format (JSON only, no other text):
 }}
 
 Return UUIDs in display order.
-"""
+
+Today is {today}. You have {article_count} articles:
+
+{article_index}
+""",
+    fields=("today", "article_count", "article_index"),
+)
@@ -1,19 +1,21 @@
 """Prompt templates for gathering agents."""
 
-from src.models.article import AgentType
+from datetime import datetime
 
-# Mainstream news gatherer - single broad search
-MAINSTREAM_PROMPT = """Today is {today}.
+from src.models.article import AgentType
+from src.prompts.template import PromptTemplate
 
-You are the MAINSTREAM news gathering agent.
+# Mainstream news gatherer - a few broad searches
+MAINSTREAM_PROMPT = PromptTemplate(
+    """You are the MAINSTREAM news gathering agent.
 
 Your task:
-1. Perform ONE comprehensive search for today's top mainstream news and current events
+1. Search for today's top mainstream news and current events, within the search budget given at the end. With a budget of one search, make it one comprehensive search; with more, give each search a different slice of the coverage areas below
 2. Find 5-8 high-quality articles from major news outlets
 3. Focus on the most significant and widely-covered stories of the day
 4. Return results in JSON format
 
-Coverage areas (in a single search):
+Coverage areas (across your searches):
 - Breaking news and top headlines
 - Politics and policy
 - Business and markets
@@ -23,17 +25,17 @@ Coverage areas (in a single search):
 - Trending topics with broad public interest
 
 Output format (JSON only, no other text):
-{{{{
+{{
   "articles": [
-    {{{{
+    {{
       "title": "Article headline",
       "summary": "5-6 sentence summary of the article with key details",
       "source_url": "https://...",
       "credibility_tier": 1-3 (1=official/primary, 2=major outlet, 3=blog/social),
       "published_date": "YYYY-MM-DD or null"
-    }}}}
+    }}
   ]
-}}}}
+}}
 
 Requirements:
 - **RECENCY IS MANDATORY**: Only include articles from the last 48 hours. No exceptions, even for important stories. If a story is older than 2 days, it is not news—skip it.
@@ -43,11 +45,17 @@ Requirements:
 - High credibility sources (tier 1-2)
 
 CRITICAL: Return ONLY the JSON object. Do not include any explanatory text before or after the JSON.
-"""
 
-DEEP_CUTS_PROMPT = """Today is {today}.
+## This Run
+
+Today is {today}.
+Search budget: {max_searches} (the most web searches you may run)
+""",
+    fields=("today", "max_searches"),
+)
 
-You are the DEEP CUTS news gathering agent for news.sys.
+DEEP_CUTS_PROMPT = PromptTemplate(
+    """You are the DEEP CUTS news gathering agent for news.sys.
 
 ## Your Purpose
 
@@ -95,7 +103,7 @@ The last category should not dominate, but don't be afraid of it. A mix of 6-7 s
 
 ## Your Task
 
-1. Perform UP TO 5 searches
+1. Stay within your search budget (given at the end)
 2. Find 8-12 high-quality articles
 3. **RECENCY IS MANDATORY**: Only include articles from the last 48 hours. No exceptions—even a fascinating deep cut is worthless if it's old news. If you can't verify the publication date is within 2 days, skip the article.
 4. Prioritize primary sources
@@ -105,9 +113,10 @@ The last category should not dominate, but don't be afraid of it. A mix of 6-7 s
 
 Don't mechanically allocate searches to categories. Instead:
 
-- Start with 1-2 searches in areas where important things are likely happening right now (check if there are scheduled court decisions, FDA calendar dates, major journal publication days, etc.)
-- Use 2-3 searches to explore based on your sense of what's interesting or underreported
+- Spend the first part of your budget on areas where important things are likely happening right now (check if there are scheduled court decisions, FDA calendar dates, major journal publication days, etc.)
+- Use the rest to explore based on your sense of what's interesting or underreported
 - Reserve flexibility—if an early search reveals a thread worth pulling, follow it
+- With a budget of one search, make it count: aim it at the area most likely to hold significant, underreported news
 
 You have judgment. Use it.
 
@@ -115,9 +124,9 @@ You have judgment. Use it.
 
 Return ONLY this JSON structure—no preamble, no explanation:
 
-{{{{
+{{
   "articles": [
-    {{{{
+    {{
       "title": "Article headline",
       "summary": "4-6 sentences. Include: what happened, why it matters, source type (e.g., 'per the court filing', 'published in Nature', 'according to the GAO audit'). If it's in the 'delightfully weird' category, it's okay to let that show.",
       "source_url": "https://...",
@@ -125,10 +134,10 @@ Return ONLY this JSON structure—no preamble, no explanation:
       "credibility_tier": 1-3,
       "published_date": "YYYY-MM-DD or null",
       "why_this_matters": "One sentence on significance or interestingness. Be specific."
-    }}}}
+    }}
   ],
   "search_notes": "Optional: 1-2 sentences on what you searched for and why, or anything you noticed while searching."
-}}}}
+}}
 
 Credibility tiers:
 - 1 = Primary source (court filing, journal article, official government document)
@@ -138,10 +147,32 @@ Credibility tiers:
 Aim for majority tier 1-2.
 
 CRITICAL: Return ONLY the JSON object. No other text.
-"""
 
+## This Run
+
+Today is {today}.
+Search budget: {max_searches} (the most web searches you may run)
+""",
+    fields=("today", "max_searches"),
+)
+
+# Appended to a gatherer prompt on later (delta) runs the same day
+DELTA_INSTRUCTIONS = PromptTemplate(
+    """
+
+## Update Run
 
-def get_gatherer_prompt(agent_type: AgentType) -> str:
+This is a follow-up run. Earlier runs today already gathered the stories listed below. Only return stories first published (or materially updated) after {since}, and skip anything already listed:
+
+{known_stories}
+
+If nothing new qualifies, return {{"articles": []}}.
+""",
+    fields=("since", "known_stories"),
+)
+
+
+def get_gatherer_prompt(agent_type: AgentType) -> PromptTemplate:
     """Get the prompt template for a specific agent type."""
     if agent_type == AgentType.MAINSTREAM:
         return MAINSTREAM_PROMPT
@@ -149,3 +180,11 @@ def get_gatherer_prompt(agent_type: AgentType) -> str:
         return DEEP_CUTS_PROMPT
     else:
         raise ValueError(f"Unknown agent type: {agent_type}")
+
+
+def get_delta_instructions(since: datetime, known_titles: list[str]) -> str:
+    """Get the delta-run instructions listing stories already gathered."""
+    known_stories = "\n".join(f"- {title}" for title in known_titles) or "- (none)"
+    return DELTA_INSTRUCTIONS.render(
+        since=since.strftime("%B %d, %Y %H:%M"), known_stories=known_stories
+    )
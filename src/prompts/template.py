@@ -0,0 +1,73 @@
+"""Prompt templates compiled once into static and dynamic segments.
+
+Templates use str.format placeholders ({name}, with {{ and }} for literal
+braces) but are parsed a single time, at import. Rendering is one join over
+the pre-split segments, and a template declares its fields up front so a
+missing or misspelt placeholder fails at load time rather than mid-run.
+"""
+
+from string import Formatter
+from typing import NamedTuple, Optional
+
+
+class Segment(NamedTuple):
+    """A run of static text, then the field filled in after it (if any)."""
+
+    text: str
+    field: Optional[str]
+
+
+class PromptTemplate:
+    """A prompt template parsed into segments once, rendered with one join."""
+
+    def __init__(self, source: str, fields: tuple[str, ...]):
+        segments = []
+        for text, field, format_spec, conversion in Formatter().parse(source):
+            if field is not None and (
+                not field.isidentifier() or format_spec or conversion
+            ):
+                raise ValueError(
+                    f"Unsupported placeholder {{{field}}}: only plain {{name}} fields"
+                )
+            segments.append(Segment(text, field))
+
+        found = {segment.field for segment in segments if segment.field is not None}
+        missing = sorted(set(fields) - found)
+        extra = sorted(found - set(fields))
+        if missing or extra:
+            raise ValueError(
+                f"Template fields don't match: missing {missing}, unexpected {extra}"
+            )
+
+        self.fields = frozenset(fields)
+        self.segments: tuple[Segment, ...] = tuple(segments)
+
+    @property
+    def static_prefix(self) -> str:
+        """Text before the first field: identical on every render (cacheable).
+
+        Templates keep their instructions first and the per-run fields last, so
+        this is nearly the whole prompt. Escaped braces split segments without a
+        field, so the prefix runs on through them.
+        """
+        parts = []
+        for text, field in self.segments:
+            parts.append(text)
+            if field is not None:
+                break
+        return "".join(parts)
+
+    def render(self, **values: str) -> str:
+        """Fill every field; missing or unknown fields raise ValueError."""
+        if values.keys() != self.fields:
+            missing = sorted(self.fields - values.keys())
+            extra = sorted(values.keys() - self.fields)
+            raise ValueError(
+                f"Template values don't match: missing {missing}, unexpected {extra}"
+            )
+        parts = []
+        for text, field in self.segments:
+            parts.append(text)
+            if field is not None:
+                parts.append(str(values[field]))
+        return "".join(parts)
@@ -0,0 +1,207 @@
+"""Long-running service mode: scheduled editions served from memory.
+
+One process keeps the Anthropic client (and its connection pool), the
+compiled prompt templates and the parsed design memory warm across runs.
+The latest edition is held in memory and served by a small local HTTP
+server with ETags and a gzip body compressed once per edition.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Optional
+
+from src.config import Config
+from src.orchestrator import NewsOrchestrator
+from src.utils.design_memory import get_today_date
+from src.utils.edition_store import EditionStore
+from src.utils.file_logger import get_logger
+
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+    from src.utils.reporter import Reporter
+
+# Paths the edition is served at
+EDITION_PATHS = ("/", "/index.html")
+
+
+@dataclass(frozen=True)
+class ServedEdition:
+    """An edition ready to serve: raw and gzipped bodies plus its ETag."""
+
+    body: bytes
+    gzipped: bytes
+    etag: str
+    published_at: datetime
+
+    @classmethod
+    def from_html(cls, html: str) -> "ServedEdition":
+        """Encode, compress and fingerprint an edition once, up front."""
+        body = html.encode("utf-8")
+        return cls(
+            body=body,
+            gzipped=gzip.compress(body, compresslevel=9),
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            published_at=datetime.now(timezone.utc),
+        )
+
+
+def _accepts_gzip(header: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip (and not with q=0)."""
+    for coding in header.split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            return params.replace(" ", "").lower() not in ("q=0", "q=0.0", "q=0.00")
+    return False
+
+
+class _EditionHandler(BaseHTTPRequestHandler):
+    """Serves the service's current edition."""
+
+    server_version = "news.sys"
+    service: "NewsService"
+
+    def do_GET(self):
+        self._serve(include_body=True)
+
+    def do_HEAD(self):
+        self._serve(include_body=False)
+
+    def _serve(self, include_body: bool):
+        if self.path.split("?", 1)[0] not in EDITION_PATHS:
+            self.send_error(404)
+            return
+
+        edition = self.service.edition
+        if edition is None:
+            self.send_error(503, "No edition published yet")
+            return
+
+        if_none_match = self.headers.get("If-None-Match", "")
+        etags = [tag.strip() for tag in if_none_match.split(",")]
+        if edition.etag in etags or "*" in etags:
+            self.send_response(304)
+            self.send_header("ETag", edition.etag)
+            self.end_headers()
+            return
+
+        compressed = _accepts_gzip(self.headers.get("Accept-Encoding", ""))
+        body = edition.gzipped if compressed else edition.body
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", edition.etag)
+        self.send_header(
+            "Last-Modified", format_datetime(edition.published_at, usegmt=True)
+        )
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+        if compressed:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        if include_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        get_logger().info("HTTP %s - " + format, self.address_string(), *args)
+
+
+class NewsService:
+    """
+    Runs the pipeline on a schedule and serves the latest edition.
+
+    Each scheduled run is a delta run (see NewsOrchestrator.run), so only the
+    first run of a day gathers and designs from scratch.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        reporter: "Reporter",
+        interval_minutes: float = 60.0,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+    ):
+        self.config = config
+        self.reporter = reporter
+        self.interval = timedelta(minutes=interval_minutes)
+        self.host = host
+        self.port = port
+        self.editions = EditionStore(config.state_dir / "editions")
+        self.edition: Optional[ServedEdition] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+
+        from anthropic import AsyncAnthropic
+
+        # Created once: later runs reuse its HTTP connection pool
+        self.client: "AsyncAnthropic" = AsyncAnthropic(
+            api_key=config.anthropic_api_key
+        )
+
+    def publish(self, html: str) -> None:
+        """Swap in a new edition for the HTTP server."""
+        self.edition = ServedEdition.from_html(html)
+        self.reporter.print(
+            f"[dim]Serving edition {self.edition.etag} "
+            f"({len(self.edition.body)} bytes, {len(self.edition.gzipped)} gzipped)[/dim]"
+        )
+
+    def start_server(self) -> None:
+        """Start the HTTP server on a background thread."""
+        handler = type("EditionHandler", (_EditionHandler,), {"service": self})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        thread.start()
+        self.reporter.print(
+            f"[bold]Serving news.sys at http://{self.host}:{self.port}/[/bold]"
+        )
+
+    def stop_server(self) -> None:
+        """Stop the HTTP server."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    async def run_edition(self) -> None:
+        """Run the pipeline once with the warm client and publish the result."""
+        started = datetime.now()
+        self.reporter.stage_start("edition", f"Edition run at {started:%H:%M}")
+
+        orchestrator = NewsOrchestrator(self.config, self.reporter, client=self.client)
+        html = await orchestrator.run(delta=True)
+        self.publish(html)
+
+        elapsed = (datetime.now() - started).total_seconds()
+        self.reporter.print(f"[dim]Edition run finished in {elapsed:.1f}s[/dim]")
+
+    async def run_forever(self) -> None:
+        """Serve the stored edition right away, then run on the schedule."""
+        stored = self.editions.load_html(get_today_date())
+        previous = self.config.state_dir / "last_edition.html"
+        if stored is None and previous.exists():
+            stored = previous.read_text()
+        if stored is not None:
+            self.publish(stored)
+
+        self.start_server()
+        try:
+            while True:
+                try:
+                    await self.run_edition()
+                except Exception as e:
+                    # Keep serving the previous edition; try again next slot
+                    get_logger().exception("Edition run failed")
+                    self.reporter.error(f"Edition run failed: {e}")
+
+                next_run = datetime.now() + self.interval
+                self.reporter.print(f"[dim]Next run at {next_run:%H:%M}[/dim]")
+                await asyncio.sleep(self.interval.total_seconds())
+        finally:
+            self.stop_server()
@@ -0,0 +1,120 @@
+"""Persistent per-gatherer yield stats, and the search budget split built on them."""
+
+import json
+import statistics
+from pathlib import Path
+from typing import TypedDict
+
+# Runs kept per agent
+STATS_WINDOW = 30
+
+# Searches any one gatherer may get in a run
+MIN_SEARCHES = 1
+MAX_SEARCHES = 5
+
+# Pseudo-searches at the pooled yield blended into each agent's own yield,
+# so one lucky or unlucky run doesn't swing the split
+PRIOR_SEARCHES = 6
+
+
+class AgentRun(TypedDict):
+    """One gatherer's outcome in one run."""
+
+    searches: int
+    returned: int  # Articles the agent returned
+    kept: int  # Of those, articles the curator selected
+    seconds: float
+
+
+class AgentStats:
+    """Sliding window of gatherer outcomes per agent name."""
+
+    def __init__(self, path: Path | None = None):
+        self.path = path
+        self._runs: dict[str, list[AgentRun]] = {}
+
+        if path and path.exists():
+            try:
+                self._runs = json.loads(path.read_text())
+            except (json.JSONDecodeError, ValueError):
+                # If file is corrupted, start fresh
+                self._runs = {}
+
+    def observe(self, agent: str, run: AgentRun) -> None:
+        """Record one run's outcome for an agent."""
+        runs = self._runs.setdefault(agent, [])
+        runs.append(run)
+        del runs[:-STATS_WINDOW]
+
+    def run_count(self, agent: str) -> int:
+        """Runs on record for an agent."""
+        return len(self._runs.get(agent, []))
+
+    def _totals(self, agent: str) -> tuple[int, int]:
+        """Articles kept and searches spent over an agent's window."""
+        runs = self._runs.get(agent, [])
+        return sum(r["kept"] for r in runs), sum(r["searches"] for r in runs)
+
+    def seconds_per_search(self, agent: str) -> float | None:
+        """Median seconds an agent's runs took per search, or None if unknown."""
+        runs = self._runs.get(agent, [])
+        if not runs:
+            return None
+        return statistics.median(r["seconds"] / max(r["searches"], 1) for r in runs)
+
+    def allocate(
+        self, defaults: dict[str, int], total: int, budget_seconds: float
+    ) -> dict[str, int]:
+        """
+        Split a run's total searches across agents.
+
+        Each agent is weighted by its default share scaled by how well its
+        searches have paid off (articles kept per search, relative to the
+        pool), then searches are handed out one at a time to the agent with
+        the highest weight per search held (D'Hondt). An agent is capped at
+        what fits in budget_seconds at its observed seconds per search.
+        With no history the split is just the defaults.
+        """
+        kept_all = searches_all = 0
+        for agent in defaults:
+            kept, searches = self._totals(agent)
+            kept_all += kept
+            searches_all += searches
+        pooled_yield = kept_all / searches_all if kept_all and searches_all else None
+
+        weights: dict[str, float] = {}
+        caps: dict[str, int] = {}
+        for agent, default in defaults.items():
+            weights[agent] = float(default)
+            if pooled_yield:
+                kept, searches = self._totals(agent)
+                smoothed = (kept + PRIOR_SEARCHES * pooled_yield) / (
+                    searches + PRIOR_SEARCHES
+                )
+                weights[agent] *= smoothed / pooled_yield
+
+            caps[agent] = MAX_SEARCHES
+            per_search = self.seconds_per_search(agent)
+            if per_search:
+                caps[agent] = max(
+                    MIN_SEARCHES, min(MAX_SEARCHES, int(budget_seconds / per_search))
+                )
+
+        allocation = {agent: MIN_SEARCHES for agent in defaults}
+        remaining = total - sum(allocation.values())
+        while remaining > 0:
+            open_agents = [a for a in allocation if allocation[a] < caps[a]]
+            if not open_agents:
+                break
+            agent = max(open_agents, key=lambda a: weights[a] / allocation[a])
+            allocation[agent] += 1
+            remaining -= 1
+
+        return allocation
+
+    def save(self) -> None:
+        """Persist the windows for the next run."""
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self._runs, indent=2))
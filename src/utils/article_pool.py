@@ -0,0 +1,97 @@
+"""The day's gathered article pool, persisted between runs."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID
+
+from src.models.article import Article
+
+
+def _story_keys(article: Article) -> tuple[str, str]:
+    """Keys that identify the same story across runs (URL and headline)."""
+    url = article.source_url.lower().split("://", 1)[-1].split("#")[0]
+    url = url.removeprefix("www.").rstrip("/")
+    title = " ".join(article.title.lower().split())
+    return url, title
+
+
+class ArticlePool:
+    """
+    Every article gathered today, plus the latest curation.
+
+    Later runs the same day gather only a delta and merge it in; articles
+    already in the pool keep their UUIDs.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.articles: list[Article] = []
+        self.selected_uuids: list[UUID] = []
+        self.last_gathered_at: datetime | None = None
+        # Articles merged in since the selection was last curated
+        self.uncurated = 0
+
+        if path.exists():
+            try:
+                data = json.loads(path.read_text())
+                self.articles = [Article.from_dict(a) for a in data["articles"]]
+                self.selected_uuids = [UUID(u) for u in data.get("selected_uuids", [])]
+                gathered = data.get("last_gathered_at")
+                self.last_gathered_at = (
+                    datetime.fromisoformat(gathered) if gathered else None
+                )
+                self.uncurated = data.get("uncurated", 0)
+            except (json.JSONDecodeError, KeyError, ValueError):
+                # If file is corrupted, start fresh
+                self.articles = []
+                self.selected_uuids = []
+                self.last_gathered_at = None
+                self.uncurated = 0
+
+    @classmethod
+    def for_date(cls, state_dir: Path, date: str) -> "ArticlePool":
+        """Load (or start) the pool for a given day."""
+        return cls(state_dir / "pools" / f"{date}.json")
+
+    def __len__(self) -> int:
+        """Number of pooled articles."""
+        return len(self.articles)
+
+    def merge(self, articles: list[Article]) -> list[Article]:
+        """
+        Add articles not already in the pool.
+
+        Returns the genuinely new ones (same URL or headline = same story).
+        """
+        seen_urls, seen_titles = set(), set()
+        for article in self.articles:
+            url, title = _story_keys(article)
+            seen_urls.add(url)
+            seen_titles.add(title)
+
+        new = []
+        for article in articles:
+            url, title = _story_keys(article)
+            if url in seen_urls or title in seen_titles:
+                continue
+            seen_urls.add(url)
+            seen_titles.add(title)
+            new.append(article)
+
+        self.articles.extend(new)
+        self.uncurated += len(new)
+        return new
+
+    def save(self) -> None:
+        """Persist the pool."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "last_gathered_at": (
+                self.last_gathered_at.isoformat() if self.last_gathered_at else None
+            ),
+            "selected_uuids": [str(u) for u in self.selected_uuids],
+            "uncurated": self.uncurated,
+            "articles": [a.to_dict() for a in self.articles],
+        }
+        self.path.write_text(json.dumps(data, indent=2))
@@ -0,0 +1,109 @@
+"""Message Batches backend for bulk, non-urgent workloads."""
+
+import re
+import time
+from typing import TYPE_CHECKING, Any
+
+from src.utils.file_logger import get_logger
+
+if TYPE_CHECKING:
+    from anthropic import Anthropic
+    from src.utils.reporter import Reporter
+
+# First poll after this long, then back off up to the maximum
+BATCH_POLL_SECONDS = 10.0
+BATCH_MAX_POLL_SECONDS = 300.0
+
+# custom_id may only use these characters (and at most 64 of them)
+_CUSTOM_ID_INVALID = re.compile(r"[^a-zA-Z0-9_-]")
+
+
+class BatchRequestError(Exception):
+    """A batch entry that didn't succeed (errored, canceled or expired)."""
+
+
+def batch_custom_id(*parts: str) -> str:
+    """Build a valid custom_id from parts, e.g. a date and an agent name."""
+    return _CUSTOM_ID_INVALID.sub("-", "_".join(parts))[:64]
+
+
+class BatchRunner:
+    """
+    Submits requests as one Message Batch and maps results back by custom_id.
+
+    Trades latency (results can take minutes to hours) for throughput and
+    half-price tokens. Polling backs off exponentially, so a long batch costs
+    a handful of status calls rather than hundreds.
+    """
+
+    def __init__(
+        self,
+        client: "Anthropic",
+        reporter: "Reporter",
+        poll_seconds: float = BATCH_POLL_SECONDS,
+        max_poll_seconds: float = BATCH_MAX_POLL_SECONDS,
+    ):
+        self.client = client
+        self.reporter = reporter
+        self.poll_seconds = poll_seconds
+        self.max_poll_seconds = max_poll_seconds
+
+    def run(self, requests: dict[str, dict]) -> dict[str, Any]:
+        """
+        Run requests (custom_id -> messages.create params) as a batch.
+
+        Returns custom_id -> Message, or a BatchRequestError for entries that
+        didn't succeed.
+        """
+        if not requests:
+            return {}
+
+        logger = get_logger()
+        batch = self.client.messages.batches.create(
+            requests=[
+                {"custom_id": custom_id, "params": params}
+                for custom_id, params in requests.items()
+            ]
+        )
+        logger.info("Batch %s - Submitted %s requests", batch.id, len(requests))
+        self.reporter.print(f"[dim]Batch {batch.id}: {len(requests)} requests submitted[/dim]")
+
+        batch = self._wait(batch)
+        return self._collect(batch.id, requests)
+
+    def _wait(self, batch):
+        """Poll until the batch has ended."""
+        delay = self.poll_seconds
+        while batch.processing_status != "ended":
+            time.sleep(delay)
+            delay = min(delay * 2, self.max_poll_seconds)
+            batch = self.client.messages.batches.retrieve(batch.id)
+
+            counts = batch.request_counts
+            self.reporter.print(
+                f"[dim]Batch {batch.id}: {counts.processing} processing, "
+                f"{counts.succeeded} succeeded, {counts.errored} errored[/dim]"
+            )
+        return batch
+
+    def _collect(self, batch_id: str, requests: dict[str, dict]) -> dict[str, Any]:
+        """Map the batch's results back onto the submitted custom_ids."""
+        logger = get_logger()
+        results: dict[str, Any] = {
+            custom_id: BatchRequestError("no result returned") for custom_id in requests
+        }
+
+        for entry in self.client.messages.batches.results(batch_id):
+            outcome = entry.result
+            if outcome.type == "succeeded":
+                results[entry.custom_id] = outcome.message
+            elif outcome.type == "errored":
+                results[entry.custom_id] = BatchRequestError(
+                    f"errored: {outcome.error.error.message}"
+                )
+            else:
+                results[entry.custom_id] = BatchRequestError(outcome.type)
+
+        failed = sum(isinstance(r, BatchRequestError) for r in results.values())
+        logger.info("Batch %s - %s succeeded, %s failed", batch_id, len(results) - failed, failed)
+        return results
@@ -0,0 +1,182 @@
+"""Record/replay cassettes for API calls.
+
+A recording captures every messages call the agents make (the full response
+with usage and stop_reason, stream chunks, and latency) into a gzipped JSONL
+cassette. Replaying serves those responses back, keyed by agent name and
+call number, with recorded or scaled timing, so the whole pipeline runs
+offline and reproducibly.
+"""
+
+import asyncio
+import gzip
+import json
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Union
+
+# Curator prompts list each article as "UUID: ...\nTitle: ..."
+_INDEXED_ARTICLE = re.compile(r"UUID: (\S+)\nTitle: (.*)")
+
+# Replayed stream chunks are delivered in sleeps of at least this long
+MIN_REPLAY_SLEEP_SECONDS = 0.01
+
+CASSETTE_VERSION = 1
+
+
+class CassetteMissError(KeyError):
+    """A replayed run made a call the cassette has no recording for."""
+
+
+def _call_key(agent: str, counts: dict[str, int]) -> str:
+    """Key for an agent's next call: its name and call number."""
+    n = counts.get(agent, 0)
+    counts[agent] = n + 1
+    return f"{agent}#{n}"
+
+
+def _indexed_articles(kwargs: dict) -> dict[str, str]:
+    """UUID -> headline for the articles listed in a request's prompt."""
+    prompt = kwargs["messages"][0]["content"]
+    return dict(_INDEXED_ARTICLE.findall(prompt))
+
+
+class CassetteRecorder:
+    """Captures calls while a run talks to the live API."""
+
+    replaying = False
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.recorded_at = datetime.now(timezone.utc)
+        self._entries: list[dict] = []
+        self._counts: dict[str, int] = {}
+
+    def record(
+        self,
+        agent: str,
+        kind: str,
+        kwargs: dict,
+        response: Any,
+        seconds: float,
+        chunks: Optional[list[str]] = None,
+    ) -> None:
+        """Capture one completed call ("create" or "stream")."""
+        entry = {
+            "key": _call_key(agent, self._counts),
+            "kind": kind,
+            "model": kwargs["model"],
+            "seconds": round(seconds, 3),
+            "response": response.model_dump(mode="json"),
+        }
+        if chunks is not None:
+            entry["chunks"] = chunks
+        articles = _indexed_articles(kwargs)
+        if articles:
+            entry["articles"] = articles
+        self._entries.append(entry)
+
+    def save(self) -> None:
+        """Write the cassette."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        header = {"version": CASSETTE_VERSION, "recorded_at": self.recorded_at.isoformat()}
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            for line in [header, *self._entries]:
+                f.write(json.dumps(line, separators=(",", ":")) + "\n")
+
+
+class CassettePlayer:
+    """
+    Serves recorded responses back instead of calling the API.
+
+    speed scales the recorded latencies: 1.0 replays at recorded pace, 2.0
+    twice as fast, and 0 returns immediately.
+    """
+
+    replaying = True
+
+    def __init__(self, path: Path, speed: float = 1.0):
+        self.path = path
+        self.speed = speed
+        self._entries: dict[str, dict] = {}
+        self._counts: dict[str, int] = {}
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline())
+            for line in f:
+                entry = json.loads(line)
+                self._entries[entry["key"]] = entry
+        self.recorded_at = datetime.fromisoformat(header["recorded_at"])
+
+    def _next(self, agent: str, kind: str) -> dict:
+        key = _call_key(agent, self._counts)
+        entry = self._entries.get(key)
+        if entry is None or entry["kind"] != kind:
+            raise CassetteMissError(f"No recorded {kind} call {key} in {self.path}")
+        return entry
+
+    def _response(self, entry: dict, kwargs: dict) -> Any:
+        """
+        Rebuild the recorded Message.
+
+        Article UUIDs are random per run, so any recorded UUID of an article
+        listed in the prompt is swapped for this run's UUID of the same
+        headline.
+        """
+        from anthropic.types import Message
+
+        text = json.dumps(entry["response"])
+        by_title = {title: uuid for uuid, title in _indexed_articles(kwargs).items()}
+        for old_uuid, title in entry.get("articles", {}).items():
+            if title in by_title:
+                text = text.replace(old_uuid, by_title[title])
+        return Message.model_validate(json.loads(text))
+
+    async def replay(self, agent: str, kwargs: dict) -> Any:
+        """Replay an agent's next messages.create call."""
+        entry = self._next(agent, "create")
+        if self.speed:
+            await asyncio.sleep(entry["seconds"] / self.speed)
+        return self._response(entry, kwargs)
+
+    async def replay_stream(
+        self, agent: str, kwargs: dict, on_text: Callable[[str], None]
+    ) -> Any:
+        """Replay an agent's next streamed call, feeding chunks to on_text."""
+        entry = self._next(agent, "stream")
+        chunks = entry.get("chunks", [])
+        per_chunk = entry["seconds"] / self.speed / max(len(chunks), 1) if self.speed else 0
+
+        owed = 0.0
+        for chunk in chunks:
+            on_text(chunk)
+            owed += per_chunk
+            if owed >= MIN_REPLAY_SLEEP_SECONDS:
+                await asyncio.sleep(owed)
+                owed = 0.0
+        if owed:
+            await asyncio.sleep(owed)
+
+        return self._response(entry, kwargs)
+
+
+Cassette = Union[CassetteRecorder, CassettePlayer]
+
+_cassette: ContextVar[Optional[Cassette]] = ContextVar("cassette", default=None)
+
+
+@contextmanager
+def use_cassette(cassette: Optional[Cassette]) -> Iterator[Optional[Cassette]]:
+    """Record into, or replay from, a cassette for the duration of a run."""
+    token = _cassette.set(cassette)
+    try:
+        yield cassette
+    finally:
+        _cassette.reset(token)
+
+
+def current_cassette() -> Optional[Cassette]:
+    """The cassette in use, if any."""
+    return _cassette.get()
@@ -1,7 +1,7 @@
 """Creative nudge system to encourage design experimentation and variation."""
 
 import random
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 
 
 class CreativeNudge(TypedDict):
@@ -10,6 +10,17 @@ class CreativeNudge(TypedDict):
     type: str
     weight: int
     text: str | None
+    option: NotRequired[str | None]  # Sub-option filled into the text
+
+
+# Nudge history: nudge type or sub-option -> days since it was last used
+NudgeHistory = dict[str, int]
+
+# How hard a nudge used yesterday is down-weighted (0 = no penalty, 1 = banned)
+NUDGE_REPEAT_PENALTY = 0.9
+
+# How fast the penalty wears off per day
+NUDGE_PENALTY_DECAY = 0.6
 
 
 # Weighted list of creative nudges
@@ -89,47 +100,151 @@ STRUCTURAL_APPROACHES = [
 ]
 
 
-def generate_creative_nudge() -> CreativeNudge:
+# Placeholder name -> sub-options it can be filled with
+SUB_OPTIONS: dict[str, list[str]] = {
+    "retro_style": RETRO_STYLES,
+    "color_constraint": COLOR_CONSTRAINTS,
+    "structural_approach": STRUCTURAL_APPROACHES,
+}
+
+
+class AliasTable:
+    """Walker alias table for O(1) weighted sampling (Vose's construction)."""
+
+    def __init__(self, weights: list[float]):
+        n = len(weights)
+        if n == 0 or sum(weights) <= 0:
+            raise ValueError("Alias table needs at least one positive weight")
+
+        total = sum(weights)
+        scaled = [w * n / total for w in weights]
+        self.prob = [0.0] * n
+        self.alias = [0] * n
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+        # Leftovers are 1.0 up to floating point error
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def sample(self, rng: random.Random) -> int:
+        """Draw an index in O(1)."""
+        i = rng.randrange(len(self.prob))
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+
+def recency_factor(days_ago: int | None) -> float:
     """
-    Generate a random creative nudge based on weighted probabilities.
+    Weight multiplier for a nudge or sub-option last used days_ago days ago.
 
-    Returns a nudge dictionary with type and optional text.
+    Never used -> 1.0; yesterday -> 1 - NUDGE_REPEAT_PENALTY; the penalty
+    decays geometrically from there.
     """
-    # Calculate total weight
-    total_weight = sum(nudge["weight"] for nudge in NUDGES)
-
-    # Pick a random value
-    r = random.uniform(0, total_weight)
-
-    # Select nudge based on weighted random
-    cumulative = 0
-    for nudge in NUDGES:
-        cumulative += nudge["weight"]
-        if r <= cumulative:
-            # If nudge has placeholders, fill them in
-            if nudge["text"] and "{" in nudge["text"]:
-                return _fill_nudge_placeholders(nudge)
+    if days_ago is None:
+        return 1.0
+    return 1.0 - NUDGE_REPEAT_PENALTY * NUDGE_PENALTY_DECAY ** max(days_ago - 1, 0)
+
+
+class NudgeSampler:
+    """
+    Seedable creative nudge sampler with anti-repetition scheduling.
+
+    Alias tables are built once per run from the nudge weights, down-weighted
+    by how recently each nudge type and sub-option was used, so every draw is
+    O(1). Every draw (and every sub-option choice) uses the sampler's own RNG,
+    so a run can be replayed exactly from its seed.
+    """
+
+    def __init__(
+        self,
+        nudges: list[CreativeNudge] = NUDGES,
+        seed: int | None = None,
+        rng: random.Random | None = None,
+        history: NudgeHistory | None = None,
+    ):
+        if rng is None and seed is None:
+            seed = random.SystemRandom().randrange(2**32)
+
+        self.nudges = nudges
+        self.seed = seed
+        self.rng = rng or random.Random(seed)
+        history = history or {}
+
+        # "none" is the absence of a nudge, so it's never penalized
+        self._weights = [
+            nudge["weight"]
+            if nudge["type"] == "none"
+            else nudge["weight"] * recency_factor(history.get(nudge["type"]))
+            for nudge in nudges
+        ]
+        self._table = AliasTable(self._weights)
+        self._option_tables = {
+            name: AliasTable([recency_factor(history.get(o)) for o in options])
+            for name, options in SUB_OPTIONS.items()
+        }
+
+    def sample(self) -> CreativeNudge:
+        """Draw one nudge based on weighted probabilities."""
+        return self._fill(self.nudges[self._table.sample(self.rng)])
+
+    def _choose_option(self, placeholder: str) -> str:
+        """Pick a sub-option for a placeholder, avoiding recent ones."""
+        options = SUB_OPTIONS[placeholder]
+        return options[self._option_tables[placeholder].sample(self.rng)]
+
+    def sample_distinct(self, n: int) -> list[CreativeNudge]:
+        """
+        Draw up to n nudges with distinct types (e.g. for parallel variants).
+
+        Uses weighted sampling without replacement (Efraimidis-Spirakis keys).
+        """
+        keyed = [
+            (self.rng.random() ** (1.0 / weight), i)
+            for i, weight in enumerate(self._weights)
+            if weight > 0
+        ]
+        keyed.sort(reverse=True)
+        return [self._fill(self.nudges[i]) for _, i in keyed[:n]]
+
+    def _fill(self, nudge: CreativeNudge) -> CreativeNudge:
+        """Fill in placeholders in nudge text with seeded choices."""
+        text = nudge["text"]
+        if not text or "{" not in text:
             return nudge
 
-    # Fallback (should never happen)
-    return {"type": "none", "weight": 0, "text": None}
+        # Replace the placeholder with a sub-option
+        option = None
+        for placeholder in SUB_OPTIONS:
+            if "{" + placeholder + "}" in text:
+                option = self._choose_option(placeholder)
+                text = text.format(**{placeholder: option})
+                break
 
+        return {
+            "type": nudge["type"],
+            "weight": nudge["weight"],
+            "text": text,
+            "option": option,
+        }
 
-def _fill_nudge_placeholders(nudge: CreativeNudge) -> CreativeNudge:
-    """Fill in placeholders in nudge text with random choices."""
-    text = nudge["text"]
-    if not text:
-        return nudge
 
-    # Replace placeholders
-    if "{retro_style}" in text:
-        text = text.format(retro_style=random.choice(RETRO_STYLES))
-    elif "{color_constraint}" in text:
-        text = text.format(color_constraint=random.choice(COLOR_CONSTRAINTS))
-    elif "{structural_approach}" in text:
-        text = text.format(structural_approach=random.choice(STRUCTURAL_APPROACHES))
+def generate_creative_nudge(
+    seed: int | None = None, history: NudgeHistory | None = None
+) -> CreativeNudge:
+    """
+    Generate a creative nudge based on weighted probabilities.
 
-    return {"type": nudge["type"], "weight": nudge["weight"], "text": text}
+    Returns a nudge dictionary with type and optional text.
+    """
+    return NudgeSampler(seed=seed, history=history).sample()
 
 
 def format_nudge(nudge: CreativeNudge) -> str:
@@ -0,0 +1,70 @@
+"""Parsing the publication dates gatherers report."""
+
+from datetime import date, datetime, time, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+# Tried after the ISO and RFC 2822 parsers, in order
+FALLBACK_FORMATS = (
+    "%B %d, %Y",  # October 17, 2026
+    "%b %d, %Y",  # Oct 17, 2026
+    "%d %B %Y",  # 17 October 2026
+    "%d %b %Y",  # 17 Oct 2026
+    "%Y/%m/%d",
+    "%m/%d/%Y",
+)
+
+
+def as_utc(value: datetime) -> datetime:
+    """Make a datetime timezone-aware in UTC (naive values are taken as UTC)."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _end_of_day(day: date) -> datetime:
+    """
+    A bare date as the latest moment it can mean: the end of that day (UTC),
+    or now if that's still to come. A story dated two days ago then stays
+    inside a 48h window whatever time of day it was published.
+    """
+    end = datetime.combine(day, time(23, 59, 59), tzinfo=timezone.utc)
+    return min(end, datetime.now(timezone.utc))
+
+
+def parse_published_date(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a reported publication date into a UTC-aware datetime.
+
+    ISO 8601 (the prompts ask for YYYY-MM-DD) takes a fast path; RFC 2822
+    (feed style) and a few written-out formats are tried after it. Dates
+    without a time are taken as the end of that day. Returns None when
+    nothing matches.
+    """
+    if not value:
+        return None
+    value = value.strip()
+
+    try:
+        return _end_of_day(date.fromisoformat(value))
+    except ValueError:
+        pass
+
+    try:
+        return as_utc(datetime.fromisoformat(value))
+    except ValueError:
+        pass
+
+    try:
+        return as_utc(parsedate_to_datetime(value))
+    except (TypeError, ValueError, IndexError):
+        pass
+
+    # All date-only formats
+    for fmt in FALLBACK_FORMATS:
+        try:
+            return _end_of_day(datetime.strptime(value, fmt).date())
+        except ValueError:
+            continue
+
+    return None
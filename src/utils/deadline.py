@@ -0,0 +1,59 @@
+"""Run-level deadline split into per-stage budgets."""
+
+import time
+
+# Share of the run deadline each stage gets, in pipeline order
+STAGE_SHARES: dict[str, float] = {
+    "gather": 0.35,
+    "curate": 0.20,
+    "build": 0.40,
+}
+
+# Held back from every stage for the local fallbacks and publishing
+FALLBACK_RESERVE_SECONDS = 20.0
+
+# Never give a stage less than this, even when running late
+MIN_STAGE_SECONDS = 5.0
+
+
+class RunDeadline:
+    """
+    Tracks time left in the run and hands out per-stage budgets.
+
+    A stage's budget is its share of whatever time remains, so time saved by
+    a fast stage rolls forward to the stages after it.
+    """
+
+    def __init__(self, total_seconds: float, shares: dict[str, float] = STAGE_SHARES):
+        self.total_seconds = total_seconds
+        self.shares = shares
+        self.restart()
+
+    def restart(self) -> None:
+        """Start the clock (again)."""
+        self._start = time.monotonic()
+
+    def elapsed(self) -> float:
+        """Seconds since the run started."""
+        return time.monotonic() - self._start
+
+    def remaining(self) -> float:
+        """Seconds left before the run deadline."""
+        return max(0.0, self.total_seconds - self.elapsed())
+
+    def can_start(self) -> bool:
+        """Whether there's still enough time to start another API stage."""
+        return self.remaining() - FALLBACK_RESERVE_SECONDS >= MIN_STAGE_SECONDS
+
+    def planned_budget(self, stage: str) -> float:
+        """A stage's budget at the start of the run (before any rollover)."""
+        return self.total_seconds * self.shares[stage]
+
+    def stage_budget(self, stage: str) -> float:
+        """Seconds the stage may use, given the time left right now."""
+        stages = list(self.shares)
+        later = stages[stages.index(stage):]
+        share = self.shares[stage] / sum(self.shares[s] for s in later)
+
+        usable = self.remaining() - FALLBACK_RESERVE_SECONDS
+        return max(MIN_STAGE_SECONDS, usable * share)
@@ -0,0 +1,102 @@
+"""Capture the builder's DESIGN BRIEF while the HTML streams in."""
+
+import re
+
+from src.models.article import Article
+from src.utils.design_memory import FALLBACK_BRIEF_PREFIX
+
+# Longest brief we'll hold on to (the prompt asks for 2-4 sentences)
+MAX_BRIEF_CHARS = 2000
+
+
+class _MarkerCapture:
+    """Incrementally captures the text between a start and end marker."""
+
+    def __init__(self, start: str, end: str, max_chars: int):
+        self.start = start.lower()
+        self.end = end
+        self.max_chars = max_chars
+        self.value: str | None = None
+        self._capturing = False
+        self._captured = 0
+        self._parts: list[str] = []
+        # Unmatched tail of the previous chunk (markers can straddle chunks)
+        self._tail = ""
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next streamed chunk."""
+        if self.value is not None:
+            return
+
+        text = self._tail + chunk
+        if not self._capturing:
+            idx = text.lower().find(self.start)
+            if idx == -1:
+                self._tail = text[max(0, len(text) - len(self.start) + 1):]
+                return
+            self._capturing = True
+            text = text[idx + len(self.start):]
+
+        idx = text.find(self.end)
+        if idx != -1:
+            self._parts.append(text[:idx])
+            self.value = "".join(self._parts)
+            return
+
+        split = max(0, len(text) - len(self.end) + 1)
+        self._parts.append(text[:split])
+        self._tail = text[split:]
+        self._captured += split
+
+        # Runaway capture (unterminated comment) - keep what we have
+        if self._captured >= self.max_chars:
+            self.value = "".join(self._parts)[: self.max_chars]
+
+
+class DesignBriefScanner:
+    """
+    Detects the DESIGN BRIEF comment (and page title) as HTML streams past.
+
+    Feed it every text delta from the builder; once the stream ends, `brief`
+    and `title` hold what was found without rescanning the finished document.
+    """
+
+    def __init__(self):
+        self._brief = _MarkerCapture("DESIGN BRIEF:", "-->", MAX_BRIEF_CHARS)
+        self._title = _MarkerCapture("<title>", "</title>", 300)
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next streamed chunk of HTML."""
+        self._brief.feed(chunk)
+        self._title.feed(chunk)
+
+    @property
+    def brief(self) -> str | None:
+        """The design brief, whitespace-normalized, or None if not seen."""
+        return _normalize(self._brief.value)
+
+    @property
+    def title(self) -> str | None:
+        """The page title, or None if not seen."""
+        return _normalize(self._title.value)
+
+
+def _normalize(text: str | None) -> str | None:
+    """Collapse whitespace; treat empty text as missing."""
+    if text is None:
+        return None
+    text = re.sub(r"\s+", " ", text).strip()
+    return text or None
+
+
+def fallback_design_brief(title: str | None, articles: list[Article]) -> str:
+    """
+    Summarize a design that came back without a DESIGN BRIEF.
+
+    Built from the page title and lead headlines, so the day's memory entry
+    says what the page was. It starts with FALLBACK_BRIEF_PREFIX, so the
+    tired-aesthetics check and the similarity index skip it.
+    """
+    headlines = "; ".join(article.title for article in articles[:3])
+    page = f'Page titled "{title}",' if title else "Untitled page"
+    return f"{FALLBACK_BRIEF_PREFIX} {page} built around: {headlines}"
@@ -0,0 +1,182 @@
+"""Similarity index over the long-horizon design history.
+
+Briefs are embedded as hashed TF-IDF vectors (no embedding model, no extra
+dependencies) and stored as an inverted index, so a lookup only touches the
+postings for terms that actually appear in the query.
+"""
+
+import heapq
+import math
+import re
+import zlib
+from collections import Counter, defaultdict
+from typing import Iterable
+
+from src.utils.design_memory import (
+    HISTORY_FILE,
+    DesignSummary,
+    is_placeholder_brief,
+    load_design_history,
+)
+
+# Size of the hashed feature space (collisions are rare at this size)
+HASH_DIMENSIONS = 1 << 18
+
+# Words that carry no aesthetic signal
+STOPWORDS = frozenset(
+    """
+    a an and are as at be but by for from has have in into is it its of on
+    or so that the their then there these this to was were which while with
+    page design designs today today's story stories news each every
+    """.split()
+)
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _tokenize(text: str) -> list[str]:
+    """Lowercase, split into words, and drop stopwords and short tokens."""
+    return [
+        token
+        for token in TOKEN_RE.findall(text.lower())
+        if len(token) > 2 and token not in STOPWORDS
+    ]
+
+
+def _hash_terms(text: str) -> Counter:
+    """Map text to hashed term counts (stable across processes)."""
+    return Counter(
+        zlib.crc32(token.encode()) & (HASH_DIMENSIONS - 1)
+        for token in _tokenize(text)
+    )
+
+
+class DesignIndex:
+    """Hashed TF-IDF index over design briefs with top-k cosine lookup."""
+
+    def __init__(self, designs: Iterable[DesignSummary]):
+        # Placeholder briefs would all match each other (or today's
+        # headlines), so skip them
+        self.designs: list[DesignSummary] = [
+            d
+            for d in designs
+            if d.get("brief") and not is_placeholder_brief(d["brief"])
+        ]
+
+        term_counts = [_hash_terms(d["brief"]) for d in self.designs]
+
+        # Document frequency -> smoothed IDF
+        doc_freq: Counter = Counter()
+        for counts in term_counts:
+            doc_freq.update(counts.keys())
+
+        n_docs = len(self.designs)
+        self.idf: dict[int, float] = {
+            term: math.log((1 + n_docs) / (1 + df)) + 1.0
+            for term, df in doc_freq.items()
+        }
+
+        # Inverted index: term -> [(doc_id, normalized weight)]
+        self.postings: dict[int, list[tuple[int, float]]] = defaultdict(list)
+        for doc_id, counts in enumerate(term_counts):
+            vector = self._weigh(counts)
+            for term, weight in vector.items():
+                self.postings[term].append((doc_id, weight))
+
+    def __len__(self) -> int:
+        """Number of indexed designs."""
+        return len(self.designs)
+
+    def _weigh(self, counts: Counter) -> dict[int, float]:
+        """Turn raw term counts into an L2-normalized TF-IDF vector."""
+        vector = {
+            term: (1.0 + math.log(tf)) * self.idf[term]
+            for term, tf in counts.items()
+            if term in self.idf
+        }
+        norm = math.sqrt(sum(w * w for w in vector.values()))
+        if norm == 0:
+            return {}
+        return {term: w / norm for term, w in vector.items()}
+
+    def query(
+        self, text: str, k: int = 3, exclude_dates: Iterable[str] = ()
+    ) -> list[tuple[DesignSummary, float]]:
+        """
+        Find the k past designs most similar to a candidate direction.
+
+        Returns (design, cosine similarity) pairs, best first. Designs whose
+        date is in exclude_dates (e.g. already shown as recent) are skipped.
+        """
+        vector = self._weigh(_hash_terms(text))
+        if not vector:
+            return []
+
+        excluded = set(exclude_dates)
+        scores: dict[int, float] = defaultdict(float)
+        for term, q_weight in vector.items():
+            for doc_id, d_weight in self.postings.get(term, ()):
+                scores[doc_id] += q_weight * d_weight
+
+        top = heapq.nlargest(
+            k,
+            (
+                (score, doc_id)
+                for doc_id, score in scores.items()
+                if self.designs[doc_id]["date"] not in excluded
+            ),
+        )
+        return [(self.designs[doc_id], score) for score, doc_id in top]
+
+
+# Cached index, rebuilt only when the history file changes
+_cached_index: DesignIndex | None = None
+_cached_mtime: int | None = None
+
+
+def get_design_index() -> DesignIndex:
+    """Get the index over the full design history, rebuilding if stale."""
+    global _cached_index, _cached_mtime
+
+    mtime = HISTORY_FILE.stat().st_mtime_ns if HISTORY_FILE.exists() else None
+    if _cached_index is None or mtime != _cached_mtime:
+        _cached_index = DesignIndex(load_design_history())
+        _cached_mtime = mtime
+
+    return _cached_index
+
+
+def get_similar_designs(
+    candidate: str, k: int = 3, exclude_dates: Iterable[str] = ()
+) -> list[DesignSummary]:
+    """Get the k past designs most similar to a candidate direction."""
+    return [
+        design
+        for design, score in get_design_index().query(candidate, k, exclude_dates)
+        if score > 0
+    ]
+
+
+def format_similar_designs(similar: list[DesignSummary]) -> str:
+    """
+    Format similar past designs as context for the prompt.
+
+    Returns XML-formatted section or empty string if nothing matched.
+    """
+    if not similar:
+        return ""
+
+    lines = ["<similar_past_designs>"]
+    lines.append(
+        "These older designs responded to similar news or directions. Don't retread them—find a fresh angle.\n"
+    )
+
+    for design in similar:
+        brief = design["brief"]
+        if len(brief) > 300:
+            brief = brief[:297] + "..."
+
+        lines.append(f"**{design['date']}**: {brief}\n")
+
+    lines.append("</similar_past_designs>")
+    return "\n".join(lines)
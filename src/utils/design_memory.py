@@ -1,10 +1,9 @@
 """Design memory system to track recent design choices and encourage variation."""
 
 import json
-import re
 from datetime import datetime
 from pathlib import Path
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 
 
 class DesignSummary(TypedDict):
@@ -12,14 +11,29 @@ class DesignSummary(TypedDict):
 
     date: str
     brief: str
+    nudge_type: NotRequired[str]  # Creative nudge used that day
+    nudge_option: NotRequired[str | None]  # Sub-option filled into the nudge
 
 
 # Memory file location (at project root)
 MEMORY_FILE = Path(__file__).parent.parent.parent / "design_memory.json"
 
+# Long-horizon design history (every brief, not just the recent window)
+HISTORY_FILE = Path(__file__).parent.parent.parent / "design_history.json"
+
 # How many days of design history to keep
 MEMORY_WINDOW_DAYS = 10
 
+# How many briefs the long-horizon history keeps (roughly two years)
+HISTORY_MAX_ENTRIES = 730
+
+# Placeholder brief stored by older runs when no brief was found
+MISSING_BRIEF = "No design brief found in generated HTML"
+
+# Prefix of the summary stored when the builder left out its brief (see
+# design_brief.fallback_design_brief): it describes headlines, not a design
+FALLBACK_BRIEF_PREFIX = "(No brief)"
+
 # Aesthetic patterns to detect in design briefs
 # Maps aesthetic name to keywords/phrases that indicate its use
 AESTHETIC_PATTERNS: dict[str, list[str]] = {
@@ -80,39 +94,22 @@ AESTHETIC_PATTERNS: dict[str, list[str]] = {
 }
 
 
-def extract_design_summary(html: str, date: str) -> DesignSummary:
-    """
-    Extract design summary from generated HTML.
-
-    Looks for the DESIGN BRIEF comment and extracts it.
-    If not found, creates a minimal summary.
-    """
-    # Try to find the DESIGN BRIEF comment
-    brief_match = re.search(
-        r"<!--\s*DESIGN BRIEF:\s*(.*?)\s*-->", html, re.DOTALL | re.IGNORECASE
-    )
-
-    if brief_match:
-        brief = brief_match.group(1).strip()
-        # Clean up excessive whitespace
-        brief = re.sub(r"\s+", " ", brief)
-    else:
-        # Fallback if no design brief found
-        brief = "No design brief found in generated HTML"
-
-    return {"date": date, "brief": brief}
+def _replace_date(
+    summaries: list[DesignSummary], summary: DesignSummary
+) -> list[DesignSummary]:
+    """Summaries with any for the same date dropped and summary appended."""
+    return [s for s in summaries if s["date"] != summary["date"]] + [summary]
 
 
 def save_design_summary(summary: DesignSummary) -> None:
     """
     Append today's design to memory file.
 
-    Keeps only the last MEMORY_WINDOW_DAYS days of designs.
+    Keeps only the last MEMORY_WINDOW_DAYS days of designs. A design already
+    saved for the same date is replaced, so re-running a day doesn't count
+    its design twice.
     """
-    memories = load_design_memory()
-
-    # Add new summary
-    memories.append(summary)
+    memories = _replace_date(load_design_memory(), summary)
 
     # Keep only last N days
     memories = memories[-MEMORY_WINDOW_DAYS:]
@@ -121,12 +118,34 @@ def save_design_summary(summary: DesignSummary) -> None:
     MEMORY_FILE.parent.mkdir(parents=True, exist_ok=True)
     MEMORY_FILE.write_text(json.dumps(memories, indent=2))
 
+    # Append to the long-horizon history as well
+    history = _replace_date(load_design_history(), summary)
+    history = history[-HISTORY_MAX_ENTRIES:]
+    HISTORY_FILE.write_text(json.dumps(history, indent=2))
 
-def load_design_memory() -> list[DesignSummary]:
-    """Load recent design summaries from file."""
-    if MEMORY_FILE.exists():
+
+# Parsed summary files, keyed by path, reused until the file's mtime changes
+_summary_cache: dict[Path, tuple[int, list[DesignSummary]]] = {}
+
+
+def _load_summaries(path: Path) -> list[DesignSummary]:
+    """Load a list of design summaries from a JSON file (cached by mtime)."""
+    mtime = path.stat().st_mtime_ns if path.exists() else None
+    cached = _summary_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return list(cached[1])
+
+    summaries = _parse_summaries(path)
+    if mtime is not None:
+        _summary_cache[path] = (mtime, summaries)
+    return list(summaries)
+
+
+def _parse_summaries(path: Path) -> list[DesignSummary]:
+    """Parse a list of design summaries from a JSON file."""
+    if path.exists():
         try:
-            content = MEMORY_FILE.read_text()
+            content = path.read_text()
             data = json.loads(content)
             # Validate structure
             if isinstance(data, list):
@@ -138,6 +157,23 @@ def load_design_memory() -> list[DesignSummary]:
     return []
 
 
+def load_design_memory() -> list[DesignSummary]:
+    """Load recent design summaries from file."""
+    return _load_summaries(MEMORY_FILE)
+
+
+def load_design_history() -> list[DesignSummary]:
+    """
+    Load the long-horizon design history.
+
+    Seeds from the recent-window memory file the first time, so existing
+    briefs aren't lost when the history file doesn't exist yet.
+    """
+    if HISTORY_FILE.exists():
+        return _load_summaries(HISTORY_FILE)
+    return load_design_memory()
+
+
 def get_recent_designs(n: int = 3) -> list[DesignSummary]:
     """Get the N most recent design summaries."""
     memories = load_design_memory()
@@ -177,6 +213,37 @@ def get_today_date() -> str:
     return datetime.now().strftime("%Y-%m-%d")
 
 
+def get_nudge_history(
+    memories: list[DesignSummary], today: str
+) -> dict[str, int]:
+    """
+    Work out how many days ago each nudge type and sub-option was last used.
+
+    Returns a mapping of nudge type / sub-option text -> days since last use,
+    for the nudge scheduler to down-weight recent repeats.
+    """
+    today_date = datetime.strptime(today, "%Y-%m-%d").date()
+    history: dict[str, int] = {}
+
+    for memory in memories:
+        try:
+            used_on = datetime.strptime(memory["date"], "%Y-%m-%d").date()
+        except (KeyError, ValueError):
+            continue
+
+        days_ago = (today_date - used_on).days
+        for key in (memory.get("nudge_type"), memory.get("nudge_option")):
+            if key and key != "none":
+                history[key] = min(days_ago, history.get(key, days_ago))
+
+    return history
+
+
+def is_placeholder_brief(brief: str) -> bool:
+    """Whether a stored brief stands in for a missing one (no design content)."""
+    return brief == MISSING_BRIEF or brief.startswith(FALLBACK_BRIEF_PREFIX)
+
+
 def detect_tired_aesthetics(memories: list[DesignSummary]) -> list[str]:
     """
     Analyze recent design briefs to detect which aesthetics have been used.
@@ -187,8 +254,11 @@ def detect_tired_aesthetics(memories: list[DesignSummary]) -> list[str]:
     if not memories:
         return []
 
-    # Combine all recent briefs into one text blob for searching
-    combined_briefs = " ".join(m["brief"].lower() for m in memories)
+    # Combine all recent briefs into one text blob for searching (placeholders
+    # hold headlines, whose words would read as aesthetics)
+    combined_briefs = " ".join(
+        m["brief"].lower() for m in memories if not is_placeholder_brief(m["brief"])
+    )
 
     tired = []
     for aesthetic_name, keywords in AESTHETIC_PATTERNS.items():
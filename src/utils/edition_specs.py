@@ -0,0 +1,99 @@
+"""Extra editions fanned out from one gather and curation pass.
+
+An edition spec describes a regional or topic edition (keyword and gatherer
+filters over the day's stories) or a design variant (the same stories with
+another creative nudge or builder model). Specs come from a JSON list:
+
+    [
+      {"name": "europe", "title": "Europe", "include": ["EU", "Europe"]},
+      {"name": "science", "include": ["science", "space"], "max_articles": 8},
+      {"name": "variant-b", "nudge_seed": 42}
+    ]
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from src.models.article import Article
+from src.utils.local_ranking import rank_articles_locally
+
+# Edition names become directory names
+_EDITION_NAME = re.compile(r"^[a-z0-9][a-z0-9_-]*$")
+
+
+@dataclass
+class EditionSpec:
+    """One extra edition: which stories it carries and how it's designed."""
+
+    name: str
+    title: str = ""
+
+    # Story filters (case-insensitive whole words in the headline or summary)
+    include: list[str] = field(default_factory=list)  # Any of these; empty = all
+    exclude: list[str] = field(default_factory=list)
+    agents: list[str] = field(default_factory=list)  # Gatherer names; empty = all
+
+    # Topped up from the day's other matching stories when the selection is short
+    min_articles: int = 5
+    max_articles: int = 12
+
+    # Design variants (None = a nudge distinct from the main edition's, drawn
+    # from the run's seed / the configured builder model)
+    nudge_seed: Optional[int] = None
+    builder_model: Optional[str] = None
+
+    def __post_init__(self):
+        if not _EDITION_NAME.match(self.name):
+            raise ValueError(
+                f"Edition name {self.name!r} must be lowercase letters, digits, - or _"
+            )
+        self._include = _word_pattern(self.include)
+        self._exclude = _word_pattern(self.exclude)
+
+    def matches(self, article: Article) -> bool:
+        """Whether an article passes this edition's filters."""
+        if self.agents and article.gathered_by_agent not in self.agents:
+            return False
+        text = f"{article.title}\n{article.summary}"
+        if self._exclude and self._exclude.search(text):
+            return False
+        return self._include is None or bool(self._include.search(text))
+
+    def select(self, curated: list[Article], pool: list[Article]) -> list[Article]:
+        """
+        The edition's stories: the matching curated ones in curator order,
+        topped up from the rest of the day's matching stories (ranked
+        locally, no API call) when fewer than min_articles match.
+        """
+        selected = [article for article in curated if self.matches(article)]
+        if len(selected) < self.min_articles:
+            chosen = {article.uuid for article in selected}
+            extra = [
+                article
+                for article in pool
+                if article.uuid not in chosen and self.matches(article)
+            ]
+            selected += rank_articles_locally(extra, k=self.min_articles - len(selected))
+        return selected[: self.max_articles]
+
+
+def _word_pattern(words: list[str]) -> Optional[re.Pattern]:
+    """Case-insensitive whole-word pattern matching any of words."""
+    if not words:
+        return None
+    return re.compile(
+        r"\b(?:" + "|".join(re.escape(word) for word in words) + r")\b", re.IGNORECASE
+    )
+
+
+def load_edition_specs(path: Path) -> list[EditionSpec]:
+    """Load edition specs from a JSON list; names must be unique."""
+    specs = [EditionSpec(**entry) for entry in json.loads(path.read_text())]
+    names = [spec.name for spec in specs]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate edition names in {path}: {', '.join(duplicates)}")
+    return specs
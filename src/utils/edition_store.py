@@ -0,0 +1,99 @@
+"""Local store of published editions and their refillable shells."""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import TypedDict
+
+from src.utils.slots import Shell
+
+# Written last when an edition is saved: an edition without one is incomplete
+MANIFEST_FILE = "edition.json"
+
+
+class EditionManifest(TypedDict):
+    """Which run published an edition, and when."""
+
+    edition_id: str
+    run_id: str
+    published_at: str  # ISO 8601
+    degraded: bool  # Produced by a degradation tier rather than the builder
+
+
+def edition_id(date: str, edition: str | None = None) -> str:
+    """Stable ID of a day's edition (e.g. '2026-01-05' or '2026-01-05/europe')."""
+    return f"{date}/{edition}" if edition else date
+
+
+class EditionStore:
+    """Keeps each day's edition (and its slot shell) under state_dir/editions."""
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def _dir(self, date: str, edition: str | None = None) -> Path:
+        return self.root / date / edition if edition else self.root / date
+
+    def save(
+        self,
+        date: str,
+        html: str,
+        shell: Shell | None = None,
+        companions: dict[str, str] | None = None,
+        edition: str | None = None,
+        run_id: str = "",
+        degraded: bool = False,
+    ) -> None:
+        """
+        Save an edition, its shell if it has one, companion files, and its
+        manifest. Saving the same edition again replaces it.
+
+        Extra editions (see edition_specs) go in a subdirectory of the day.
+        """
+        edition_dir = self._dir(date, edition)
+        edition_dir.mkdir(parents=True, exist_ok=True)
+        files = {"index.html": html, **(companions or {})}
+        if shell is not None:
+            files["shell.json"] = json.dumps(shell)
+        manifest: EditionManifest = {
+            "edition_id": edition_id(date, edition),
+            "run_id": run_id,
+            "published_at": datetime.now().astimezone().isoformat(timespec="seconds"),
+            "degraded": degraded,
+        }
+        files[MANIFEST_FILE] = json.dumps(manifest)
+        if shell is None:
+            # A shell left from an earlier save would refill the wrong design
+            (edition_dir / "shell.json").unlink(missing_ok=True)
+        for name, content in files.items():
+            # Replace each file whole, so readers never see a partial write
+            path = edition_dir / name
+            partial = path.with_name(f".{name}.partial")
+            partial.write_text(content)
+            os.replace(partial, path)
+
+    def load_manifest(self, date: str) -> EditionManifest | None:
+        """A day's edition manifest, if the edition was saved completely."""
+        path = self._dir(date) / MANIFEST_FILE
+        if path.exists():
+            try:
+                return json.loads(path.read_text())
+            except (json.JSONDecodeError, ValueError):
+                return None
+        return None
+
+    def load_html(self, date: str) -> str | None:
+        """Load a day's edition HTML, if it exists."""
+        path = self._dir(date) / "index.html"
+        return path.read_text() if path.exists() else None
+
+    def load_shell(self, date: str) -> Shell | None:
+        """Load a day's slot shell, if the builder produced one."""
+        path = self._dir(date) / "shell.json"
+        if path.exists():
+            try:
+                return json.loads(path.read_text())
+            except (json.JSONDecodeError, ValueError):
+                return None
+        return None
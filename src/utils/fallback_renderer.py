@@ -0,0 +1,174 @@
+"""Local template renderer used when the builder can't produce a page.
+
+Pure Python, no API call: turns the curated articles into a complete,
+branded news.sys page in milliseconds. A handful of built-in layouts rotate
+by date, skipping any whose aesthetic is currently tired in design memory.
+"""
+
+import time
+from datetime import datetime
+from html import escape
+from typing import TypedDict
+
+from src.models.article import Article, BuildResult
+
+
+class FallbackLayout(TypedDict):
+    """A built-in page layout."""
+
+    name: str
+    aesthetic: str | None  # Matching AESTHETIC_PATTERNS name, if any
+    brief: str
+    notes: str
+    css: str
+
+
+# Shared structure; each layout only restyles it
+BASE_CSS = """
+* { box-sizing: border-box; }
+body { margin: 0; line-height: 1.55; }
+a { color: inherit; }
+a:focus-visible, summary:focus-visible { outline: 3px solid currentColor; outline-offset: 2px; }
+.wrap { max-width: 72rem; margin: 0 auto; padding: 1.25rem; }
+.stories { display: grid; gap: 1.25rem; grid-template-columns: repeat(auto-fit, minmax(17rem, 1fr)); }
+.story h2 { margin: 0 0 0.4rem; font-size: 1.15rem; line-height: 1.3; }
+.story.lead { grid-column: 1 / -1; }
+.story.lead h2 { font-size: clamp(1.5rem, 4vw, 2.4rem); }
+.story p { margin: 0 0 0.5rem; }
+.source { font-size: 0.85rem; opacity: 0.8; }
+footer { margin-top: 2.5rem; padding-top: 1rem; font-size: 0.9rem; }
+"""
+
+LAYOUTS: list[FallbackLayout] = [
+    {
+        "name": "index-cards",
+        "aesthetic": None,
+        "brief": "House template: a corkboard of index cards. Each story is pinned as its own card, the lead story spans the board, and a warm paper palette keeps it calm whatever the news.",
+        "notes": "The live designer was unavailable, so today's stories are pinned up on index cards. Plain, sturdy, and still all here.",
+        "css": """
+body { background: #e9dfcc; color: #2b2118; font-family: Georgia, 'Times New Roman', serif; }
+header h1 { font-size: clamp(2rem, 6vw, 3.5rem); margin: 0; letter-spacing: -0.02em; }
+.story { background: #fffdf6; padding: 1rem 1.1rem; border-top: 6px solid #c0392b; box-shadow: 0 2px 6px rgba(0,0,0,0.15); }
+.story:nth-child(3n+2) { border-top-color: #2c6e8f; }
+.story:nth-child(3n) { border-top-color: #5b7f3a; }
+footer { border-top: 1px dashed #7a6a55; }
+""",
+    },
+    {
+        "name": "broadsheet",
+        "aesthetic": "newspaper/broadsheet",
+        "brief": "House template: a plain broadsheet. Serif masthead, ruled columns, and the lead story across the top, the most traditional shape a news page can take.",
+        "notes": "When in doubt, print a newspaper. The live designer sat this one out, so the stories are set in honest columns.",
+        "css": """
+body { background: #fbfaf6; color: #111; font-family: 'Times New Roman', Georgia, serif; }
+header { text-align: center; border-bottom: 4px double #111; margin-bottom: 1.25rem; }
+header h1 { font-size: clamp(2.4rem, 8vw, 4.5rem); margin: 0; font-weight: 700; }
+.story { border-top: 1px solid #111; padding-top: 0.6rem; }
+.story.lead { border-top: 3px solid #111; }
+footer { border-top: 4px double #111; }
+""",
+    },
+    {
+        "name": "terminal",
+        "aesthetic": "terminal/CRT/hacker",
+        "brief": "House template: a terminal session. Monospace green-on-black, each story printed as a log entry, with the lead story flagged at the top of the buffer.",
+        "notes": "$ cat today.log. The designer process didn't return in time, so here's the raw output.",
+        "css": """
+body { background: #0c100c; color: #b8f5b0; font-family: 'Courier New', Courier, monospace; }
+header h1 { margin: 0; font-size: 1.8rem; }
+header h1::before { content: '> '; }
+.story { border-left: 2px solid #3fae3f; padding-left: 0.9rem; }
+.story h2 { color: #e6ffe2; font-size: 1.05rem; }
+footer { border-top: 1px solid #3fae3f; }
+""",
+    },
+    {
+        "name": "field-notes",
+        "aesthetic": None,
+        "brief": "House template: a field notebook. Ruled paper, handwritten-feeling headings and margin numbers, as if the day's stories were jotted down in the field.",
+        "notes": "Notes from the field, taken the quick way. No grand design today, just a careful record of what happened.",
+        "css": """
+body { background: #fdfdf8 repeating-linear-gradient(#fdfdf8 0 1.5rem, #dce6f0 1.5rem calc(1.5rem + 1px)); color: #1f2a37; font-family: 'Trebuchet MS', Verdana, sans-serif; }
+header h1 { font-family: 'Brush Script MT', 'Segoe Script', cursive; font-size: clamp(2.2rem, 7vw, 3.8rem); margin: 0; color: #123a6b; }
+.stories { counter-reset: note; }
+.story { counter-increment: note; padding-left: 2.2rem; position: relative; }
+.story::before { content: counter(note); position: absolute; left: 0; top: 0; color: #b03a2e; font-weight: bold; }
+footer { border-top: 2px solid #b03a2e; }
+""",
+    },
+]
+
+
+def source_name(url: str) -> str:
+    """Readable source name from a URL (e.g. 'Reuters')."""
+    domain = url.replace("https://", "").replace("http://", "").split("/")[0]
+    return domain.replace("www.", "").split(".")[0].capitalize()
+
+
+def choose_layout(date: datetime, tired: list[str] | None = None) -> FallbackLayout:
+    """Rotate through layouts by date, skipping tired aesthetics."""
+    tired_set = set(tired or [])
+    fresh = [
+        layout for layout in LAYOUTS if layout["aesthetic"] not in tired_set
+    ] or LAYOUTS
+    return fresh[date.toordinal() % len(fresh)]
+
+
+def render_fallback_page(
+    articles: list[Article],
+    date: datetime | None = None,
+    tired: list[str] | None = None,
+) -> BuildResult:
+    """Render a complete, self-contained news.sys page without any API call."""
+    start_time = time.time()
+    date = date or datetime.now()
+    date_label = date.strftime("%B %d, %Y")
+    layout = choose_layout(date, tired)
+
+    items = []
+    for i, article in enumerate(articles):
+        css_class = "story lead" if i == 0 else "story"
+        items.append(
+            f"""<article class="{css_class}" data-slot="{i}">
+<h2><a data-field="headline url" href="{escape(article.source_url)}">{escape(article.title)}</a></h2>
+<p data-field="summary">{escape(article.summary)}</p>
+<p class="source" data-field="source">{escape(source_name(article.source_url))}</p>
+</article>"""
+        )
+    stories = "\n".join(items) or "<p>No stories could be gathered for this edition.</p>"
+
+    html = f"""<!DOCTYPE html>
+<!--
+DESIGN BRIEF:
+{layout["brief"]}
+-->
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>news.sys — {date_label}</title>
+<style>{BASE_CSS}{layout["css"]}</style>
+</head>
+<body class="layout-{layout["name"]}">
+<div class="wrap">
+<header>
+<h1>news.sys</h1>
+<p>{date_label}</p>
+</header>
+<main class="stories">
+{stories}
+</main>
+<footer>
+<p><strong>Designer's notes:</strong> {escape(layout["notes"])}</p>
+<p>News by Claude</p>
+</footer>
+</div>
+</body>
+</html>
+"""
+
+    return BuildResult(
+        html_content=html,
+        design_rationale=layout["brief"],
+        execution_time_seconds=time.time() - start_time,
+    )
@@ -0,0 +1,142 @@
+"""Companion editions rendered from the curated articles.
+
+Alongside the builder's page, each edition is published as a text-only
+HTML page (kept under LITE_MAX_BYTES for slow or metered connections), an
+Atom feed and a JSON Feed. All three are plain string rendering of the
+selected articles: no API call, a few milliseconds per edition.
+"""
+
+import json
+from datetime import datetime
+from html import escape
+from typing import Optional
+
+from src.models.article import Article
+from src.utils.dates import as_utc
+from src.utils.fallback_renderer import source_name
+
+# The text-only page stays under this size; summaries are dropped from the
+# bottom of the page up until it fits
+LITE_MAX_BYTES = 10 * 1024
+
+# Companion files, by name
+LITE_FILE = "lite.html"
+ATOM_FILE = "feed.xml"
+JSON_FEED_FILE = "feed.json"
+
+LITE_CSS = (
+    "body{max-width:40rem;margin:0 auto;padding:1rem;font:1rem/1.5 sans-serif}"
+    "li{margin-bottom:1rem}small{color:#555}"
+)
+
+
+def _lite_item(article: Article, with_summary: bool) -> str:
+    summary = f"<br>{escape(article.summary)}" if with_summary else ""
+    return (
+        f'<li><a href="{escape(article.source_url)}">{escape(article.title)}</a>'
+        f"{summary}<br><small>{escape(source_name(article.source_url))}</small></li>"
+    )
+
+
+def render_lite_page(articles: list[Article], date: datetime, site_url: str) -> str:
+    """A text-only edition page under LITE_MAX_BYTES."""
+    date_label = date.strftime("%B %d, %Y")
+    head = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>news.sys (text) — {date_label}</title>
+<link rel="alternate" type="application/atom+xml" href="{ATOM_FILE}">
+<link rel="alternate" type="application/feed+json" href="{JSON_FEED_FILE}">
+<style>{LITE_CSS}</style>
+</head>
+<body>
+<h1>news.sys</h1>
+<p>{date_label} · <a href="{escape(site_url)}">full edition</a></p>
+<ol>
+"""
+    tail = """</ol>
+<p>News by Claude</p>
+</body>
+</html>
+"""
+    # Keep as many summaries as fit, leading stories first
+    for with_summaries in range(len(articles), -1, -1):
+        items = "\n".join(
+            _lite_item(article, with_summary=i < with_summaries)
+            for i, article in enumerate(articles)
+        )
+        page = head + items + "\n" + tail
+        if len(page.encode("utf-8")) <= LITE_MAX_BYTES:
+            break
+    return page
+
+
+def _timestamp(article: Article, date: datetime) -> str:
+    """RFC 3339 time for an entry: its publication date, else the edition's."""
+    return as_utc(article.published_date or date).isoformat(timespec="seconds")
+
+
+def render_atom_feed(articles: list[Article], date: datetime, site_url: str) -> str:
+    """An Atom feed of the edition's stories."""
+    updated = as_utc(date).isoformat(timespec="seconds")
+    entries = "\n".join(
+        f"""<entry>
+<id>{escape(article.source_url)}</id>
+<title>{escape(article.title)}</title>
+<link href="{escape(article.source_url)}"/>
+<updated>{_timestamp(article, date)}</updated>
+<author><name>{escape(source_name(article.source_url))}</name></author>
+<summary>{escape(article.summary)}</summary>
+</entry>"""
+        for article in articles
+    )
+    return f"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+<id>{escape(site_url)}</id>
+<title>news.sys</title>
+<subtitle>News by Claude</subtitle>
+<link href="{escape(site_url)}"/>
+<link rel="self" href="{escape(site_url + ATOM_FILE)}"/>
+<updated>{updated}</updated>
+{entries}
+</feed>
+"""
+
+
+def render_json_feed(articles: list[Article], date: datetime, site_url: str) -> str:
+    """A JSON Feed (version 1.1) of the edition's stories."""
+    feed = {
+        "version": "https://jsonfeed.org/version/1.1",
+        "title": "news.sys",
+        "description": "News by Claude",
+        "home_page_url": site_url,
+        "feed_url": site_url + JSON_FEED_FILE,
+        "items": [
+            {
+                "id": article.source_url,
+                "url": article.source_url,
+                "title": article.title,
+                "content_text": article.summary,
+                "date_published": _timestamp(article, date),
+                "authors": [{"name": source_name(article.source_url)}],
+            }
+            for article in articles
+        ],
+    }
+    return json.dumps(feed, ensure_ascii=False, indent=1) + "\n"
+
+
+def render_companions(
+    articles: list[Article], site_url: str, date: Optional[datetime] = None
+) -> dict[str, str]:
+    """Render all companion editions in one pass: file name -> content."""
+    date = date or datetime.now().astimezone()
+    if not site_url.endswith("/"):
+        site_url += "/"
+    return {
+        LITE_FILE: render_lite_page(articles, date, site_url),
+        ATOM_FILE: render_atom_feed(articles, date, site_url),
+        JSON_FEED_FILE: render_json_feed(articles, date, site_url),
+    }
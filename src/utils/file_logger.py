@@ -1,21 +1,86 @@
-"""File logging utilities."""
+"""File logging utilities.
 
+Records are handed to a queue and written by a background listener thread,
+so logging never blocks the event loop. generation.log is size-capped and
+rotated, and large payloads (raw model responses) go to gzipped blobs that
+the log references by ID.
+"""
+
+import atexit
+import gzip
+import hashlib
 import logging
+import logging.handlers
+import queue
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
+
+# generation.log is rotated past this size, keeping this many old files
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+# Blobs directory, next to the log file
+BLOB_DIR_NAME = "log_blobs"
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class _BlobHandler(logging.Handler):
+    """Writes the payload of blob records to gzipped files (listener thread)."""
+
+    def __init__(self, blob_dir: Path):
+        super().__init__()
+        self.blob_dir = blob_dir
+
+    def emit(self, record: logging.LogRecord) -> None:
+        blob = getattr(record, "blob", None)
+        if blob is None:
+            return
+        blob_id, text = blob
+        try:
+            self.blob_dir.mkdir(parents=True, exist_ok=True)
+            with gzip.open(self.blob_dir / f"{blob_id}.txt.gz", "wt") as f:
+                f.write(text)
+        except Exception:
+            self.handleError(record)
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
 
+def setup_file_logger(
+    log_file: str = "generation.log", rotate: bool = True
+) -> logging.Logger:
+    """
+    Set up a non-blocking, rotating file logger for debugging.
+
+    With rotate=False the log is appended to instead of starting a fresh
+    file (for when another run is still writing it).
+    """
+    global _listener
 
-def setup_file_logger(log_file: str = "generation.log") -> logging.Logger:
-    """Set up a file logger for debugging."""
     # Create logger
     logger = logging.getLogger("news_generator")
     logger.setLevel(logging.DEBUG)
 
-    # Remove existing handlers
+    # Stop the listener (and close its files) from earlier runs in this process
+    _stop_listener()
     logger.handlers = []
 
-    # Create file handler
-    fh = logging.FileHandler(log_file, mode="w")
+    # Rotating file handler; each run starts a fresh file, older runs rotate
+    fh = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT
+    )
+    if rotate and fh.stream.tell() > 0:
+        fh.doRollover()
     fh.setLevel(logging.DEBUG)
 
     # Create formatter
@@ -25,11 +90,19 @@ def setup_file_logger(log_file: str = "generation.log") -> logging.Logger:
     )
     fh.setFormatter(formatter)
 
-    # Add handler
-    logger.addHandler(fh)
+    # The logger only enqueues; the listener thread does the writing
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    _listener = logging.handlers.QueueListener(
+        records,
+        fh,
+        _BlobHandler(Path(log_file).parent / BLOB_DIR_NAME),
+        respect_handler_level=True,
+    )
+    _listener.start()
 
     logger.info("=" * 80)
-    logger.info(f"News generation started at {datetime.now()}")
+    logger.info("News generation started at %s", datetime.now())
     logger.info("=" * 80)
 
     return logger
@@ -38,3 +111,34 @@ def setup_file_logger(log_file: str = "generation.log") -> logging.Logger:
 def get_logger() -> logging.Logger:
     """Get the file logger instance."""
     return logging.getLogger("news_generator")
+
+
+def log_blob(
+    text: str, msg: str, *args, level: int = logging.DEBUG
+) -> Optional[str]:
+    """
+    Log a large payload as a gzipped blob and return its ID.
+
+    msg and args describe the payload (%-style, like any log call); the log
+    line only carries that, the size and the blob ID, and the payload is
+    written to log_blobs/<id>.txt.gz by the listener thread. Nothing is
+    stored (and None is returned) when the level is disabled.
+    """
+    logger = get_logger()
+    if not logger.isEnabledFor(level):
+        return None
+
+    digest = hashlib.sha1(text.encode("utf-8", "replace")).hexdigest()[:10]
+    blob_id = f"{datetime.now():%Y%m%d-%H%M%S}-{digest}"
+    logger.log(
+        level,
+        msg + ": %d chars -> blob %s",
+        *args,
+        len(text),
+        blob_id,
+        extra={"blob": (blob_id, text)},
+    )
+    return blob_id
+
+
+atexit.register(_stop_listener)
@@ -0,0 +1,106 @@
+"""Hedged API requests to cut tail latency."""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable
+
+from src.models.article import HedgeStats
+from src.utils.file_logger import get_logger
+from src.utils.latency import LatencyTracker
+from src.utils.tracing import current_span
+
+# A hedge fires once a call outlives this percentile of its recent latencies
+HEDGE_PERCENTILE = 90
+
+# Never hedge earlier than this, however fast recent calls were
+HEDGE_MIN_DELAY_SECONDS = 10.0
+
+
+class HedgePolicy:
+    """
+    Issues a duplicate request when a call runs past its adaptive threshold
+    and takes whichever copy finishes first.
+
+    Latencies are always recorded (keyed by agent name) so the thresholds
+    stay warm; duplicates are only sent when enabled and while the per-run
+    hedge budget lasts.
+    """
+
+    def __init__(self, tracker: LatencyTracker, enabled: bool, max_hedges: int):
+        self.tracker = tracker
+        self.enabled = enabled
+        self.max_hedges = max_hedges
+        self.stats = HedgeStats()
+
+    def threshold(self, key: str) -> float | None:
+        """Seconds to wait before hedging a call, or None to never hedge."""
+        p90 = self.tracker.percentile(f"agent:{key}", HEDGE_PERCENTILE)
+        if p90 is None:
+            return None
+        return max(p90, HEDGE_MIN_DELAY_SECONDS)
+
+    async def run(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run an async API call, hedging if it's slow."""
+        start = time.monotonic()
+
+        primary = asyncio.ensure_future(call())
+        threshold = self.threshold(key) if self.enabled else None
+
+        try:
+            if threshold is None:
+                result = await primary
+            else:
+                result = await self._race(key, call, primary, threshold)
+        finally:
+            # Cancelled from outside (a stage timeout): abort the request too
+            primary.cancel()
+
+        self.tracker.observe(f"agent:{key}", time.monotonic() - start)
+        return result
+
+    async def _race(
+        self,
+        key: str,
+        call: Callable[[], Awaitable[Any]],
+        primary: asyncio.Future,
+        threshold: float,
+    ) -> Any:
+        """Wait for the primary; past the threshold, race it against a hedge."""
+        logger = get_logger()
+
+        done, _ = await asyncio.wait({primary}, timeout=threshold)
+        if done:
+            return primary.result()
+
+        if self.stats.issued >= self.max_hedges:
+            logger.info("%s - Hedge budget exhausted, waiting on primary", key)
+            return await primary
+
+        self.stats.issued += 1
+        current_span().set(attempts=2, hedge_after_seconds=round(threshold, 1))
+        logger.info("%s - No response after %.1fs, sending hedge", key, threshold)
+        hedge = asyncio.ensure_future(call())
+
+        pending = {primary, hedge}
+        error: BaseException | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    if future.exception() is not None:
+                        error = error or future.exception()
+                        continue
+
+                    if future is hedge:
+                        self.stats.won += 1
+                        current_span().set(hedge_won=True)
+                        logger.info("%s - Hedge won", key)
+                    return future.result()
+        finally:
+            # Cancelling the loser aborts its request (and stops its tokens)
+            hedge.cancel()
+            primary.cancel()
+
+        raise error
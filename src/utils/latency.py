@@ -0,0 +1,81 @@
+"""Persistent record of recently observed API latencies."""
+
+import json
+import math
+import time
+from collections import deque
+from pathlib import Path
+
+# Observations kept per key
+LATENCY_WINDOW = 50
+
+# Minimum observations before percentiles are trusted
+MIN_SAMPLES = 3
+
+# Observations older than this are forgotten. A model routed around for
+# being slow gets no new samples, so this is what lets it be tried again.
+LATENCY_MAX_AGE_SECONDS = 24 * 3600.0
+
+
+class LatencyTracker:
+    """Sliding window of observed latencies per key (stage/model, agent, ...)."""
+
+    def __init__(self, path: Path | None = None):
+        self.path = path
+        # (unix time observed, seconds) per key
+        self._samples: dict[str, deque[tuple[float, float]]] = {}
+
+        if path and path.exists():
+            try:
+                data = json.loads(path.read_text())
+                loaded_at = time.time()
+                for key, values in data.items():
+                    self._samples[key] = deque(
+                        (
+                            (value[0], value[1])
+                            if isinstance(value, list)
+                            # Saved before timestamps were kept: count as new
+                            else (loaded_at, float(value))
+                            for value in values
+                        ),
+                        maxlen=LATENCY_WINDOW,
+                    )
+            except (json.JSONDecodeError, ValueError, AttributeError, TypeError):
+                # If file is corrupted, start fresh
+                self._samples = {}
+
+    def observe(self, key: str, seconds: float, at: float | None = None) -> None:
+        """Record one observed latency (at a unix time; default now)."""
+        observed_at = time.time() if at is None else at
+        self._samples.setdefault(key, deque(maxlen=LATENCY_WINDOW)).append(
+            (observed_at, seconds)
+        )
+
+    def percentile(self, key: str, q: float) -> float | None:
+        """
+        Nearest-rank percentile (0-100) of recent latencies for a key.
+
+        Returns None until at least MIN_SAMPLES observations exist within
+        LATENCY_MAX_AGE_SECONDS.
+        """
+        cutoff = time.time() - LATENCY_MAX_AGE_SECONDS
+        samples = [s for t, s in self._samples.get(key, ()) if t >= cutoff]
+        if len(samples) < MIN_SAMPLES:
+            return None
+
+        ordered = sorted(samples)
+        rank = max(1, math.ceil(q / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def save(self) -> None:
+        """Persist the windows so the next run starts warm (expired ones dropped)."""
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        cutoff = time.time() - LATENCY_MAX_AGE_SECONDS
+        data = {
+            key: [[t, s] for t, s in values if t >= cutoff]
+            for key, values in self._samples.items()
+        }
+        data = {key: values for key, values in data.items() if values}
+        self.path.write_text(json.dumps(data, indent=2))
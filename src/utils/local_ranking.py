@@ -0,0 +1,146 @@
+"""Local article ranking: pre-curation scoring, and the fallback when the
+curator can't be reached in time."""
+
+import heapq
+from datetime import datetime, timedelta, timezone
+
+from src.models.article import Article, CredibilityTier
+from src.utils.dates import as_utc
+
+# How many articles a locally ranked edition carries
+LOCAL_EDITION_SIZE = 10
+
+# Pre-curation score: recency halves every this many hours...
+RECENCY_HALF_LIFE_HOURS = 24.0
+# ...and undated articles count as this recent (between one and two days old)
+UNDATED_RECENCY = 0.35
+
+TIER_SCORES = {
+    CredibilityTier.PRIMARY: 1.0,
+    CredibilityTier.MAJOR: 0.7,
+    CredibilityTier.ALTERNATIVE: 0.4,
+}
+
+# Each further article from the same source scores this much less again
+SOURCE_REPEAT_PENALTY = 0.6
+
+
+def _source(article: Article) -> str:
+    """Source domain of an article (www. stripped)."""
+    domain = article.source_url.lower().split("://", 1)[-1].split("/")[0]
+    return domain.removeprefix("www.")
+
+
+def _base_score(article: Article, now: datetime) -> float:
+    """Recency and credibility score in [0, 1], before source diversity."""
+    if article.published_date is None:
+        recency = UNDATED_RECENCY
+    else:
+        age_hours = (now - as_utc(article.published_date)).total_seconds() / 3600
+        recency = 0.5 ** (max(age_hours, 0.0) / RECENCY_HALF_LIFE_HOURS)
+    return 0.5 * recency + 0.5 * TIER_SCORES.get(article.credibility_tier, 0.4)
+
+
+def drop_stale(
+    articles: list[Article], max_age_hours: float | None, now: datetime | None = None
+) -> tuple[list[Article], int]:
+    """
+    Articles published within max_age_hours of now (undated ones stay; a
+    max_age_hours of 0 keeps everything).
+
+    Returns (fresh articles in their original order, number dropped).
+    """
+    if not max_age_hours:
+        return articles, 0
+    now = as_utc(now) if now else datetime.now(timezone.utc)
+    cutoff = now - timedelta(hours=max_age_hours)
+    fresh = [
+        article
+        for article in articles
+        if not article.published_date or as_utc(article.published_date) >= cutoff
+    ]
+    return fresh, len(articles) - len(fresh)
+
+
+def select_candidates(
+    articles: list[Article],
+    k: int,
+    max_age_hours: float | None = None,
+    now: datetime | None = None,
+) -> tuple[list[Article], int]:
+    """
+    Pre-rank articles locally and keep the top k for the curator.
+
+    Drops duplicate URLs and, with max_age_hours, anything published longer
+    ago than that (undated articles stay, but score low). The rest are scored
+    on recency and credibility tier, with each repeat of a source domain
+    penalised so no single outlet dominates the shortlist.
+
+    Returns (candidates best first, number of stale articles dropped).
+    """
+    now = as_utc(now) if now else datetime.now(timezone.utc)
+
+    seen_urls: set[str] = set()
+    unique = []
+    for article in articles:
+        url = article.source_url.rstrip("/")
+        if url not in seen_urls:
+            seen_urls.add(url)
+            unique.append(article)
+    fresh, stale = drop_stale(unique, max_age_hours, now)
+
+    # Greedy pick with a lazily updated heap: an entry scored against an
+    # outdated source count is re-scored and pushed back instead of taken
+    heap = [(-_base_score(a, now), 0, i) for i, a in enumerate(fresh)]
+    heapq.heapify(heap)
+    per_source: dict[str, int] = {}
+    candidates = []
+    while heap and len(candidates) < k:
+        neg_score, repeats, i = heapq.heappop(heap)
+        article = fresh[i]
+        source = _source(article)
+        seen = per_source.get(source, 0)
+        if seen != repeats:
+            penalised = -_base_score(article, now) * SOURCE_REPEAT_PENALTY**seen
+            heapq.heappush(heap, (penalised, seen, i))
+            continue
+        per_source[source] = seen + 1
+        candidates.append(article)
+
+    return candidates, stale
+
+
+def rank_articles_locally(
+    articles: list[Article], k: int = LOCAL_EDITION_SIZE
+) -> list[Article]:
+    """
+    Pick and order up to k articles without calling the API.
+
+    Prefers more credible, more recent stories, drops duplicate URLs, and
+    alternates between gathering agents so one agent can't fill the page.
+    """
+    seen_urls: set[str] = set()
+    unique = []
+    for article in articles:
+        url = article.source_url.rstrip("/")
+        if url not in seen_urls:
+            seen_urls.add(url)
+            unique.append(article)
+
+    def sort_key(article: Article):
+        published = article.published_date or datetime.min
+        return (article.credibility_tier.value, -published.toordinal())
+
+    # Per-agent queues, best first
+    queues: dict[str, list[Article]] = {}
+    for article in sorted(unique, key=sort_key):
+        queues.setdefault(article.gathered_by_agent, []).append(article)
+
+    # Round-robin across agents
+    ranked = []
+    while len(ranked) < k and any(queues.values()):
+        for queue in queues.values():
+            if queue and len(ranked) < k:
+                ranked.append(queue.pop(0))
+
+    return ranked
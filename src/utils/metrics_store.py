@@ -0,0 +1,244 @@
+"""Local warehouse of per-run metrics, with percentile and trend queries.
+
+Every run appends its metrics (stage latencies, tokens, searches, article
+counts, curator keep rate, page size) to a SQLite file in the state
+directory, one row per metric, so history outlives the CI log artifacts and
+can be queried:
+
+    SELECT started_at, value FROM metrics JOIN runs USING (run_id)
+    WHERE name = 'stage.build.seconds' ORDER BY started_at;
+
+Runs are grouped by mode (full, refresh, delta) since their costs differ,
+and each run is compared against a rolling baseline of earlier runs in the
+same mode to flag regressions.
+"""
+
+import math
+import sqlite3
+import statistics
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, TypedDict
+
+from src.models.article import PipelineState
+from src.utils.tracing import Span
+
+# Earlier runs (same mode) the latest run is compared against
+BASELINE_WINDOW = 20
+
+# Fewer earlier runs than this and nothing is flagged
+MIN_BASELINE_RUNS = 5
+
+# A metric this many times worse than its baseline median, and worse than
+# every run in the baseline, is a regression
+REGRESSION_RATIO = 1.5
+
+# Latency changes smaller than this are noise, whatever the ratio
+MIN_LATENCY_CHANGE_SECONDS = 1.0
+
+# Metrics where a drop is the regression (everything else: a rise)
+LOWER_IS_WORSE = {"articles.gathered", "articles.selected", "curator.keep_rate"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    edition_date TEXT NOT NULL,
+    mode TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id TEXT NOT NULL REFERENCES runs (run_id),
+    name TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (run_id, name)
+);
+CREATE INDEX IF NOT EXISTS metrics_by_name ON metrics (name);
+"""
+
+
+class MetricSummary(TypedDict):
+    """Recent distribution of one metric, and how the latest run compares."""
+
+    name: str
+    runs: int
+    p50: float
+    p95: float
+    latest: float
+    baseline: Optional[float]  # Median of the earlier runs in the window
+    change: Optional[float]  # latest / baseline
+    regressed: bool
+
+
+class DailyTrend(TypedDict):
+    """One day's distribution of a metric."""
+
+    date: str
+    runs: int
+    p50: float
+    p95: float
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile (0-100) of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _stage_of(s: Span, by_id: dict[str, Span]) -> Optional[str]:
+    """Name of the stage span (stage.gather, ...) a span ran under."""
+    while s is not None:
+        if s.name.startswith("stage."):
+            return s.name.removeprefix("stage.")
+        s = by_id.get(s.parent_id) if s.parent_id else None
+    return None
+
+
+def collect_run_metrics(
+    spans: list[Span], state: PipelineState, html: str
+) -> dict[str, float]:
+    """A finished run's metrics, from its trace spans and pipeline state."""
+    metrics: dict[str, float] = {}
+    by_id = {s.span_id: s for s in spans}
+
+    for s in spans:
+        seconds = (s.end_ns - s.start_ns) / 1e9
+        if s.name == "run":
+            metrics["run.seconds"] = seconds
+        elif s.name.startswith("stage."):
+            metrics[f"{s.name}.seconds"] = seconds
+        elif s.name == "precurate" and "candidates" in s.attributes:
+            metrics["curator.candidates"] = s.attributes["candidates"]
+        elif s.name.startswith("api.") and (stage := _stage_of(s, by_id)):
+            for key in ("calls", "input_tokens", "output_tokens"):
+                name = f"stage.{stage}.{key}"
+                value = 1 if key == "calls" else s.attributes.get(key, 0)
+                metrics[name] = metrics.get(name, 0) + value
+
+    metrics["searches"] = sum(result.search_count for result in state.agent_results)
+    metrics["articles.gathered"] = state.total_articles_gathered
+    metrics["articles.selected"] = len(state.selected_articles)
+    curation = state.curation_result
+    if curation and curation.success and metrics.get("curator.candidates"):
+        metrics["curator.keep_rate"] = (
+            len(curation.selected_uuids) / metrics["curator.candidates"]
+        )
+    metrics["html.bytes"] = len(html.encode("utf-8"))
+    metrics["degradations"] = len(state.degradations)
+    return metrics
+
+
+class MetricsStore:
+    """Per-run metrics in a SQLite file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def record(
+        self,
+        run_id: str,
+        started_at: datetime,
+        edition_date: str,
+        mode: str,
+        metrics: dict[str, float],
+    ) -> None:
+        """Append one run's metrics."""
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?)",
+                (run_id, started_at.isoformat(), edition_date, mode),
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO metrics VALUES (?, ?, ?)",
+                [(run_id, name, float(value)) for name, value in metrics.items()],
+            )
+        connection.close()
+
+    def _query(self, sql: str, params: tuple = ()) -> list[tuple]:
+        if not self.path.exists():
+            return []
+        connection = self._connect()
+        try:
+            return connection.execute(sql, params).fetchall()
+        finally:
+            connection.close()
+
+    def modes(self) -> list[str]:
+        """Run modes with recorded runs."""
+        rows = self._query("SELECT DISTINCT mode FROM runs ORDER BY mode")
+        return [mode for (mode,) in rows]
+
+    def series(
+        self, name: str, mode: str, last: Optional[int] = None
+    ) -> list[tuple[str, float]]:
+        """(started_at, value) for a metric, oldest first; the last N runs if given."""
+        rows = self._query(
+            "SELECT started_at, value FROM metrics JOIN runs USING (run_id) "
+            "WHERE name = ? AND mode = ? ORDER BY started_at DESC LIMIT ?",
+            (name, mode, last if last is not None else -1),
+        )
+        return rows[::-1]
+
+    def summarize(
+        self, mode: str, window: int = BASELINE_WINDOW
+    ) -> list[MetricSummary]:
+        """Each metric's recent percentiles, and the latest run against its baseline."""
+        names = self._query(
+            "SELECT DISTINCT name FROM metrics JOIN runs USING (run_id) "
+            "WHERE mode = ? ORDER BY name",
+            (mode,),
+        )
+        summaries = []
+        for (name,) in names:
+            values = [value for _, value in self.series(name, mode, last=window + 1)]
+            latest, earlier = values[-1], values[:-1]
+
+            baseline = change = None
+            regressed = False
+            if len(earlier) >= MIN_BASELINE_RUNS:
+                baseline = statistics.median(earlier)
+                if baseline > 0:
+                    change = latest / baseline
+                    if name in LOWER_IS_WORSE:
+                        regressed = (
+                            change <= 1 / REGRESSION_RATIO and latest < min(earlier)
+                        )
+                    else:
+                        regressed = change >= REGRESSION_RATIO and latest > max(earlier)
+                    if name.endswith(".seconds"):
+                        regressed &= latest - baseline >= MIN_LATENCY_CHANGE_SECONDS
+
+            summaries.append(
+                {
+                    "name": name,
+                    "runs": len(values),
+                    "p50": percentile(values, 50),
+                    "p95": percentile(values, 95),
+                    "latest": latest,
+                    "baseline": baseline,
+                    "change": change,
+                    "regressed": regressed,
+                }
+            )
+        return summaries
+
+    def daily_trend(self, name: str, mode: str, days: int = 30) -> list[DailyTrend]:
+        """A metric's per-day percentiles over the most recent days with runs."""
+        by_day: dict[str, list[float]] = {}
+        for started_at, value in self.series(name, mode):
+            by_day.setdefault(started_at[:10], []).append(value)
+        return [
+            {
+                "date": day,
+                "runs": len(values),
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+            }
+            for day, values in sorted(by_day.items())[-days:]
+        ]
@@ -0,0 +1,90 @@
+"""Latency-aware model routing for agent API calls."""
+
+from src.models.article import RoutingDecision
+from src.utils.file_logger import get_logger
+from src.utils.latency import LatencyTracker
+
+# Percentile of observed latency compared against the stage deadline
+ROUTING_PERCENTILE = 95
+
+
+def latency_key(stage: str, model: str) -> str:
+    """
+    Tracker key for a model's latency in one stage. A stage's calls differ
+    in size and tools (web search vs a single completion), so a model's
+    latency in one stage says little about another.
+    """
+    return f"{stage}/{model}"
+
+
+class ModelRouter:
+    """
+    Picks a model for each call from the configured model, its fallbacks,
+    and the stage's latency budget.
+
+    The configured model is preferred; a fallback is used only when the
+    preferred model's recent p95 latency would blow the stage deadline.
+    A model routed around gets no new samples, so it's tried again once its
+    old ones expire (LATENCY_MAX_AGE_SECONDS). Every decision is kept for
+    the run metrics.
+    """
+
+    def __init__(
+        self,
+        tracker: LatencyTracker,
+        fallbacks: dict[str, list[str]],
+        deadlines: dict[str, float],
+    ):
+        self.tracker = tracker
+        self.fallbacks = fallbacks
+        self.deadlines = deadlines
+        self.decisions: list[RoutingDecision] = []
+
+    def choose(self, stage: str, preferred: str) -> str:
+        """Choose the model for one call in a stage."""
+        candidates = [preferred] + [
+            m for m in self.fallbacks.get(stage, []) if m != preferred
+        ]
+        deadline = self.deadlines.get(stage)
+
+        chosen = None
+        reason = ""
+        observed: list[tuple[float, str]] = []
+
+        for model in candidates:
+            p95 = self.tracker.percentile(latency_key(stage, model), ROUTING_PERCENTILE)
+            if p95 is None:
+                chosen, reason = model, "no latency history"
+                break
+            if deadline is None or p95 <= deadline:
+                chosen, reason = model, f"p95 {p95:.1f}s within budget"
+                break
+            observed.append((p95, model))
+
+        if chosen is None:
+            # Everything is over budget: take the fastest
+            p95, chosen = min(observed)
+            reason = f"all models over budget, fastest p95 {p95:.1f}s"
+        elif chosen != preferred:
+            slow_p95 = observed[0][0]
+            reason = f"{preferred} p95 {slow_p95:.1f}s > {deadline:.0f}s budget; {reason}"
+
+        decision = RoutingDecision(
+            stage=stage,
+            preferred_model=preferred,
+            chosen_model=chosen,
+            reason=reason,
+            deadline_seconds=deadline,
+        )
+        self.decisions.append(decision)
+        get_logger().info("Routing [%s] -> %s (%s)", stage, chosen, reason)
+
+        return chosen
+
+    def observe(self, stage: str, model: str, seconds: float) -> None:
+        """Record the latency of a completed call in a stage."""
+        self.tracker.observe(latency_key(stage, model), seconds)
+
+    def save(self) -> None:
+        """Persist observed latencies for the next run."""
+        self.tracker.save()
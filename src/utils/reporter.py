@@ -0,0 +1,199 @@
+"""Progress reporting: Rich for terminals, JSON lines for CI and services.
+
+The pipeline reports through a Reporter rather than a console: notes,
+warnings, stage start/end, per-agent results, progress and final metrics.
+RichReporter renders them for a person at a terminal (spinners, bars,
+colour); JsonReporter writes one compact JSON event per line, with no
+rendering at all, for GitHub Actions logs and the long-running service.
+"""
+
+import json
+import re
+import sys
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, TextIO, Union
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from src.models.article import AgentResult
+
+# Rich markup tags, e.g. [dim], [/dim], [bold cyan]; stripped from JSON text
+_MARKUP_TAG = re.compile(r"\[/?[a-z][a-z _.#-]*\]")
+
+OUTPUT_MODES = ("auto", "rich", "json")
+
+
+def strip_markup(text: str) -> str:
+    """Plain text of a Rich markup string."""
+    return _MARKUP_TAG.sub("", text).strip()
+
+
+def _label(key: str) -> str:
+    """Human label for a summary field, e.g. failed_agents -> Failed agents."""
+    return key.replace("_", " ").capitalize()
+
+
+class RichReporter:
+    """Renders progress on a Rich console (interactive use)."""
+
+    def __init__(self, console: "Console"):
+        self.console = console
+
+    def print(self, markup: str) -> None:
+        """A note, in Rich markup."""
+        self.console.print(markup)
+
+    def warn(self, text: str) -> None:
+        self.console.print(f"[warning]{text}[/warning]")
+
+    def error(self, text: str) -> None:
+        self.console.print(f"[error]{text}[/error]")
+
+    def stage_start(self, stage: str, heading: str) -> None:
+        """A stage (or batch) begins; heading is e.g. "Stage 1: Gathering News"."""
+        self.console.print(f"\n[bold cyan]{heading}[/bold cyan]")
+
+    def stage_end(
+        self, stage: str, heading: str, error: Optional[str] = None, **summary: Any
+    ) -> None:
+        """A stage finished; heading is e.g. "Stage 1"."""
+        if error is not None:
+            self.console.print(f"\n[red]{heading} Failed: {error}[/red]")
+            return
+        self.console.print(f"\n[bold]{heading} Complete[/bold]")
+        for key, value in summary.items():
+            if key == "seconds":
+                self.console.print(f"  Time: {value:.1f}s")
+            else:
+                self.console.print(f"  {_label(key)}: {value}")
+
+    def agent_result(self, result: "AgentResult") -> None:
+        """One gatherer's outcome."""
+        if result.success:
+            self.console.print(
+                f"  [success]✓[/success] {result.agent_name}: {len(result)} articles "
+                f"({result.search_count} searches, {result.execution_time_seconds:.1f}s)"
+            )
+        else:
+            self.console.print(
+                f"  [error]✗[/error] {result.agent_name}: {result.error_message}"
+            )
+
+    @contextmanager
+    def progress(
+        self, description: str, total: Optional[int] = None
+    ) -> Iterator[Callable[[], None]]:
+        """
+        Show a spinner (and a bar when total is known) while the block runs.
+
+        Yields a callable that advances the bar by one.
+        """
+        from rich.progress import (
+            BarColumn,
+            Progress,
+            SpinnerColumn,
+            TaskProgressColumn,
+            TextColumn,
+        )
+
+        columns = [SpinnerColumn(), TextColumn("[progress.description]{task.description}")]
+        if total is not None:
+            columns += [BarColumn(), TaskProgressColumn()]
+        with Progress(*columns, console=self.console) as bar:
+            task = bar.add_task(f"[cyan]{description}", total=total)
+            yield lambda: bar.update(task, advance=1)
+
+    def metrics(self, metrics: dict[str, Any]) -> None:
+        """Final run metrics."""
+        from src.utils.logging import log_metrics
+
+        log_metrics(self.console, metrics)
+
+
+class JsonReporter:
+    """
+    Writes progress as JSON lines (CI and service use).
+
+    Every event carries its name and the seconds since the reporter was
+    created, e.g. {"event": "stage_end", "t": 41.2, "stage": "gather", ...}.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream or sys.stderr
+        self._started = time.monotonic()
+
+    def event(self, name: str, **fields: Any) -> None:
+        """Write one event line."""
+        line = {"event": name, "t": round(time.monotonic() - self._started, 3)}
+        for key, value in fields.items():
+            line[key] = round(value, 3) if isinstance(value, float) else value
+        self.stream.write(json.dumps(line, default=str, separators=(",", ":")) + "\n")
+        self.stream.flush()
+
+    def print(self, markup: str) -> None:
+        self.event("log", level="info", text=strip_markup(markup))
+
+    def warn(self, text: str) -> None:
+        self.event("log", level="warning", text=strip_markup(text))
+
+    def error(self, text: str) -> None:
+        self.event("log", level="error", text=strip_markup(text))
+
+    def stage_start(self, stage: str, heading: str) -> None:
+        self.event("stage_start", stage=stage)
+
+    def stage_end(
+        self, stage: str, heading: str, error: Optional[str] = None, **summary: Any
+    ) -> None:
+        self.event("stage_end", stage=stage, success=error is None, error=error, **summary)
+
+    def agent_result(self, result: "AgentResult") -> None:
+        self.event(
+            "agent_result",
+            agent=result.agent_name,
+            success=result.success,
+            articles=len(result),
+            searches=result.search_count,
+            seconds=result.execution_time_seconds,
+            error=result.error_message,
+        )
+
+    @contextmanager
+    def progress(
+        self, description: str, total: Optional[int] = None
+    ) -> Iterator[Callable[[], None]]:
+        """Report each advance as a progress event (nothing to animate)."""
+        done = 0
+
+        def advance() -> None:
+            nonlocal done
+            done += 1
+            self.event("progress", task=description, done=done, total=total)
+
+        yield advance
+
+    def metrics(self, metrics: dict[str, Any]) -> None:
+        self.event("metrics", metrics=metrics)
+
+
+Reporter = Union[RichReporter, JsonReporter]
+
+
+def create_reporter(mode: str = "auto") -> Reporter:
+    """
+    Create the reporter for an output mode: "rich", "json", or "auto" (Rich
+    when stderr is a terminal, JSON lines otherwise, e.g. in GitHub Actions).
+    """
+    if mode not in OUTPUT_MODES:
+        raise ValueError(f"Unknown output mode {mode!r} (expected one of {OUTPUT_MODES})")
+    if mode == "auto":
+        mode = "rich" if sys.stderr.isatty() else "json"
+
+    if mode == "json":
+        return JsonReporter()
+
+    from src.utils.logging import create_console
+
+    return RichReporter(create_console())
@@ -0,0 +1,123 @@
+"""Lock file that keeps overlapping runs from racing on shared state.
+
+Two runs at once (say, a manual run while the scheduled one is going) would
+both write design memory, the article pool and the published edition, and
+pay for the same API calls twice. The lock is a file created exclusively in
+the state directory, holding who took it and when. A lock whose owner
+process is gone, or that's older than the stale timeout (a hung run), is
+broken so the next run can proceed.
+"""
+
+import json
+import os
+import socket
+import time
+from pathlib import Path
+from typing import Optional, TypedDict
+
+from src.utils.file_logger import get_logger
+
+# Seconds between checks while waiting for another run's lock
+LOCK_POLL_SECONDS = 2.0
+
+
+class LockInfo(TypedDict):
+    """Who holds the run lock."""
+
+    pid: int
+    host: str
+    edition_id: str  # Edition the run is producing (or "backfill <dates>")
+    acquired_at: float  # Unix time
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, owned by another user
+    return True
+
+
+class RunLock:
+    """An exclusive lock file with a stale timeout."""
+
+    def __init__(self, path: Path, stale_after_seconds: float):
+        self.path = path
+        self.stale_after_seconds = stale_after_seconds
+        self._held: Optional[LockInfo] = None
+
+    def holder(self) -> Optional[LockInfo]:
+        """The current lock's owner, if the lock exists and is readable."""
+        try:
+            info = json.loads(self.path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError, ValueError):
+            return None
+        if isinstance(info, dict) and LockInfo.__annotations__.keys() <= info.keys():
+            return info
+        return None
+
+    def is_stale(self, info: LockInfo) -> bool:
+        """Whether a lock's owner has died or overrun the stale timeout."""
+        if time.time() - info["acquired_at"] > self.stale_after_seconds:
+            return True
+        return info["host"] == socket.gethostname() and not _process_alive(info["pid"])
+
+    def try_acquire(self, edition_id: str) -> bool:
+        """Take the lock if it's free (or stale); False if another run has it."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            holder = self.holder()
+            if holder is not None and self.is_stale(holder):
+                self._break(holder)
+                return self.try_acquire(edition_id)
+            # Unreadable: being written right now, or left empty by a crash
+            if holder is None and self._file_age() > self.stale_after_seconds:
+                self._break(None)
+                return self.try_acquire(edition_id)
+            return False
+
+        info: LockInfo = {
+            "pid": os.getpid(),
+            "host": socket.gethostname(),
+            "edition_id": edition_id,
+            "acquired_at": time.time(),
+        }
+        with os.fdopen(fd, "w") as f:
+            json.dump(info, f)
+        self._held = info
+        return True
+
+    def _file_age(self) -> float:
+        try:
+            return time.time() - self.path.stat().st_mtime
+        except FileNotFoundError:
+            return 0.0
+
+    def _break(self, stale: Optional[LockInfo]) -> None:
+        """Remove a stale lock, unless another run has just replaced it."""
+        get_logger().warning("Breaking stale run lock: %s", stale)
+        aside = self.path.with_name(f"{self.path.name}.{os.getpid()}.stale")
+        try:
+            os.replace(self.path, aside)
+        except FileNotFoundError:
+            return  # Someone else broke it first
+        try:
+            taken = json.loads(aside.read_text())
+        except (json.JSONDecodeError, ValueError):
+            taken = None
+        if taken != stale:
+            # Another run broke it and took a fresh lock first: put theirs back
+            if not self.path.exists():
+                os.replace(aside, self.path)
+                return
+        aside.unlink(missing_ok=True)
+
+    def release(self) -> None:
+        """Release the lock if this run holds it."""
+        if self._held is not None and self.holder() == self._held:
+            self.path.unlink(missing_ok=True)
+        self._held = None
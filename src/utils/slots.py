@@ -0,0 +1,199 @@
+"""Slot-based page shells for LLM-free content refreshes.
+
+The builder marks each article's markup with data-slot / data-field
+attributes. compile_shell() turns a finished page into a shell: the static
+HTML with those article fields cut out as placeholders. fill_shell() then
+refills the shell from a new article list in a single pass, no API call.
+"""
+
+import re
+from html import escape
+from html.parser import HTMLParser
+from typing import TypedDict
+
+from src.models.article import Article
+
+# Fields the builder can mark inside a slot
+SLOT_FIELDS = ("headline", "summary", "source", "url")
+
+# Elements that never have a closing tag
+VOID_ELEMENTS = frozenset(
+    "area base br col embed hr img input link meta source track wbr".split()
+)
+
+HREF_RE = re.compile(r"""\bhref\s*=\s*("[^"]*"|'[^']*'|[^\s>]+)""", re.IGNORECASE)
+
+
+class Shell(TypedDict):
+    """A compiled page shell.
+
+    parts alternates static HTML strings and placeholders:
+    ["slot_start", n], ["slot_end", n], ["text", n, field], ["href", n].
+    """
+
+    slot_count: int
+    parts: list
+
+
+class _SlotScanner(HTMLParser):
+    """Finds slot elements and the field elements inside them."""
+
+    def __init__(self, html: str):
+        super().__init__(convert_charrefs=False)
+        self.html = html
+        # HTMLParser reports (line, col); lines are split on "\n" only
+        self._line_offsets = [0] + [m.end() for m in re.finditer("\n", html)]
+
+        # (offset, length, placeholder) replacements, in document order
+        self.cuts: list[tuple[int, int, list]] = []
+        self.slots: set[int] = set()
+
+        # Open elements: (tag, slot opened here, fields opened here, text start)
+        self._stack: list[tuple[str, int | None, list[str], int]] = []
+        self._slot: int | None = None
+        self._in_field = False
+
+    def _offset(self) -> int:
+        line, col = self.getpos()
+        return self._line_offsets[line - 1] + col
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        start = self._offset()
+        tag_text = self.get_starttag_text() or ""
+        end = start + len(tag_text)
+
+        opened_slot = None
+        fields: list[str] = []
+
+        slot = attrs.get("data-slot")
+        if slot is not None and slot.isdigit() and self._slot is None:
+            opened_slot = int(slot)
+            self._slot = opened_slot
+            self.slots.add(opened_slot)
+            self.cuts.append((start, 0, ["slot_start", opened_slot]))
+
+        if self._slot is not None and not self._in_field:
+            requested = (attrs.get("data-field") or "").split()
+            fields = [f for f in requested if f in SLOT_FIELDS]
+
+            if "url" in fields:
+                match = HREF_RE.search(tag_text)
+                if match:
+                    value_start = start + match.start(1)
+                    self.cuts.append(
+                        (value_start, len(match.group(1)), ["href", self._slot])
+                    )
+                fields.remove("url")
+            fields = fields[:1]  # One text field per element
+            self._in_field = bool(fields)
+
+        if tag in VOID_ELEMENTS:
+            if opened_slot is not None:
+                self._close_slot(end)
+            return
+
+        self._stack.append((tag, opened_slot, fields, end))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS and self._stack and self._stack[-1][0] == tag:
+            self._pop(self._offset() + len(self.get_starttag_text() or ""), 0)
+
+    def handle_endtag(self, tag):
+        start = self._offset()
+        close = self.html.find(">", start)
+        end = close + 1 if close != -1 else len(self.html)
+
+        # Tolerate unclosed elements: pop until the matching tag
+        if not any(entry[0] == tag for entry in self._stack):
+            return
+        while self._stack:
+            if self._stack[-1][0] == tag:
+                self._pop(start, end - start)
+                break
+            self._pop(start, 0)
+
+    def _pop(self, start: int, length: int):
+        _, opened_slot, fields, text_start = self._stack.pop()
+        if fields:
+            self.cuts.append(
+                (text_start, start - text_start, ["text", self._slot, fields[0]])
+            )
+            self._in_field = False
+        if opened_slot is not None:
+            self._close_slot(start + length)
+
+    def _close_slot(self, end: int):
+        self.cuts.append((end, 0, ["slot_end", self._slot]))
+        self._slot = None
+
+
+def compile_shell(html: str) -> Shell | None:
+    """
+    Compile a finished page into a refillable shell.
+
+    Returns None when the page has no slot markup (nothing to refill).
+    """
+    scanner = _SlotScanner(html)
+    scanner.feed(html)
+    scanner.close()
+
+    if not scanner.slots:
+        return None
+
+    parts: list = []
+    position = 0
+    for offset, length, placeholder in sorted(scanner.cuts, key=lambda c: c[0]):
+        if offset < position:
+            continue  # Overlapping markup - keep the original text
+        parts.append(html[position:offset])
+        parts.append(placeholder)
+        position = offset + length
+    parts.append(html[position:])
+
+    return {"slot_count": max(scanner.slots) + 1, "parts": parts}
+
+
+def _field_value(article: Article, field: str) -> str:
+    """Plain-text value of a slot field for an article."""
+    if field == "headline":
+        return article.title
+    if field == "summary":
+        return article.summary
+    if field == "source":
+        domain = article.source_url.split("//")[-1].split("/")[0]
+        return domain.replace("www.", "").split(".")[0].capitalize()
+    return article.source_url
+
+
+def fill_shell(shell: Shell, articles: list[Article]) -> str:
+    """
+    Refill a shell's slots with a new article list.
+
+    Slot N gets articles[N]; slots without an article are dropped entirely.
+    """
+    out: list[str] = []
+    skipping: int | None = None
+
+    for part in shell["parts"]:
+        if isinstance(part, str):
+            if skipping is None:
+                out.append(part)
+            continue
+
+        kind, slot = part[0], part[1]
+        if kind == "slot_start":
+            if slot >= len(articles):
+                skipping = slot
+        elif kind == "slot_end":
+            if skipping == slot:
+                skipping = None
+        elif skipping is None and slot < len(articles):
+            article = articles[slot]
+            if kind == "href":
+                out.append(f'"{escape(article.source_url)}"')
+            else:
+                out.append(escape(_field_value(article, part[2]), quote=False))
+
+    return "".join(out)
@@ -0,0 +1,48 @@
+"""Cold-start import timing (via python -X importtime)."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+# Project root, so measurements import the same modules the CLI does
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Modules whose cold import cost we track
+STARTUP_MODULES = [
+    "generate_news",
+    "src.orchestrator",
+    "anthropic",
+    "rich",
+    "typer",
+]
+
+# Budget for importing the CLI entry point itself
+STARTUP_BUDGET_MS = 150.0
+
+
+def measure_import_time(module: str) -> float | None:
+    """
+    Import a module in a fresh interpreter and return its cumulative import
+    time in milliseconds, or None if the import failed.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        return None
+
+    # Lines look like: "import time:   self [us] | cumulative | imported package"
+    for line in reversed(proc.stderr.splitlines()):
+        parts = line.removeprefix("import time:").split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1000.0
+
+    return None
+
+
+def startup_report() -> dict[str, float | None]:
+    """Measure cold import time for each tracked module."""
+    return {module: measure_import_time(module) for module in STARTUP_MODULES}
@@ -0,0 +1,168 @@
+"""Local prompt token estimates, and fitting article prompts to a budget.
+
+Estimates count word runs and punctuation marks (no tokenizer download, a
+regex pass per prompt) and scale them by a tokens-per-piece ratio that is
+calibrated per stage against the input_tokens the API reports, so the
+estimate tracks each stage's mix of prose, UUIDs, URLs and markup.
+"""
+
+import json
+import math
+import re
+from pathlib import Path
+from typing import Callable, Optional, TypedDict
+
+from src.models.article import Article
+from src.utils.file_logger import get_logger
+
+# Word runs and single punctuation marks; each is roughly one token
+_PIECE = re.compile(r"\w+|[^\w\s]")
+
+# Tokens per piece before any calibration
+DEFAULT_TOKENS_PER_PIECE = 1.3
+
+# Weight of each new observation in the calibrated ratio and error
+CALIBRATION_ALPHA = 0.3
+
+# Tokens every request carries on top of the prompt (role, framing)
+REQUEST_OVERHEAD_TOKENS = 8
+
+# Over budget, summaries are first cut to about this many characters
+TRIMMED_SUMMARY_CHARS = 200
+
+
+class Calibration(TypedDict):
+    """A stage's calibrated estimate."""
+
+    tokens_per_piece: float
+    samples: int
+    mean_abs_error: float  # Recent relative error of the estimates
+
+
+class TokenEstimator:
+    """Estimates prompt tokens per stage, learning from reported usage."""
+
+    def __init__(self, path: Path | None = None):
+        self.path = path
+        self._calibrations: dict[str, Calibration] = {}
+
+        if path and path.exists():
+            try:
+                self._calibrations = json.loads(path.read_text())
+            except (json.JSONDecodeError, ValueError):
+                # If file is corrupted, start fresh
+                self._calibrations = {}
+
+    def _ratio(self, stage: str) -> float:
+        calibration = self._calibrations.get(stage)
+        return calibration["tokens_per_piece"] if calibration else DEFAULT_TOKENS_PER_PIECE
+
+    def estimate(self, text: str, stage: str) -> int:
+        """Estimated input tokens for a prompt in a stage."""
+        pieces = len(_PIECE.findall(text))
+        return math.ceil(pieces * self._ratio(stage)) + REQUEST_OVERHEAD_TOKENS
+
+    def observe(self, stage: str, text: str, actual_tokens: int) -> float:
+        """
+        Calibrate against a call's reported input tokens.
+
+        Logs the estimate against the actual count and returns the relative
+        error of the estimate (before this observation is folded in).
+        """
+        estimate = self.estimate(text, stage)
+        error = (estimate - actual_tokens) / max(actual_tokens, 1)
+
+        pieces = len(_PIECE.findall(text))
+        observed_ratio = max(actual_tokens - REQUEST_OVERHEAD_TOKENS, 1) / max(pieces, 1)
+        calibration = self._calibrations.get(stage)
+        if calibration is None:
+            calibration = {
+                "tokens_per_piece": observed_ratio,
+                "samples": 0,
+                "mean_abs_error": abs(error),
+            }
+        else:
+            a = CALIBRATION_ALPHA
+            calibration["tokens_per_piece"] = (
+                (1 - a) * calibration["tokens_per_piece"] + a * observed_ratio
+            )
+            calibration["mean_abs_error"] = (
+                (1 - a) * calibration["mean_abs_error"] + a * abs(error)
+            )
+        calibration["samples"] += 1
+        self._calibrations[stage] = calibration
+
+        get_logger().info(
+            "Token estimate (%s): %d estimated, %d actual (%+.1f%%, recent mean %.1f%%)",
+            stage,
+            estimate,
+            actual_tokens,
+            error * 100,
+            calibration["mean_abs_error"] * 100,
+        )
+        return error
+
+    def save(self) -> None:
+        """Persist the calibrations so the next run starts calibrated."""
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self._calibrations, indent=2))
+
+
+def trim_summary(summary: str, max_chars: int) -> str:
+    """Cut a summary to about max_chars, at a sentence end where possible."""
+    if len(summary) <= max_chars:
+        return summary
+    cut = summary[:max_chars]
+    sentence_end = cut.rfind(". ")
+    if sentence_end > max_chars // 2:
+        return cut[: sentence_end + 1]
+    return cut.rsplit(" ", 1)[0] + "…"
+
+
+def fit_to_budget(
+    render: Callable[[list[Article], Optional[int]], str],
+    articles: list[Article],
+    budget: int,
+    estimate: Callable[[str], int],
+    min_articles: int = 1,
+) -> tuple[str, list[Article], list[str]]:
+    """
+    Render a prompt over articles within an input token budget.
+
+    render(articles, summary_chars) builds the prompt (summary_chars None for
+    full summaries). Over budget, summaries are trimmed first, then articles
+    are dropped from the end (lowest ranked), down to min_articles.
+
+    Returns (prompt, articles kept, descriptions of what was cut).
+    """
+    prompt = render(articles, None)
+    tokens = estimate(prompt)
+    if tokens <= budget:
+        return prompt, articles, []
+
+    actions = []
+    prompt = render(articles, TRIMMED_SUMMARY_CHARS)
+    trimmed = estimate(prompt)
+    if trimmed < tokens:
+        actions.append(
+            f"trimmed summaries to {TRIMMED_SUMMARY_CHARS} chars "
+            f"({tokens} -> {trimmed} tokens)"
+        )
+    tokens = trimmed
+
+    kept = articles
+    while tokens > budget and len(kept) > min_articles:
+        # Drop in proportion to the overrun, at least one article per pass
+        keep = min(len(kept) - 1, math.floor(len(kept) * budget / tokens))
+        kept = kept[: max(keep, min_articles)]
+        prompt = render(kept, TRIMMED_SUMMARY_CHARS)
+        tokens = estimate(prompt)
+    if len(kept) < len(articles):
+        actions.append(
+            f"dropped the last {len(articles) - len(kept)} of {len(articles)} "
+            f"articles ({tokens} tokens)"
+        )
+
+    return prompt, kept, actions
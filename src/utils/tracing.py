@@ -0,0 +1,248 @@
+"""Lightweight span tracing for the pipeline.
+
+Spans nest through a context variable (run -> stage -> agent -> API call ->
+parse), so any code can open one with `with span("name", key=value):`
+without a tracer being passed around; with no active tracer it's a no-op.
+Finished traces export to Chrome trace-event JSON (chrome://tracing,
+Perfetto) and, optionally, OTLP/HTTP JSON for a local collector.
+"""
+
+import asyncio
+import functools
+import json
+import secrets
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+_tracer: ContextVar[Optional["Tracer"]] = ContextVar("tracer", default=None)
+_current: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+@dataclass
+class Span:
+    """One timed operation."""
+
+    name: str
+    span_id: str
+    parent_id: Optional[str]
+    track: int  # Timeline lane: one per concurrently running task
+    start_ns: int
+    end_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    task: Optional[int] = None
+
+    def set(self, **attributes: Any) -> None:
+        """Add or update attributes (tokens, model, counts, ...)."""
+        self.attributes.update(attributes)
+
+
+class _NoopSpan(Span):
+    """Stands in for a span when tracing is off; attributes are dropped."""
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan(name="", span_id="", parent_id=None, track=0, start_ns=0)
+
+
+class Tracer:
+    """Collects the spans of one run."""
+
+    def __init__(self):
+        self.trace_id = secrets.token_hex(16)
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+        self._tracks = 1  # Lane 1 is the run itself
+        # Offset from the monotonic clock to wall time, for OTLP timestamps
+        self._epoch_offset_ns = time.time_ns() - time.perf_counter_ns()
+
+    @contextmanager
+    def activate(self) -> Iterator["Tracer"]:
+        """Make this the tracer that span() records into."""
+        token = _tracer.set(self)
+        try:
+            yield self
+        finally:
+            _tracer.reset(token)
+
+    def _new_track(self) -> int:
+        with self._lock:
+            self._tracks += 1
+            return self._tracks
+
+    def _finish(self, finished: Span) -> None:
+        with self._lock:
+            self.spans.append(finished)
+
+    def to_chrome_trace(self) -> dict:
+        """Chrome trace-event JSON (complete events, microseconds)."""
+        origin = min((s.start_ns for s in self.spans), default=0)
+        events = [
+            {
+                "name": s.name,
+                "cat": s.name.split(".")[0],
+                "ph": "X",
+                "ts": (s.start_ns - origin) / 1000,
+                "dur": (s.end_ns - s.start_ns) / 1000,
+                "pid": 1,
+                "tid": s.track,
+                "args": s.attributes,
+            }
+            for s in sorted(self.spans, key=lambda s: s.start_ns)
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write the Chrome trace to a file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_chrome_trace(), default=str))
+
+    def to_otlp(self, service_name: str = "news.sys") -> dict:
+        """OTLP/HTTP JSON export request body."""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [_otlp_attribute("service.name", service_name)]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "news.sys"},
+                            "spans": [self._otlp_span(s) for s in self.spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def _otlp_span(self, s: Span) -> dict:
+        otlp = {
+            "traceId": self.trace_id,
+            "spanId": s.span_id,
+            "name": s.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(s.start_ns + self._epoch_offset_ns),
+            "endTimeUnixNano": str(s.end_ns + self._epoch_offset_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in s.attributes.items()],
+        }
+        if s.parent_id:
+            otlp["parentSpanId"] = s.parent_id
+        if "error" in s.attributes:
+            otlp["status"] = {"code": 2, "message": str(s.attributes["error"])}
+        return otlp
+
+    def export_otlp(self, endpoint: str, timeout: float = 5.0) -> None:
+        """POST the trace to an OTLP/HTTP collector (e.g. http://localhost:4318)."""
+        request = urllib.request.Request(
+            endpoint.rstrip("/") + "/v1/traces",
+            data=json.dumps(self.to_otlp()).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=timeout):
+            pass
+
+
+def _otlp_attribute(key: str, value: Any) -> dict:
+    """An OTLP key/value attribute."""
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+def _current_task_id() -> Optional[int]:
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        return None
+    return id(task) if task else None
+
+
+def current_span() -> Span:
+    """The innermost open span (a no-op stand-in when tracing is off)."""
+    return _current.get() or _NOOP_SPAN
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """
+    Time a block as a span under the current one.
+
+    Yields the span, to add attributes as they become known (a no-op
+    stand-in when no tracer is active). An escaping exception is recorded as
+    an "error" attribute and re-raised.
+    """
+    tracer = _tracer.get()
+    if tracer is None:
+        yield _NOOP_SPAN
+        return
+
+    parent = _current.get()
+    task = _current_task_id()
+    if parent is None:
+        track = 1
+    elif parent.task != task:
+        # A concurrently running task gets its own timeline lane
+        track = tracer._new_track()
+    else:
+        track = parent.track
+
+    current = Span(
+        name=name,
+        span_id=secrets.token_hex(8),
+        parent_id=parent.span_id if parent else None,
+        track=track,
+        start_ns=time.perf_counter_ns(),
+        attributes=attributes,
+        task=task,
+    )
+    token = _current.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.set(error=f"{type(e).__name__}: {e}")
+        raise
+    finally:
+        current.end_ns = time.perf_counter_ns()
+        _current.reset(token)
+        tracer._finish(current)
+
+
+def traced(name: str) -> Callable:
+    """
+    Decorator: run each call of a (sync or async) method in a span.
+
+    The name may refer to the instance, e.g. "agent.{self.name}".
+    """
+
+    def decorate(fn: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(self, *args, **kwargs):
+                with span(name.format(self=self)):
+                    return await fn(self, *args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            with span(name.format(self=self)):
+                return fn(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorate
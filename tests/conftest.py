@@ -0,0 +1,118 @@
+"""Fixtures shared across the tests."""
+
+import json
+import re
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+import src.utils.design_index as design_index
+import src.utils.design_memory as design_memory
+
+
+@pytest.fixture
+def sandbox(tmp_path, monkeypatch):
+    """A scratch directory to run from, with design memory pointed into it."""
+    monkeypatch.chdir(tmp_path)
+    history = tmp_path / "design_history.json"
+    monkeypatch.setattr(design_memory, "MEMORY_FILE", tmp_path / "design_memory.json")
+    monkeypatch.setattr(design_memory, "HISTORY_FILE", history)
+    monkeypatch.setattr(design_index, "HISTORY_FILE", history)
+    return tmp_path
+
+
+def _message(text: str, searches: int = 0) -> SimpleNamespace:
+    """A messages API response with one text block."""
+    return SimpleNamespace(
+        content=[SimpleNamespace(type="text", text=text)],
+        stop_reason="end_turn",
+        usage=SimpleNamespace(
+            input_tokens=100,
+            output_tokens=50,
+            server_tool_use=SimpleNamespace(web_search_requests=searches),
+        ),
+    )
+
+
+class _FakeStream:
+    """messages.stream() context: the whole page as one chunk."""
+
+    def __init__(self, html: str):
+        self.html = html
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    @property
+    async def text_stream(self):
+        yield self.html
+
+    async def get_final_message(self):
+        return _message(self.html)
+
+
+class FakeMessages:
+    """
+    Answers each agent's prompt like the API would, without a network.
+
+    Gatherers return stories_per_call fresh stories on every call (headlines
+    carry the call number), the curator keeps the first six candidates, and the builder
+    streams a page with a slot per story. Calls are counted per agent.
+    """
+
+    def __init__(self):
+        self.calls: dict[str, int] = {}
+        self.stories_per_call = 4
+        # Gatherers whose stories are dated a week ago
+        self.stale_agents: set[str] = set()
+
+    def _count(self, agent: str) -> int:
+        self.calls[agent] = self.calls.get(agent, 0) + 1
+        return self.calls[agent]
+
+    async def create(self, **kwargs):
+        prompt = kwargs["messages"][0]["content"]
+        if "senior news editor" in prompt:
+            self._count("curator")
+            uuids = re.findall(r"UUID: (\S+)", prompt)[:6]
+            return _message(json.dumps({"selected_uuids": uuids, "reasoning": "ok"}))
+
+        agent = "mainstream" if "MAINSTREAM news gathering" in prompt else "deep_cuts"
+        call = self._count(agent)
+        age = timedelta(days=7 if agent in self.stale_agents else 0)
+        published = date.today() - age
+        articles = [
+            {
+                "title": f"{agent} story {i} (call {call})",
+                "summary": f"Summary of {agent} story {i}.",
+                "source_url": f"https://www.{agent.replace('_', '')}{i}.com/{call}",
+                "credibility_tier": 2,
+                "published_date": published.isoformat(),
+            }
+            for i in range(self.stories_per_call)
+        ]
+        return _message(json.dumps({"articles": articles}), searches=1)
+
+    def stream(self, **kwargs):
+        self._count("builder")
+        slots = "".join(
+            f'<article data-slot="{n}"><h2><a data-field="headline url" '
+            f'href="#">Headline</a></h2><p data-field="summary">Summary</p>'
+            f'<span data-field="source">Source</span></article>'
+            for n in range(8)
+        )
+        return _FakeStream(
+            "<!DOCTYPE html><html><head><title>news.sys</title></head>"
+            "<!-- DESIGN BRIEF: Fake brief. --><body><h1>news.sys</h1>"
+            f"{slots}<footer>News by Claude</footer></body></html>"
+        )
+
+
+@pytest.fixture
+def fake_client() -> SimpleNamespace:
+    """A stand-in for AsyncAnthropic; its messages.calls counts calls."""
+    return SimpleNamespace(messages=FakeMessages())
@@ -0,0 +1,31 @@
+"""Design memory checks (see src/utils/design_memory.py, design_index.py)."""
+
+from src.models.article import Article
+from src.utils.design_brief import fallback_design_brief
+from src.utils.design_index import DesignIndex
+from src.utils.design_memory import detect_tired_aesthetics
+
+HEADLINES = [
+    Article(
+        title="Government issues urgent crisis warning",
+        summary="Officials cite new intelligence.",
+        source_url="https://news.example.com/warning",
+    )
+]
+
+
+def test_fallback_briefs_mark_no_aesthetics_tired():
+    brief = fallback_design_brief("Today's news", HEADLINES)
+
+    assert detect_tired_aesthetics([{"date": "2026-10-17", "brief": brief}]) == []
+
+
+def test_fallback_briefs_stay_out_of_the_similarity_index():
+    index = DesignIndex(
+        [
+            {"date": "2026-10-16", "brief": "Swiss grid, red accents, bold sans type"},
+            {"date": "2026-10-17", "brief": fallback_design_brief(None, HEADLINES)},
+        ]
+    )
+
+    assert [d["date"] for d in index.designs] == ["2026-10-16"]
@@ -0,0 +1,32 @@
+"""Extra editions built from the day's curation (see src/utils/edition_specs.py)."""
+
+import asyncio
+import io
+import json
+
+from src.config import Config
+from src.orchestrator import NewsOrchestrator
+from src.utils.design_memory import get_today_date
+from src.utils.reporter import JsonReporter
+
+
+def test_edition_top_ups_skip_stale_stories(sandbox, fake_client):
+    editions_file = sandbox / "editions.json"
+    editions_file.write_text(json.dumps([{"name": "wide", "min_articles": 12}]))
+    config = Config(
+        anthropic_api_key="test",
+        state_dir=sandbox / "state",
+        editions_file=editions_file,
+    )
+    fake_client.messages.stale_agents = {"deep_cuts"}
+
+    orchestrator = NewsOrchestrator(
+        config, JsonReporter(io.StringIO()), client=fake_client
+    )
+    asyncio.run(orchestrator.run())
+
+    edition = sandbox / "state" / "editions" / get_today_date() / "wide"
+    # The feed lists the edition's stories
+    feed = (edition / "feed.json").read_text()
+    assert "mainstream story" in feed
+    assert "deep_cuts story" not in feed
@@ -0,0 +1,42 @@
+"""Latency-aware model routing (see src/utils/model_router.py)."""
+
+import time
+
+from src.utils.latency import LATENCY_MAX_AGE_SECONDS, LatencyTracker
+from src.utils.model_router import ModelRouter, latency_key
+
+
+def router(tracker: LatencyTracker) -> ModelRouter:
+    return ModelRouter(
+        tracker=tracker,
+        fallbacks={"curate": ["fast-model"]},
+        deadlines={"curate": 60.0},
+    )
+
+
+def test_slow_preferred_model_is_routed_around():
+    tracker = LatencyTracker()
+    for _ in range(5):
+        tracker.observe(latency_key("curate", "big-model"), 400.0)
+
+    assert router(tracker).choose("curate", "big-model") == "fast-model"
+
+
+def test_preferred_model_is_tried_again_once_its_samples_expire(tmp_path):
+    path = tmp_path / "latency.json"
+    tracker = LatencyTracker(path)
+    long_ago = time.time() - LATENCY_MAX_AGE_SECONDS - 60
+    for _ in range(5):
+        tracker.observe(latency_key("curate", "big-model"), 400.0, at=long_ago)
+    tracker.save()
+
+    assert router(LatencyTracker(path)).choose("curate", "big-model") == "big-model"
+
+
+def test_latency_file_from_before_timestamps_still_loads(tmp_path):
+    path = tmp_path / "latency.json"
+    path.write_text('{"curate/big-model": [400.0, 400.0, 400.0]}')
+
+    tracker = LatencyTracker(path)
+
+    assert tracker.percentile("curate/big-model", 95) == 400.0
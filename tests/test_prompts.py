@@ -0,0 +1,47 @@
+"""Rendered agent prompts (see src/prompts/)."""
+
+import pytest
+
+from src.agents.gatherer import GathererAgent
+from src.models.article import AgentType
+from src.prompts.builder_prompt import BUILDER_PROMPT
+from src.prompts.curator_prompt import CURATOR_PROMPT
+from src.prompts.gatherer_prompts import (
+    DEEP_CUTS_PROMPT,
+    MAINSTREAM_PROMPT,
+    get_gatherer_prompt,
+)
+
+
+@pytest.mark.parametrize("agent_type", [AgentType.MAINSTREAM, AgentType.DEEP_CUTS])
+@pytest.mark.parametrize("searches", [1, 3])
+def test_gatherer_prompt_states_its_search_allocation(agent_type, searches):
+    gatherer = GathererAgent(
+        client=None,
+        agent_type=agent_type,
+        prompt_template=get_gatherer_prompt(agent_type),
+        max_searches=searches,
+    )
+
+    prompt = gatherer.render_prompt()
+
+    assert f"budget: {searches} (the most web searches you may run)" in prompt
+    assert "ONE comprehensive search" not in prompt
+    assert "UP TO 5" not in prompt
+    assert gatherer._tools()[0]["max_uses"] == searches
+
+
+@pytest.mark.parametrize(
+    "template",
+    [BUILDER_PROMPT, CURATOR_PROMPT, MAINSTREAM_PROMPT, DEEP_CUTS_PROMPT],
+)
+def test_instructions_form_a_static_prefix(template):
+    rendered = [
+        template.render(**{field: f"<{field} {day}>" for field in template.fields})
+        for day in ("2026-10-01", "2026-10-02")
+    ]
+
+    prefix = template.static_prefix
+    assert all(prompt.startswith(prefix) for prompt in rendered)
+    assert "2026-10" not in prefix
+    assert len(prefix) > 0.8 * min(len(prompt) for prompt in rendered)
@@ -0,0 +1,49 @@
+"""Refreshing today's edition from its design shell (see src/utils/slots.py)."""
+
+import asyncio
+import io
+from pathlib import Path
+
+from src.config import Config
+from src.orchestrator import NewsOrchestrator
+from src.utils.design_memory import get_today_date
+from src.utils.edition_store import EditionStore
+from src.utils.reporter import JsonReporter
+
+
+def run(sandbox: Path, client, **options) -> tuple[NewsOrchestrator, str]:
+    config = Config(anthropic_api_key="test", state_dir=sandbox / "state")
+    orchestrator = NewsOrchestrator(config, JsonReporter(io.StringIO()), client=client)
+    html = asyncio.run(orchestrator.run(**options))
+    return orchestrator, html
+
+
+def test_repeated_refreshes_reuse_the_days_design(sandbox, fake_client):
+    run(sandbox, fake_client)
+    store = EditionStore(sandbox / "state" / "editions")
+    assert store.load_shell(get_today_date()) is not None
+
+    for _ in range(2):
+        orchestrator, html = run(sandbox, fake_client, refresh=True)
+
+        assert orchestrator.state.refreshed_from_shell
+        assert store.load_shell(get_today_date()) is not None
+        for article in orchestrator.state.selected_articles:
+            assert article.title in html
+
+    # Only the first run called the builder
+    assert fake_client.messages.calls["builder"] == 1
+
+
+def test_delta_recurates_once_new_stories_add_up(sandbox, fake_client):
+    run(sandbox, fake_client)
+    assert fake_client.messages.calls["curator"] == 1
+
+    # Two new stories a run, against a threshold of three
+    fake_client.messages.stories_per_call = 1
+    run(sandbox, fake_client, delta=True)
+    assert fake_client.messages.calls["curator"] == 1
+
+    orchestrator, _ = run(sandbox, fake_client, delta=True)
+    assert fake_client.messages.calls["curator"] == 2
+    assert orchestrator.state.refreshed_from_shell
@@ -0,0 +1,67 @@
+"""Replaying a recorded run offline (see src/utils/cassette.py)."""
+
+import asyncio
+import io
+from pathlib import Path
+
+from src.config import Config
+from src.orchestrator import NewsOrchestrator
+from src.utils.reporter import JsonReporter
+
+# A small full run: two gatherers, the curator and a streamed build
+CASSETTE = Path(__file__).parent / "fixtures" / "replay_run.jsonl.gz"
+
+EXPECTED_HTML = (
+    "<!DOCTYPE html><html><head><title>news.sys</title></head>"
+    "<!-- DESIGN BRIEF: Fixture brief. --><body><h1>news.sys</h1>"
+    "<p>Storm reaches the coast</p><footer>News by Claude</footer></body></html>"
+)
+
+# The curator's picks, in its display order
+EXPECTED_TITLES = [
+    "Storm reaches the coast",
+    "Parliament passes budget",
+    "Deep-sea vent ecosystem mapped",
+    "Markets rally on rate cut",
+    "Open-source satellite launched",
+    "Village revives lost dialect",
+]
+
+
+def replay(sandbox: Path) -> tuple[NewsOrchestrator, str]:
+    config = Config(
+        anthropic_api_key="",
+        state_dir=sandbox / "state",
+        feeds_dir=sandbox / "feeds",
+        replay_cassette=CASSETTE,
+        replay_speed=0,
+    )
+    orchestrator = NewsOrchestrator(config, JsonReporter(io.StringIO()))
+    html = asyncio.run(orchestrator.run())
+    return orchestrator, html
+
+
+def test_replay_reproduces_the_recorded_edition(sandbox):
+    orchestrator, html = replay(sandbox)
+
+    assert html == EXPECTED_HTML
+    titles = [article.title for article in orchestrator.state.selected_articles]
+    assert titles == EXPECTED_TITLES
+    assert orchestrator.state.total_articles_gathered == 11
+    assert orchestrator.state.degradations == []
+
+
+def test_replay_is_repeatable(sandbox):
+    _, first = replay(sandbox)
+    _, second = replay(sandbox)
+
+    assert first == second == EXPECTED_HTML
+
+
+def test_replay_leaves_no_state_behind(sandbox):
+    replay(sandbox)
+
+    assert not (sandbox / "state").exists()
+    assert not (sandbox / "feeds").exists()
+    assert not (sandbox / "design_memory.json").exists()
+    assert not (sandbox / "design_history.json").exists()
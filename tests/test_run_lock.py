@@ -0,0 +1,24 @@
+"""Runs sharing the state directory (see src/utils/run_lock.py)."""
+
+import io
+
+from src.config import Config
+from src.orchestrator import NewsOrchestrator
+from src.utils.reporter import JsonReporter
+from src.utils.run_lock import RunLock
+
+
+def test_dry_run_leaves_a_live_runs_log_in_place(sandbox):
+    config = Config(anthropic_api_key="", state_dir=sandbox / "state")
+    live_run = RunLock(sandbox / "state" / "run.lock", stale_after_seconds=60)
+    assert live_run.try_acquire("2026-10-18")
+    (sandbox / "generation.log").write_text("live run\n")
+
+    orchestrator = NewsOrchestrator(config, JsonReporter(io.StringIO()), dry_run=True)
+    try:
+        orchestrator.render_prompts()
+    finally:
+        live_run.release()
+
+    assert not (sandbox / "generation.log.1").exists()
+    assert (sandbox / "generation.log").read_text().startswith("live run\n")
@@ -0,0 +1,89 @@
+"""Compiling pages into slot shells and refilling them (see src/utils/slots.py)."""
+
+from src.models.article import Article
+from src.utils.slots import compile_shell, fill_shell
+
+PAGE = """<!DOCTYPE html>
+<html><head><title>news.sys</title></head>
+<body>
+<h1>news.sys</h1>
+<main>
+  <article class="lead" data-slot="0">
+    <h2><a data-field="headline url" href="https://old.example.com/0">
+      Old <em>lead</em></a></h2>
+    <div class="body">
+      <p data-field="summary">Old summary with <b>nested</b> markup.</p>
+    </div>
+    <span class="via" data-field="source">Old</span>
+  </article>
+  <article data-slot="1">
+    <h3 data-field="headline">Old second</h3>
+    <a data-field="url" href='https://old.example.com/1'>Read more</a>
+  </article>
+  <article data-slot="2">
+    <h3 data-field="headline">Old third</h3>
+  </article>
+</main>
+<footer>News by Claude</footer>
+</body></html>
+"""
+
+
+def article(n: int, title: str = "") -> Article:
+    return Article(
+        title=title or f"Story {n}",
+        summary=f"Summary {n}.",
+        source_url=f"https://www.outlet{n}.com/story",
+    )
+
+
+def test_page_without_slots_has_no_shell():
+    assert compile_shell("<html><body><p>Static</p></body></html>") is None
+
+
+def test_fill_replaces_fields_and_keeps_the_design():
+    shell = compile_shell(PAGE)
+    assert shell is not None and shell["slot_count"] == 3
+
+    html = fill_shell(shell, [article(0), article(1), article(2)])
+
+    # Nested markup inside a field is replaced whole
+    assert (
+        '<a data-field="headline url" href="https://www.outlet0.com/story">'
+        "Story 0</a>" in html
+    )
+    assert '<p data-field="summary">Summary 0.</p>' in html
+    assert '<span class="via" data-field="source">Outlet0</span>' in html
+    assert (
+        '<a data-field="url" href="https://www.outlet1.com/story">Read more</a>'
+        in html
+    )
+    assert '<h3 data-field="headline">Story 2</h3>' in html
+    assert "Old" not in html
+    # Everything outside the fields is untouched
+    assert html.startswith("<!DOCTYPE html>\n<html><head><title>news.sys</title>")
+    assert '<article class="lead" data-slot="0">' in html
+    assert html.endswith("<footer>News by Claude</footer>\n</body></html>\n")
+
+
+def test_unused_slots_are_dropped():
+    html = fill_shell(compile_shell(PAGE), [article(0), article(1)])
+
+    assert 'data-slot="2"' not in html
+    assert "Old third" not in html
+    assert "Story 1" in html
+    assert "</main>" in html
+
+
+def test_filled_text_is_escaped():
+    html = fill_shell(compile_shell(PAGE), [article(0, "Cats & <dogs>")])
+
+    assert "Cats &amp; &lt;dogs&gt;</a>" in html
+
+
+def test_refilling_a_filled_page_matches_filling_the_shell():
+    shell = compile_shell(PAGE)
+    first = fill_shell(shell, [article(0), article(1), article(2)])
+
+    # A refreshed page compiles to the same shell, so refreshes can repeat
+    assert compile_shell(first) == shell
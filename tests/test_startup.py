@@ -0,0 +1,40 @@
+"""Cold-start cost of the CLI entry point (see src/utils/startup.py)."""
+
+import subprocess
+import sys
+
+from src.utils.startup import PROJECT_ROOT, STARTUP_BUDGET_MS, measure_import_time
+
+# Cold imports timed; the fastest is compared, so one slow run isn't a failure
+ATTEMPTS = 3
+
+# Heavy dependencies the entry point must leave until a command needs them
+DEFERRED_MODULES = ("anthropic", "rich")
+
+
+def test_entry_point_imports_within_budget():
+    timings = [measure_import_time("generate_news") for _ in range(ATTEMPTS)]
+    assert None not in timings, "generate_news failed to import"
+    assert min(timings) <= STARTUP_BUDGET_MS, (
+        f"Importing generate_news took {min(timings):.0f} ms "
+        f"(budget {STARTUP_BUDGET_MS:.0f} ms)"
+    )
+
+
+def test_entry_point_defers_heavy_imports():
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, generate_news; "
+            "print(' '.join(sorted({m.split('.')[0] for m in sys.modules})))",
+        ],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    loaded = set(proc.stdout.split())
+    assert not loaded & set(DEFERRED_MODULES), (
+        f"Importing generate_news loaded {sorted(loaded & set(DEFERRED_MODULES))}"
+    )